@@ -2,13 +2,57 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 ##
+import importlib
 import logging
+from typing import TYPE_CHECKING
+
 from .version import __version__
 
-from .job.job import *
-from .workspace import *
+if TYPE_CHECKING:
+    from .job.job import Job
+    from .workspace import Workspace
+    from ._client.models._quantum_client_enums import JobStatus
+
+# Public attributes of the package and the modules that define them. They
+# are imported on first use (see __getattr__), so that importing
+# azure.quantum does not load the generated client, azure-storage-blob
+# or protobuf.
+_LAZY_ATTRIBUTES = {
+    "Job": "azure.quantum.job.job",
+    "Workspace": "azure.quantum.workspace",
+    "JobStatus": "azure.quantum._client.models._quantum_client_enums",
+}
 
-from ._client.models._quantum_client_enums import JobStatus
+# Subpackages and modules that are imported on first attribute access,
+# e.g. azure.quantum.optimization.Problem after `import azure.quantum`
+_LAZY_SUBMODULES = (
+    "aio",
+    "instrumentation",
+    "job",
+    "optimization",
+    "serialization",
+    "storage",
+    "target",
+    "translation",
+    "workspace",
+)
+
+__all__ = ["__version__", *_LAZY_ATTRIBUTES]
 
 logger = logging.getLogger(__name__)
 logger.info(f"version: {__version__}")
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+        # Cache the attribute so that __getattr__ is only called once
+        globals()[name] = value
+        return value
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | set(_LAZY_SUBMODULES))
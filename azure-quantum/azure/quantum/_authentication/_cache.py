@@ -0,0 +1,195 @@
+##
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+##
+import contextlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+from azure.core.credentials import AccessToken
+
+try:
+    from typing import TYPE_CHECKING
+except ImportError:
+    TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    # pylint:disable=unused-import,ungrouped-imports
+    from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+_TOKEN_CACHE_ENV_VARIABLE = "AZURE_QUANTUM_TOKEN_CACHE"
+
+# Tokens are refreshed this many seconds before they expire
+_REFRESH_MARGIN_SECONDS = 300
+
+_CACHE_VERSION = 2
+
+
+@contextlib.contextmanager
+def _file_lock(path):
+    # type: (str) -> Iterator[None]
+    """Holds an exclusive lock on the given lock file, across processes."""
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        if os.name == "nt":
+            import msvcrt
+            while True:
+                try:
+                    msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # LK_LOCK gives up after 10 attempts, keep waiting
+                    continue
+            try:
+                yield
+            finally:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def _cache_key(scopes, tenant_id=None, subscription_id=None, identity=None):
+    # type: (Iterable[str], Optional[str], Optional[str], Optional[str]) -> str
+    return "|".join([tenant_id or "", subscription_id or "", identity or "", " ".join(sorted(scopes))])
+
+
+class _PersistentTokenCache(object):
+    """
+    Cache of access tokens keyed by scopes, tenant and identity, kept in memory and,
+    when a path is given, in a JSON file shared by all the processes of the
+    user. The file is only readable by its owner, and is read and written
+    under an exclusive file lock.
+
+    Cached tokens are only returned until ``_REFRESH_MARGIN_SECONDS`` before
+    they expire, so that they get refreshed proactively; ``get_stale`` still
+    returns them until they actually expire, as a fallback when refreshing
+    fails. The cache also remembers which credential acquired each token.
+    """
+
+    def __init__(self, path=None):
+        # type: (Optional[str]) -> None
+        self.path = path
+        self._tokens = {}  # type: Dict[str, Tuple[AccessToken, Optional[str]]]
+        self._lock = threading.Lock()
+        if path is not None:
+            directory = os.path.dirname(os.path.abspath(path))
+            if not os.path.isdir(directory):
+                os.makedirs(directory, mode=0o700, exist_ok=True)
+
+    @classmethod
+    def from_env(cls):
+        # type: () -> _PersistentTokenCache
+        """Creates a cache persisted to the file set in the
+        AZURE_QUANTUM_TOKEN_CACHE environment variable, if any."""
+        return cls(os.environ.get(_TOKEN_CACHE_ENV_VARIABLE) or None)
+
+    def get(self, key):
+        # type: (str) -> Optional[AccessToken]
+        """Returns a token that is not about to expire, or None."""
+        token = self.get_stale(key)
+        if token is not None and token.expires_on - _REFRESH_MARGIN_SECONDS > time.time():
+            return token
+        return None
+
+    def get_stale(self, key):
+        # type: (str) -> Optional[AccessToken]
+        """Returns a token that has not expired yet, even if it is about to, or None."""
+        entry = self._get_entry(key)
+        if entry is not None and entry[0].expires_on > time.time():
+            return entry[0]
+        return None
+
+    def get_credential_name(self, key):
+        # type: (str) -> Optional[str]
+        """Returns the name of the credential that last acquired a token for the key."""
+        entry = self._get_entry(key)
+        return entry[1] if entry is not None else None
+
+    def put(self, key, token, credential_name=None):
+        # type: (str, AccessToken, Optional[str]) -> None
+        """Caches a token, persisting it if the cache has a path."""
+        with self._lock:
+            self._tokens[key] = (token, credential_name)
+        if self.path is None:
+            return
+        try:
+            with _file_lock(self.path + ".lock"):
+                data = self._read()
+                data["tokens"][key] = {
+                    "access_token": token.token,
+                    "expires_on": token.expires_on,
+                    "credential": credential_name,
+                }
+                now = time.time()
+                data["tokens"] = {
+                    k: v for k, v in data["tokens"].items() if v["expires_on"] > now
+                }
+                self._write(data)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            _LOGGER.info("Could not persist the token cache at %s: %s", self.path, e)
+
+    def _get_entry(self, key):
+        # type: (str) -> Optional[Tuple[AccessToken, Optional[str]]]
+        with self._lock:
+            entry = self._tokens.get(key)
+        if entry is not None and entry[0].expires_on - _REFRESH_MARGIN_SECONDS > time.time():
+            return entry
+        if self.path is None:
+            return entry
+
+        # Another process may have refreshed the token
+        try:
+            with _file_lock(self.path + ".lock"):
+                stored = self._read()["tokens"].get(key)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            _LOGGER.info("Could not read the token cache at %s: %s", self.path, e)
+            return entry
+        if stored is None:
+            return entry
+
+        entry = (AccessToken(stored["access_token"], int(stored["expires_on"])), stored.get("credential"))
+        with self._lock:
+            self._tokens[key] = entry
+        return entry
+
+    def _read(self):
+        # type: () -> dict
+        try:
+            with open(self.path, "r") as file:
+                data = json.load(file)
+        except FileNotFoundError:
+            data = None
+        except ValueError:
+            _LOGGER.info("Ignoring invalid token cache at %s", self.path)
+            data = None
+        if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION:
+            data = {"version": _CACHE_VERSION, "tokens": {}}
+        return data
+
+    def _write(self, data):
+        # type: (dict) -> None
+        directory = os.path.dirname(os.path.abspath(self.path))
+        # mkstemp creates the file readable and writable by its owner only
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".token_cache")
+        try:
+            with os.fdopen(fd, "w") as file:
+                json.dump(data, file)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
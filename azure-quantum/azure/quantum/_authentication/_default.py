@@ -22,6 +22,7 @@ from azure.identity import (
 )
 from ._chained import _ChainedTokenCredential
 from ._token import _TokenFileCredential
+from ._cache import _PersistentTokenCache, _cache_key
 
 try:
     from typing import TYPE_CHECKING
@@ -29,7 +30,7 @@ except ImportError:
     TYPE_CHECKING = False
 
 if TYPE_CHECKING:
-    from typing import Any, List
+    from typing import Any, Iterable, List, Optional
     from azure.core.credentials import AccessToken, TokenCredential
 
 _LOGGER = logging.getLogger(__name__)
@@ -53,6 +54,10 @@ class _DefaultAzureCredential(_ChainedTokenCredential):
        - subscription_id
        - arm_base_url (defaults to the production url "https://management.azure.com/")
     3) Add custom TokenFileCredential as first method to attempt, which will look for a local access token.
+    4) Cache tokens by scopes, tenant and identity, refreshing them a few minutes before they expire.
+       When a token_cache_path is given (or the AZURE_QUANTUM_TOKEN_CACHE environment variable
+       is set), the cache is persisted to that file and shared by all processes, which also
+       remember which credential acquired the token and attempt it first.
     """
     def __init__(self, **kwargs):
         # type: (**Any) -> None
@@ -64,6 +69,9 @@ class _DefaultAzureCredential(_ChainedTokenCredential):
         self.interactive_browser_tenant_id = kwargs.pop(
             "interactive_browser_tenant_id", os.environ.get(EnvironmentVariables.AZURE_TENANT_ID)
         )
+        # Cached tokens are keyed by the configured tenant, as resolving it
+        # from the subscription requires a network call
+        self._cache_tenant_id = self.interactive_browser_tenant_id
 
         self.subscription_id = kwargs.pop(
             "subscription_id", os.environ.get("SUBSCRIPTION_ID")
@@ -95,6 +103,10 @@ class _DefaultAzureCredential(_ChainedTokenCredential):
         self.exclude_device_code_credential = kwargs.pop("exclude_device_code_credential", False)
         self.exclude_powershell_credential = kwargs.pop("exclude_powershell_credential", False)
 
+        token_cache_path = kwargs.pop("token_cache_path", None)
+        self._token_cache = _PersistentTokenCache(token_cache_path) if token_cache_path \
+            else _PersistentTokenCache.from_env()
+
         # credentials will be created lazy on the first call to get_token
         super(_DefaultAzureCredential, self).__init__()
 
@@ -137,6 +149,12 @@ class _DefaultAzureCredential(_ChainedTokenCredential):
 
         self.credentials = credentials
 
+    def _cache_key(self, scopes, tenant_id=None):
+        # type: (Iterable[str], Optional[str]) -> str
+        # Tokens of different identities are cached separately
+        identity = ",".join([self.managed_identity_client_id or "", self.shared_cache_username or ""])
+        return _cache_key(scopes, tenant_id or self._cache_tenant_id, self.subscription_id, identity)
+
     def get_token(self, *scopes, **kwargs):
         # type: (*str, **Any) -> AccessToken
         """Request an access token for `scopes`.
@@ -145,12 +163,43 @@ class _DefaultAzureCredential(_ChainedTokenCredential):
         :raises ~azure.core.exceptions.ClientAuthenticationError: authentication failed. The exception has a
           `message` attribute listing each authentication attempt and its error message.
         """
-        # add credentials the first time it runs the get_token
+        key = self._cache_key(scopes, kwargs.get("tenant_id"))
+        if kwargs.get("claims"):
+            # Claims challenges always require a new token
+            return self._get_token(key, *scopes, **kwargs)
+
+        token = self._token_cache.get(key)
+        if token is not None:
+            return token
+
+        try:
+            token = self._get_token(key, *scopes, **kwargs)
+        except Exception:
+            # Keep using a token that is about to expire if it cannot be refreshed
+            token = self._token_cache.get_stale(key)
+            if token is None:
+                raise
+            _LOGGER.info("%s could not refresh the cached token", self.__class__.__name__)
+            return token
+
+        self._token_cache.put(key, token, self._successful_credential.__class__.__name__)
+        return token
+
+    def _get_token(self, key, *scopes, **kwargs):
+        # type: (str, *str, **Any) -> AccessToken
+        # add credentials the first time a token is not in the cache
         # such that the _get_tenant_id can be called only when needed
         if self.credentials is None \
            or len(self.credentials) == 0:
             self._initialize_credentials()
 
+        if self._successful_credential is None:
+            # Start with the credential that succeeded last in another process
+            name = self._token_cache.get_credential_name(key)
+            self._successful_credential = next(
+                (c for c in self.credentials if c.__class__.__name__ == name), None
+            )
+
         return super(_DefaultAzureCredential, self).get_token(*scopes, **kwargs)
 
     def _get_tenant_id(self, arm_base_url:str, subscription_id:str):
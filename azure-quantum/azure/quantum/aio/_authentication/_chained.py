@@ -16,7 +16,7 @@ except ImportError:
 
 if TYPE_CHECKING:
     # pylint:disable=unused-import,ungrouped-imports
-    from typing import Any, Optional
+    from typing import Any, List, Optional
     from azure.core.credentials_async import AccessToken, AsyncTokenCredential
 
 _LOGGER = logging.getLogger(__name__)
@@ -40,9 +40,19 @@ class _ChainedTokenCredential(object):
         self._successful_credential = None  # type: Optional[AsyncTokenCredential]
         self.credentials = credentials
 
+    def _ordered_credentials(self):
+        # type: () -> List[AsyncTokenCredential]
+        """The credentials to attempt, starting with the one that succeeded last."""
+        credentials = list(self.credentials)
+        if self._successful_credential in credentials:
+            credentials.remove(self._successful_credential)
+            credentials.insert(0, self._successful_credential)
+        return credentials
+
     async def get_token(self, *scopes, **kwargs):  # pylint:disable=unused-argument
         # type: (*str, **Any) -> AccessToken
-        """Request a token from each chained credential, in order, returning the first token received.
+        """Request a token from each chained credential, starting with the one that
+        succeeded last and then in order, returning the first token received.
         This method is called automatically by Azure SDK clients.
         :param str scopes: desired scopes for the access token. This method requires at least one scope.
         :raises ~azure.core.exceptions.ClientAuthenticationError: no credential in the chain provided a token
@@ -55,7 +65,7 @@ class _ChainedTokenCredential(object):
         handler.addFilter(filter_credential_warnings)
         azure_identity_logger.addHandler(handler)
         try:
-            for credential in self.credentials:
+            for credential in self._ordered_credentials():
                 try:
                     if isinstance(credential, (InteractiveBrowserCredential, DeviceCodeCredential)):
                         # InteractiveCredentials aren't async.
@@ -2,6 +2,7 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 # ------------------------------------
+import asyncio
 import logging
 import os
 from azure.identity import InteractiveBrowserCredential, DeviceCodeCredential
@@ -20,6 +21,7 @@ from azure.identity.aio import (
 )
 from ._chained import _ChainedTokenCredential
 from ._token import _TokenFileCredential
+from azure.quantum._authentication._cache import _PersistentTokenCache, _cache_key
 
 try:
     from typing import TYPE_CHECKING
@@ -27,7 +29,7 @@ except ImportError:
     TYPE_CHECKING = False
 
 if TYPE_CHECKING:
-    from typing import Any, List
+    from typing import Any, Iterable, List, Optional
     from azure.core.credentials_async import AccessToken, AsyncTokenCredential
 
 _LOGGER = logging.getLogger(__name__)
@@ -61,6 +63,9 @@ class _DefaultAzureCredential(_ChainedTokenCredential):
         self.interactive_browser_tenant_id = kwargs.pop(
             "interactive_browser_tenant_id", os.environ.get(EnvironmentVariables.AZURE_TENANT_ID)
         )
+        # Cached tokens are keyed by the configured tenant, as resolving it
+        # from the subscription requires a network call
+        self._cache_tenant_id = self.interactive_browser_tenant_id
 
         self.subscription_id = kwargs.pop(
             "subscription_id", os.environ.get("SUBSCRIPTION_ID")
@@ -92,6 +97,10 @@ class _DefaultAzureCredential(_ChainedTokenCredential):
         self.exclude_device_code_credential = kwargs.pop("exclude_device_code_credential", False)
         self.exclude_powershell_credential = kwargs.pop("exclude_powershell_credential", False)
 
+        token_cache_path = kwargs.pop("token_cache_path", None)
+        self._token_cache = _PersistentTokenCache(token_cache_path) if token_cache_path \
+            else _PersistentTokenCache.from_env()
+
         # credentials will be created lazy on the first call to get_token
         super(_DefaultAzureCredential, self).__init__()
 
@@ -134,6 +143,19 @@ class _DefaultAzureCredential(_ChainedTokenCredential):
 
         self.credentials = credentials
 
+    def _cache_key(self, scopes, tenant_id=None):
+        # type: (Iterable[str], Optional[str]) -> str
+        # Tokens of different identities are cached separately
+        identity = ",".join([self.managed_identity_client_id or "", self.shared_cache_username or ""])
+        return _cache_key(scopes, tenant_id or self._cache_tenant_id, self.subscription_id, identity)
+
+    async def _run_blocking(self, function, *args):
+        # The tenant lookup and the persistent cache block on network and
+        # file I/O, run them off the event loop
+        if getattr(function, "__self__", None) is self._token_cache and self._token_cache.path is None:
+            return function(*args)
+        return await asyncio.get_running_loop().run_in_executor(None, function, *args)
+
     async def get_token(self, *scopes, **kwargs):
         # type: (*str, **Any) -> AccessToken
         """Request an access token for `scopes`.
@@ -142,11 +164,44 @@ class _DefaultAzureCredential(_ChainedTokenCredential):
         :raises ~azure.core.exceptions.ClientAuthenticationError: authentication failed. The exception has a
           `message` attribute listing each authentication attempt and its error message.
         """
-        # add credentials the first time it runs the get_token
+        key = self._cache_key(scopes, kwargs.get("tenant_id"))
+        if kwargs.get("claims"):
+            # Claims challenges always require a new token
+            return await self._get_token(key, *scopes, **kwargs)
+
+        token = await self._run_blocking(self._token_cache.get, key)
+        if token is not None:
+            return token
+
+        try:
+            token = await self._get_token(key, *scopes, **kwargs)
+        except Exception:
+            # Keep using a token that is about to expire if it cannot be refreshed
+            token = await self._run_blocking(self._token_cache.get_stale, key)
+            if token is None:
+                raise
+            _LOGGER.info("%s could not refresh the cached token", self.__class__.__name__)
+            return token
+
+        await self._run_blocking(
+            self._token_cache.put, key, token, self._successful_credential.__class__.__name__
+        )
+        return token
+
+    async def _get_token(self, key, *scopes, **kwargs):
+        # type: (str, *str, **Any) -> AccessToken
+        # add credentials the first time a token is not in the cache
         # such that the _get_tenant_id can be called only when needed
         if self.credentials is None \
            or len(self.credentials) == 0:
-            self._initialize_credentials()
+            await self._run_blocking(self._initialize_credentials)
+
+        if self._successful_credential is None:
+            # Start with the credential that succeeded last in another process
+            name = await self._run_blocking(self._token_cache.get_credential_name, key)
+            self._successful_credential = next(
+                (c for c in self.credentials if c.__class__.__name__ == name), None
+            )
 
         return await super(_DefaultAzureCredential, self).get_token(*scopes, **kwargs)
 
@@ -19,7 +19,7 @@ except ImportError:
 
 if TYPE_CHECKING:
     # pylint:disable=unused-import,ungrouped-imports
-    from typing import Any
+    from typing import Any, Optional, Tuple
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,6 +35,8 @@ class _TokenFileCredential(object):
 
     If the environment variable is not set, the file does not exist, or the token is invalid in any way (expired, for example),
     then the credential will throw CredentialUnavailableError, so that _ChainedTokenCredential can fallback to other methods.
+
+    The parsed token is kept until the modification time or size of the file changes.
     """
     def __init__(self, **kwargs):
         # type: (**Any) -> None
@@ -43,6 +45,7 @@ class _TokenFileCredential(object):
             _LOGGER.debug("Using provided token file location: {}".format(self.token_file))
         else:
             _LOGGER.debug("No token file location provided for {} environment variable.".format(_TOKEN_FILE_ENV_VARIABLE))
+        self._parsed = None  # type: Optional[Tuple[Tuple[int, int], AccessToken]]
 
     async def get_token(self, *scopes, **kwargs):  # pylint:disable=unused-argument
         # type: (*str, **Any) -> AccessToken
@@ -55,11 +58,15 @@ class _TokenFileCredential(object):
         if not self.token_file:
             raise CredentialUnavailableError(message="Token file location not set.")
 
-        if not os.path.isfile(self.token_file):
+        try:
+            stat = os.stat(self.token_file)
+        except OSError:
+            stat = None
+        if stat is None or not os.path.isfile(self.token_file):
             raise CredentialUnavailableError(message="Token file at {} does not exist.".format(self.token_file))
 
         try:
-            token = await self._parse_token_file(self.token_file)
+            token = await self._get_parsed_token(self.token_file, (stat.st_mtime_ns, stat.st_size))
         except JSONDecodeError:
             raise CredentialUnavailableError(message="Failed to parse token file: Invalid JSON.")
         except KeyError as e:
@@ -72,6 +79,14 @@ class _TokenFileCredential(object):
 
         return token
 
+    async def _get_parsed_token(self, path, version):
+        # type: (str, Tuple[int, int]) -> AccessToken
+        if self._parsed is not None and self._parsed[0] == version:
+            return self._parsed[1]
+        token = await self._parse_token_file(path)
+        self._parsed = (version, token)
+        return token
+
     async def _parse_token_file(self, path):
         # type: (*str) -> AccessToken
         async with async_open(path, "r") as file:
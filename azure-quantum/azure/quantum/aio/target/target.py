@@ -56,7 +56,7 @@ class Target(SyncTarget, abc.ABC):
 
     async def refresh(self):
         """Update the target availability and queue time"""
-        targets = await self.workspace._get_target_status(self.name, self.provider_id)
+        targets = await self.workspace._get_target_status(self.name, self.provider_id, refresh=True)
         if len(targets) > 0:
             _, target_status = targets[0]
             self._current_availability = target_status.current_availability
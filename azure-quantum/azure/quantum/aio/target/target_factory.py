@@ -38,6 +38,7 @@ class TargetFactory(SyncTargetFactory):
         workspace: "Workspace",
         name: str,
         provider_id: str,
+        refresh: bool = False,
         **kwargs
     ) -> Union[Target, List[Target]]:
         """Create targets that are available to this workspace
@@ -49,10 +50,13 @@ class TargetFactory(SyncTargetFactory):
         :type workspace: Workspace
         :param provider_id: Provider name
         :type provider_id: str
+        :param refresh: Fetch the latest target status instead of
+            the status cached by the workspace, defaults to False
+        :type refresh: bool
         :return: One or more Target objects
         :rtype: Union[Target, List[Target]]
         """
-        target_statuses = await workspace._get_target_status(name, provider_id, **kwargs)
+        target_statuses = await workspace._get_target_status(name, provider_id, refresh=refresh)
 
         if len(target_statuses) == 1:
             _, status = target_statuses[0]
@@ -6,6 +6,7 @@ from datetime import datetime
 import logging
 import re
 import os
+import time
 
 from typing import Iterable, List, Optional, Dict, Any, TYPE_CHECKING, Tuple, Union
 
@@ -15,7 +16,9 @@ from azure.quantum._client.models import BlobDetails, JobStatus
 from azure.quantum.aio.job import Job
 from azure.quantum.aio.storage import create_container_using_client, get_container_uri, ContainerClient
 
-from azure.quantum.workspace import BASE_URL, ARM_BASE_URL, USER_AGENT_APPID_ENV_VAR_NAME
+from azure.quantum.workspace import (
+    BASE_URL, ARM_BASE_URL, USER_AGENT_APPID_ENV_VAR_NAME, DEFAULT_TARGET_STATUS_TTL
+)
 
 if TYPE_CHECKING:
     from azure.quantum.aio.target import Target
@@ -74,6 +77,10 @@ class Workspace:
 
     credentials = None
 
+    # Number of seconds for which the status of providers and targets is
+    # cached. Set to 0 to always fetch the latest status.
+    target_status_ttl = DEFAULT_TARGET_STATUS_TTL
+
     def __init__(
         self,
         subscription_id: Optional[str] = None,
@@ -138,6 +145,9 @@ class Workspace:
         # "West US" should be converted to "westus".
         self.location = "".join(location.split()).lower()
 
+        # Status of the providers and their targets, see _get_target_status
+        self._target_status_cache = (float("-inf"), [])
+
     def _create_client(self) -> QuantumClient:
         base_url = BASE_URL(self.location)
         logger.debug(
@@ -240,31 +250,50 @@ class Workspace:
         await client.close()
         return result
     
-    async def _get_target_status(self, name: str, provider_id: str) -> List[Tuple[str, "TargetStatus"]]:
-        """Get provider ID and status for targets"""
-        client = self._create_client()
-        result = [
-            (provider.id, target)
-            async for provider in client.providers.get_status()
-            for target in provider.targets
-            if (provider_id is None or provider.id.lower() == provider_id.lower())
+    async def _get_target_status(
+        self, name: str, provider_id: str, refresh: bool = False
+    ) -> List[Tuple[str, "TargetStatus"]]:
+        """Get provider ID and status for targets.
+
+        The status of all providers is cached for ``target_status_ttl``
+        seconds; ``refresh=True`` fetches it again regardless."""
+        return [
+            (_provider_id, target)
+            for _provider_id, target in await self._get_all_target_status(refresh)
+            if (provider_id is None or _provider_id.lower() == provider_id.lower())
                 and (name is None or target.id.lower() == name.lower())
         ]
-        await client.close()
-        return result
+
+    async def _get_all_target_status(self, refresh: bool = False) -> List[Tuple[str, "TargetStatus"]]:
+        cached_at, statuses = self._target_status_cache
+        if refresh or time.monotonic() - cached_at >= self.target_status_ttl:
+            client = self._create_client()
+            statuses = [
+                (provider.id, target)
+                async for provider in client.providers.get_status()
+                for target in provider.targets
+            ]
+            await client.close()
+            self._target_status_cache = (time.monotonic(), statuses)
+        return statuses
 
     async def get_targets(
         self, 
         name: str = None, 
         provider_id: str = None,
+        refresh: bool = False,
         **kwargs
     ) -> Union["Target", Iterable["Target"]]:
         """Returns all available targets for this workspace filtered by name and provider ID.
+
+        The status of the targets is cached for ``target_status_ttl`` seconds.
         
         :param name: Optional target name to filter by, defaults to None
         :type name: str, optional
         :param provider_id: Optional provider Id to filter by, defaults to None
         :type provider_id: str, optional
+        :param refresh: Fetch the latest status instead of the cached one, defaults to False
+        :type refresh: bool, optional
         :return: Targets
         :rtype: Iterable[Target]
         """
@@ -279,7 +308,8 @@ class Workspace:
         return await target_factory.get_targets(
             workspace=self,
             name=name,
-            provider_id=provider_id
+            provider_id=provider_id,
+            refresh=refresh
         )
 
     async def get_quotas(self) -> List[Dict[str, Any]]:
@@ -12,8 +12,10 @@ To install run: pip install azure-quantum[cirq]"
 
 from azure.quantum import Workspace
 from azure.quantum.job.base_job import DEFAULT_TIMEOUT
+from azure.quantum.translation import TranslationCache, TranslationPool, submit_jobs
 from azure.quantum.cirq.targets import * 
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Union, List, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -22,6 +24,7 @@ if TYPE_CHECKING:
     from cirq_ionq import Job as CirqIonqJob
 
 DEFAULT_JOB_NAME = "cirq-job"
+DEFAULT_MAX_PARALLEL_SUBMISSIONS = 8
 CIRQ_USER_AGENT = "azure-quantum-cirq"
 
 
@@ -34,6 +37,8 @@ class AzureQuantumService:
         self,
         workspace: Workspace = None,
         default_target: Optional[str] = None,
+        translation_pool: Optional[TranslationPool] = None,
+        translation_cache: Optional[TranslationCache] = None,
         **kwargs
     ):
         """AzureQuantumService class
@@ -42,6 +47,10 @@ class AzureQuantumService:
         :type workspace: Workspace, optional
         :param default_target: Default target name, defaults to None
         :type default_target: Optional[str], optional
+        :param translation_pool: Pool of worker processes to translate circuits on, defaults to translating on the caller's thread.
+        :type translation_pool: Optional[TranslationPool], optional
+        :param translation_cache: Cache of translated circuits, reused across jobs and sweep points. Defaults to a new in-memory cache.
+        :type translation_cache: Optional[TranslationCache], optional
         """
         if workspace is None:
             workspace = Workspace(**kwargs)
@@ -50,6 +59,8 @@ class AzureQuantumService:
 
         self._workspace = workspace
         self._default_target = default_target
+        self._translation_pool = translation_pool
+        self._translation_cache = translation_cache if translation_cache is not None else TranslationCache()
 
     @property
     def _target_factory(self):
@@ -77,10 +88,19 @@ class AzureQuantumService:
         :return: Target instance or list thereof
         :rtype: Union[Target, List[Target]]
         """
-        return self._target_factory.get_targets(
+        targets = self._target_factory.get_targets(
             name=name,
             provider_id=provider_id
         )
+        for target in (targets if isinstance(targets, list) else [targets]):
+            if target is not None:
+                self._configure_target(target)
+        return targets
+
+    def _configure_target(self, target: "CirqTarget"):
+        """Shares the service's translation pool and cache with the target."""
+        target.translation_pool = self._translation_pool
+        target.translation_cache = self._translation_cache
 
     def get_target(self, name: str = None, **kwargs) -> "CirqTarget":
         """Get target with the specified name
@@ -111,8 +131,23 @@ class AzureQuantumService:
             provider_id=job.details.provider_id,
             name=job.details.target
         )
+        self._configure_target(target)
         return target._to_cirq_job(azure_job=job, *args, **kwargs)
 
+    def _get_target_or_raise(self, target: str = None) -> "CirqTarget":
+        """Get target with the specified name, or the default target
+
+        :raises RuntimeError: if the target cannot be found
+        """
+        _target = self.get_target(name=target)
+        if not _target:
+            target_name = target or self._default_target
+            raise RuntimeError(f"Could not find target '{target_name}'. \
+Please make sure the target name is valid and that the associated provider is added to your Workspace. \
+To add a provider to your quantum workspace on the Azure Portal, \
+see https://aka.ms/AQ/Docs/AddProvider")
+        return _target
+
     def create_job(
         self,
         program: cirq.Circuit,
@@ -137,13 +172,7 @@ class AzureQuantumService:
         :rtype: azure.quantum.cirq.Job
         """
         # Get target
-        _target = self.get_target(name=target)
-        if not _target:
-            target_name = target or self._default_target
-            raise RuntimeError(f"Could not find target '{target_name}'. \
-Please make sure the target name is valid and that the associated provider is added to your Workspace. \
-To add a provider to your quantum workspace on the Azure Portal, \
-see https://aka.ms/AQ/Docs/AddProvider")
+        _target = self._get_target_or_raise(target)
         # Resolve parameters
         resolved_circuit = cirq.resolve_parameters(program, param_resolver)
         # Submit job to Azure
@@ -207,8 +236,21 @@ see https://aka.ms/AQ/Docs/AddProvider")
             param_resolver=param_resolver
         )
         # Get raw job results
+        result = self._get_job_results(job, timeout_seconds)
+
+        # Convert to Cirq Result
+        target = self.get_target(name=target)
+        return target._to_cirq_result(
+            result=result,
+            param_resolver=param_resolver,
+            seed=seed
+        )
+
+    @staticmethod
+    def _get_job_results(job: Union["CirqJob", "CirqIonqJob"], timeout_seconds: int):
+        """Wait for the job to complete and return its raw results"""
         try:
-            result = job.results(timeout_seconds=timeout_seconds)
+            return job.results(timeout_seconds=timeout_seconds)
         except RuntimeError as e:
             # Catch errors from cirq_ionq.Job.results
             if "Job was not completed successful. Instead had status: " in str(e):
@@ -217,10 +259,105 @@ Job status: '{job.status()}'.")
             else:
                 raise e
 
-        # Convert to Cirq Result
-        target = self.get_target(name=target)
-        return target._to_cirq_result(
-            result=result,
-            param_resolver=param_resolver,
-            seed=seed
-        )
+    def create_sweep_jobs(
+        self,
+        program: cirq.Circuit,
+        repetitions: int,
+        params: cirq.Sweepable = None,
+        name: str = DEFAULT_JOB_NAME,
+        target: str = None,
+        max_parallel_submissions: int = DEFAULT_MAX_PARALLEL_SUBMISSIONS
+    ) -> List[Union["CirqJob", "CirqIonqJob"]]:
+        """Create one job per point of the parameter sweep, submitting them concurrently
+
+        Each worker resolves the parameters of its sweep point, translates and submits
+        the resolved circuit. Sweep points that resolve to the same circuit reuse its translation.
+        If a submission fails, the jobs of the other sweep points are cancelled and attached to the
+        raised exception as ``submitted_jobs``.
+
+        :param program: Cirq program or circuit
+        :type program: cirq.Circuit
+        :param repetitions: Number of measurements for each sweep point
+        :type repetitions: int
+        :param params: Parameter sweep, or list thereof, defaults to a single point without parameters
+        :type params: cirq.Sweepable
+        :param name: Program name
+        :type name: str
+        :param target: Target name
+        :type target: str
+        :param max_parallel_submissions: Maximum number of jobs submitted at the same time, defaults to 8
+        :type max_parallel_submissions: int
+        :return: Jobs, in the order of the sweep points
+        :rtype: List[azure.quantum.cirq.Job]
+        """
+        _target = self._get_target_or_raise(target)
+        resolvers = list(cirq.to_resolvers(params))
+        return self._submit_sweep(_target, program, repetitions, resolvers, name, max_parallel_submissions)
+
+    @staticmethod
+    def _submit_sweep(
+        target: "CirqTarget",
+        program: cirq.Circuit,
+        repetitions: int,
+        resolvers: List[cirq.ParamResolver],
+        name: str,
+        max_parallel_submissions: int
+    ) -> List[Union["CirqJob", "CirqIonqJob"]]:
+        def submit(param_resolver: cirq.ParamResolver):
+            return target.submit(
+                program=cirq.resolve_parameters(program, param_resolver),
+                repetitions=repetitions,
+                name=name
+            )
+
+        # If a submission fails, the jobs of the other sweep points are cancelled
+        return submit_jobs(submit, resolvers, max_parallel_submissions, lambda job: job.cancel())
+
+    def run_sweep(
+        self,
+        program: cirq.Circuit,
+        params: cirq.Sweepable,
+        repetitions: int,
+        target: str = None,
+        name: str = DEFAULT_JOB_NAME,
+        seed: cirq.RANDOM_STATE_OR_SEED_LIKE = None,
+        timeout_seconds: int = DEFAULT_TIMEOUT,
+        max_parallel_submissions: int = DEFAULT_MAX_PARALLEL_SUBMISSIONS
+    ) -> List[cirq.Result]:
+        """Run Cirq circuit for every point of the parameter sweep on the specified target,
+        if target not specified then it runs on the default target
+
+        The jobs are submitted, and their results awaited, concurrently.
+
+        :param program: Cirq program or circuit
+        :type program: cirq.Circuit
+        :param params: Parameter sweep, or list thereof
+        :type params: cirq.Sweepable
+        :param repetitions: Number of measurement repetitions for each sweep point
+        :type repetitions: int
+        :param target: Target name, defaults to default_target
+        :type target: str, optional
+        :param name: Program name, defaults to "cirq-job"
+        :type name: str, optional
+        :param seed: Random seed for simulator results, defaults to None
+        :type seed: cirq.RANDOM_STATE_OR_SEED_LIKE, optional
+        :param timeout_seconds: Timeout in seconds for each job, defaults to None
+        :type timeout_seconds: int, optional
+        :param max_parallel_submissions: Maximum number of jobs submitted or awaited at the same time, defaults to 8
+        :type max_parallel_submissions: int, optional
+        :return: Measurement results, in the order of the sweep points
+        :rtype: List[cirq.Result]
+        """
+        _target = self._get_target_or_raise(target)
+        resolvers = list(cirq.to_resolvers(params))
+        jobs = self._submit_sweep(_target, program, repetitions, resolvers, name, max_parallel_submissions)
+
+        with ThreadPoolExecutor(max_workers=max_parallel_submissions) as executor:
+            results = list(executor.map(lambda job: self._get_job_results(job, timeout_seconds), jobs))
+
+        # Convert to Cirq Results on this thread, so that seeded sampling is reproducible
+        prng = cirq.value.parse_random_state(seed)
+        return [
+            _target._to_cirq_result(result=result, param_resolver=param_resolver, seed=prng)
+            for result, param_resolver in zip(results, resolvers)
+        ]
@@ -161,8 +161,9 @@ are not installed, throw error with installation instructions."""
         :return: Azure Quantum job
         :rtype: Job
         """
-        serialized_program = self._translate_cirq_circuit(program)
-        metadata = serialized_program.metadata or {}
+        serialized_program = self._translate_program(program)
+        # Copy the metadata, as the serialized program may be shared through the translation cache
+        metadata = dict(serialized_program.metadata or {})
         metadata["qubits"] = serialized_program.body["qubits"]
         # Override metadata with value from kwargs
         metadata.update(kwargs.get("metadata", {}))
@@ -113,7 +113,7 @@ class QuantinuumTarget(Quantinuum, CirqTarget):
         :return: Azure Quantum job
         :rtype: Job
         """
-        serialized_program = self._translate_circuit(program)
+        serialized_program = self._translate_program(program)
         metadata = {
             "qubits": len(program.all_qubits()),
             "repetitions": repetitions,
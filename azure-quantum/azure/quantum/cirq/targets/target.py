@@ -4,16 +4,22 @@
 ##
 import abc
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
 if TYPE_CHECKING:
     import cirq
     from azure.quantum import Job as AzureJob
     from azure.quantum.cirq.job import Job as CirqJob
+    from azure.quantum.translation import TranslationCache, TranslationPool
 
 
 class Target(abc.ABC):
     """Abstract base class for Cirq targets"""
+    # Pool of worker processes to translate circuits on, set by AzureQuantumService
+    translation_pool: Optional["TranslationPool"] = None
+    # Cache of translated circuits, set by AzureQuantumService
+    translation_cache: Optional["TranslationCache"] = None
+
     @abc.abstractstaticmethod
     def _translate_cirq_circuit(circuit):
         """Translate Cirq circuit to native provider format."""
@@ -28,6 +34,22 @@ class Target(abc.ABC):
             raise ValueError(
                 f"Cannot translate circuit of type {circuit.__class__}: {e}")
 
+    def _translate_program(self, program: Any):
+        """Translate program into native provider format, on the
+        translation pool if one is set. Translations of structurally
+        identical programs are reused from the translation cache."""
+        def translate():
+            if self.translation_pool is None:
+                return self._translate_circuit(program)
+            return self.translation_pool.translate(type(self)._translate_circuit, program)
+
+        if self.translation_cache is None:
+            return translate()
+
+        # The repr of a cirq circuit fully describes its structure
+        key = self.translation_cache.make_key(type(self).__qualname__, repr(program))
+        return self.translation_cache.get_or_translate(key, translate)
+
     @abc.abstractstaticmethod
     def _to_cirq_result(result: Any) -> "cirq.Result":
         """Convert native hardware result to cirq.Result"""
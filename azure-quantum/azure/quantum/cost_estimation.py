@@ -0,0 +1,155 @@
+##
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+##
+"""Batched cost estimation of many circuits on many targets."""
+import hashlib
+import json
+from typing import Any, Dict, Iterable, Iterator, List, TYPE_CHECKING, Union
+
+import numpy as np
+
+from azure.quantum.translation import TranslationCache
+
+if TYPE_CHECKING:
+    from azure.quantum.target import Target
+    from azure.quantum.target.qasm import GateCounts
+
+__all__ = ["CostEstimates", "estimate_costs"]
+
+
+class CostEstimates:
+    """Cost estimates of circuits on targets, for several numbers of shots.
+
+    Each column is a ``numpy.ndarray`` with one entry per
+    (circuit, target, shots) combination, ordered by circuit, then target,
+    then number of shots:
+
+    * ``circuit``: index of the circuit in the estimated circuits
+    * ``target``: target name
+    * ``shots``: number of shots
+    * ``one_qubit``, ``two_qubit``, ``measurements``: gate counts of the
+      circuit, as used by the pricing formula of the target
+    * ``estimated_total``: estimated cost
+    * ``currency_code``: currency of the estimated cost
+
+    >>> estimates = workspace.estimate_costs(circuits, ["ionq.qpu"], [100, 1000])
+    >>> estimates["estimated_total"].sum()
+    >>> df = estimates.to_dataframe()
+    """
+    columns = (
+        "circuit", "target", "shots", "one_qubit", "two_qubit",
+        "measurements", "estimated_total", "currency_code"
+    )
+
+    def __init__(self, **columns: np.ndarray):
+        self._columns = {name: np.asarray(columns[name]) for name in self.columns}
+
+    def __len__(self) -> int:
+        return len(self._columns["circuit"])
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self._columns[column]
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Iterates over the rows as dictionaries keyed by column name."""
+        values = [self._columns[name].tolist() for name in self.columns]
+        for row in zip(*values):
+            yield dict(zip(self.columns, row))
+
+    def __repr__(self) -> str:
+        return f"<CostEstimates rows={len(self)}>"
+
+    def to_dataframe(self):
+        """Converts the estimates to a ``pandas.DataFrame``.
+
+        :raises ImportError: If pandas is not installed
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError(
+                "Missing dependency pandas. Please run `pip install pandas` "
+                "to convert cost estimates into a DataFrame."
+            )
+        return pd.DataFrame(self._columns, columns=list(self.columns))
+
+
+def circuit_digest(circuit: Any) -> str:
+    """Hashes the content of a circuit: OpenQASM (or other text) programs,
+    bytes such as QIR bitcode, or JSON-serializable circuits."""
+    if isinstance(circuit, str):
+        data = circuit.encode("utf-8")
+    elif isinstance(circuit, bytes):
+        data = circuit
+    else:
+        data = json.dumps(circuit, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def estimate_costs(
+    circuits: Iterable[Any],
+    targets: Iterable["Target"],
+    shots: Union[int, Iterable[int]],
+    cache: TranslationCache,
+) -> CostEstimates:
+    """Estimates the cost of every circuit on every target, for every number
+    of shots. The gate counts of each circuit are computed once per gate
+    counting method and kept in ``cache``, keyed by the circuit digest; the
+    pricing formula of each target is then applied to all circuits and
+    numbers of shots at once.
+
+    :param circuits: Circuits, in a format accepted by all the targets
+    :type circuits: Iterable[Any]
+    :param targets: Targets to estimate the costs for
+    :type targets: Iterable[Target]
+    :param shots: Number(s) of shots
+    :type shots: Union[int, Iterable[int]]
+    :param cache: Cache of gate counts
+    :type cache: TranslationCache
+    :raises NotImplementedError: If a target does not support cost estimation
+    :return: Estimates of every (circuit, target, shots) combination
+    :rtype: CostEstimates
+    """
+    circuits = list(circuits)
+    targets = list(targets)
+    shots = np.atleast_1d(np.asarray(shots, dtype=np.int64))
+    digests = [circuit_digest(circuit) for circuit in circuits]
+
+    def gate_counts(target: "Target") -> np.ndarray:
+        count = target._gate_counts
+        counts: List["GateCounts"] = [
+            cache.get_or_translate(
+                TranslationCache.make_key("gate_counts.v1", count.__qualname__, digest),
+                lambda: count(circuit)
+            )
+            for circuit, digest in zip(circuits, digests)
+        ]
+        return np.array(counts, dtype=np.int64).reshape(len(circuits), 3)
+
+    shape = (len(circuits), len(targets), len(shots))
+    counts = np.zeros(shape[:2] + (3,), dtype=np.int64)
+    totals = np.zeros(shape)
+    for index, target in enumerate(targets):
+        counts[:, index] = gate_counts(target)
+        N_1q, N_2q, N_m = (counts[:, index, column, np.newaxis] for column in range(3))
+        totals[:, index] = target._price(N_1q, N_2q, N_m, shots[np.newaxis, :])
+
+    def column(values: np.ndarray, axis: int) -> np.ndarray:
+        """Broadcasts values along one axis to every row."""
+        expand = [np.newaxis] * len(shape)
+        expand[axis] = slice(None)
+        return np.broadcast_to(values[tuple(expand)], shape).ravel()
+
+    names = np.array([target.name for target in targets], dtype=object)
+    currencies = np.array([target.currency_code for target in targets], dtype=object)
+    return CostEstimates(
+        circuit=column(np.arange(len(circuits)), 0),
+        target=column(names, 1),
+        shots=column(shots, 2),
+        one_qubit=np.repeat(counts[..., 0].ravel(), len(shots)),
+        two_qubit=np.repeat(counts[..., 1].ravel(), len(shots)),
+        measurements=np.repeat(counts[..., 2].ravel(), len(shots)),
+        estimated_total=totals.ravel(),
+        currency_code=column(currencies, 1),
+    )
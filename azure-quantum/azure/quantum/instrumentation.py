@@ -0,0 +1,234 @@
+##
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+##
+"""Timers, byte counts and retry counts of the job submission, upload
+and polling pipeline, recorded in an in-process metrics registry and,
+when OpenTelemetry is installed, emitted as spans.
+
+Instrumentation is disabled by default, in which case ``span`` returns a
+shared no-op context manager and ``count`` returns immediately::
+
+    from azure.quantum import instrumentation
+
+    instrumentation.enable()
+    job = target.submit(circuit)
+    job.get_results()
+    print(instrumentation.metrics.snapshot())
+"""
+import logging
+import threading
+import time
+import weakref
+from typing import Any, Dict, Optional
+
+from azure.core.pipeline.transport import RequestsTransport
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "MetricsRegistry", "metrics", "enable", "disable", "is_enabled", "span", "count"
+]
+
+
+class MetricsRegistry:
+    """Thread-safe registry of counters and timers.
+
+    Counters accumulate values, e.g. numbers of bytes or of retries. Timers
+    accumulate the number of timed operations and their total, minimum and
+    maximum durations in seconds.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._timers = {}
+
+    def add(self, name: str, value: float = 1):
+        """Adds a value to a counter."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def record(self, name: str, seconds: float):
+        """Records the duration of an operation in a timer."""
+        with self._lock:
+            timer = self._timers.get(name)
+            if timer is None:
+                self._timers[name] = [1, seconds, seconds, seconds]
+            else:
+                timer[0] += 1
+                timer[1] += seconds
+                timer[2] = min(timer[2], seconds)
+                timer[3] = max(timer[3], seconds)
+
+    def counter(self, name: str) -> float:
+        """Returns the value of a counter, 0 if it was never incremented."""
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def timer(self, name: str) -> Optional[Dict[str, float]]:
+        """Returns the count, total, min and max durations of a timer,
+        or None if no operation was timed."""
+        with self._lock:
+            timer = self._timers.get(name)
+            if timer is None:
+                return None
+            return dict(zip(("count", "total", "min", "max"), timer))
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Returns a copy of all the counters and timers."""
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "timers": {
+                    name: dict(zip(("count", "total", "min", "max"), timer))
+                    for name, timer in self._timers.items()
+                },
+            }
+
+    def reset(self):
+        """Clears all the counters and timers."""
+        with self._lock:
+            self._counters.clear()
+            self._timers.clear()
+
+
+# Registry used by the instrumented code paths
+metrics = MetricsRegistry()
+
+_enabled = False
+_tracer = None
+
+
+def enable(tracing: bool = True, tracer: Any = None):
+    """Enables instrumentation.
+
+    :param tracing: Emit OpenTelemetry spans if opentelemetry-api is
+        installed, defaults to True
+    :type tracing: bool
+    :param tracer: OpenTelemetry tracer to use, defaults to the tracer of
+        this module from the global tracer provider
+    :type tracer: opentelemetry.trace.Tracer, optional
+    """
+    global _enabled, _tracer
+    if tracing and tracer is None:
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            logger.debug("opentelemetry is not installed, only recording metrics.")
+        else:
+            tracer = trace.get_tracer(__name__)
+    _tracer = tracer if tracing else None
+    _enabled = True
+
+
+def disable():
+    """Disables instrumentation. Recorded metrics are kept."""
+    global _enabled, _tracer
+    _enabled = False
+    _tracer = None
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _Span:
+    __slots__ = ("name", "attributes", "_start", "_otel_context", "_otel_span")
+
+    def __init__(self, name: str, attributes: Dict[str, Any]):
+        self.name = name
+        self.attributes = attributes
+        self._otel_context = None
+        self._otel_span = None
+
+    def __enter__(self):
+        tracer = _tracer
+        if tracer is not None:
+            self._otel_context = tracer.start_as_current_span(
+                self.name, attributes=self.attributes
+            )
+            self._otel_span = self._otel_context.__enter__()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        metrics.record(self.name, time.perf_counter() - self._start)
+        if exc_info[0] is not None:
+            metrics.add(self.name + ".errors")
+        if self._otel_context is not None:
+            return self._otel_context.__exit__(*exc_info)
+        return False
+
+    def set_attribute(self, key: str, value: Any):
+        """Sets an attribute of the OpenTelemetry span, if any."""
+        if self._otel_span is not None:
+            self._otel_span.set_attribute(key, value)
+
+
+def span(name: str, **attributes: Any):
+    """Context manager timing a stage of the pipeline, e.g.
+    ``with span("job.upload", bytes=len(data)):``. The duration is recorded
+    in the ``name`` timer of the metrics registry and, if tracing, in an
+    OpenTelemetry span with the given attributes.
+    """
+    if not _enabled:
+        return _NOOP_SPAN
+    return _Span(name, attributes)
+
+
+def count(name: str, value: float = 1):
+    """Adds a value, e.g. a number of bytes, to a counter of the metrics registry."""
+    if _enabled:
+        metrics.add(name, value)
+
+
+def _content_length(message) -> int:
+    length = message.headers.get("Content-Length")
+    if length is not None:
+        return int(length)
+    body = getattr(message, "body", None)
+    return len(body) if isinstance(body, (bytes, str)) else 0
+
+
+class InstrumentedRequestsTransport(RequestsTransport):
+    """Requests transport that counts and times the HTTP requests of every
+    client sharing it, including the retries of the Azure pipelines, and
+    the number of bytes sent and received."""
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Retry policies send the same request object again
+        self._sent = weakref.WeakSet()
+        self._sent_lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        if not _enabled:
+            return super().send(request, **kwargs)
+
+        with self._sent_lock:
+            retry = request in self._sent
+            self._sent.add(request)
+        count("http.requests")
+        if retry:
+            count("http.retries")
+        count("http.bytes_sent", _content_length(request))
+        with span("http." + request.method, url=request.url.split("?", 1)[0]) as request_span:
+            response = super().send(request, **kwargs)
+            request_span.set_attribute("status_code", response.status_code)
+        count("http.bytes_received", _content_length(response))
+        return response
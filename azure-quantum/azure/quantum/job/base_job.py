@@ -9,8 +9,10 @@ import uuid
 from enum import Enum
 from urllib.parse import urlparse
 from typing import Any, Dict, Optional, TYPE_CHECKING
+from azure.core.pipeline.transport import HttpTransport
 from azure.storage.blob import BlobClient
 
+from azure.quantum.instrumentation import count, span
 from azure.quantum.storage import upload_blob, download_blob, ContainerClient
 from azure.quantum._client.models import JobDetails
 
@@ -97,36 +99,40 @@ class BaseJob(abc.ABC):
         if job_id is None:
             job_id = cls.create_job_id()
 
-        # Create container if it does not yet exist
-        container_uri = workspace.get_container_uri(
-            job_id=job_id,
-            container_name=container_name
-        )
-        logger.debug(f"Container URI: {container_uri}")
+        with span("job.from_input_data", target=target, bytes=len(input_data)):
+            # Create container if it does not yet exist
+            with span("job.get_container_uri"):
+                container_uri = workspace.get_container_uri(
+                    job_id=job_id,
+                    container_name=container_name
+                )
+            logger.debug(f"Container URI: {container_uri}")
+
+            # Upload data to container
+            input_data_uri = cls.upload_input_data(
+                container_uri=container_uri,
+                input_data=input_data,
+                content_type=content_type,
+                blob_name=blob_name,
+                encoding=encoding,
+                transport=workspace._transport,
+            )
 
-        # Upload data to container
-        input_data_uri = cls.upload_input_data(
-            container_uri=container_uri,
-            input_data=input_data,
-            content_type=content_type,
-            blob_name=blob_name,
-            encoding=encoding,
-        )
-
-        # Create and submit job
-        return cls.from_storage_uri(
-            workspace=workspace,
-            job_id=job_id,
-            target=target,
-            input_data_uri=input_data_uri,
-            container_uri=container_uri,
-            name=name,
-            input_data_format=input_data_format,
-            output_data_format=output_data_format,
-            provider_id=provider_id,
-            input_params=input_params,
-            **kwargs
-        )
+            # Create and submit job
+            with span("job.create"):
+                return cls.from_storage_uri(
+                    workspace=workspace,
+                    job_id=job_id,
+                    target=target,
+                    input_data_uri=input_data_uri,
+                    container_uri=container_uri,
+                    name=name,
+                    input_data_format=input_data_format,
+                    output_data_format=output_data_format,
+                    provider_id=provider_id,
+                    input_params=input_params,
+                    **kwargs
+                )
 
     @classmethod
     def from_storage_uri(
@@ -215,7 +221,8 @@ class BaseJob(abc.ABC):
         content_type: Optional[ContentType] = ContentType.json,
         blob_name: str = "inputData",
         encoding: str = "",
-        return_sas_token: bool = False
+        return_sas_token: bool = False,
+        transport: Optional[HttpTransport] = None
     ) -> str:
         """Upload input data file
 
@@ -231,21 +238,26 @@ class BaseJob(abc.ABC):
         :type encoding: str, optional
         :param return_sas_token: Flag to return SAS token as part of URI, defaults to False
         :type return_sas_token: bool, optional
+        :param transport: HTTP transport to upload with, e.g. the workspace's
+            shared transport, defaults to a new transport
+        :type transport: HttpTransport, optional
         :return: Uploaded data URI
         :rtype: str
         """
         container_client = ContainerClient.from_container_url(
-            container_uri
+            container_uri, transport=transport
         )
 
-        uploaded_blob_uri = upload_blob(
-            container_client,
-            blob_name,
-            content_type,
-            encoding,
-            input_data,
-            return_sas_token=return_sas_token
-        )
+        with span("job.upload_input_data", bytes=len(input_data)):
+            uploaded_blob_uri = upload_blob(
+                container_client,
+                blob_name,
+                content_type,
+                encoding,
+                input_data,
+                return_sas_token=return_sas_token
+            )
+        count("job.upload_input_data.bytes", len(input_data))
         return uploaded_blob_uri
 
     def download_data(self, blob_uri: str) -> dict:
@@ -263,13 +275,14 @@ class BaseJob(abc.ABC):
             blob_client = BlobClient.from_blob_url(
                 blob_uri
             )
-            blob_uri = self.workspace._get_linked_storage_sas_uri(
-                blob_client.container_name, blob_client.blob_name
-            )
-            payload = download_blob(blob_uri)
-        else:
-            # blob_uri contains SAS token, use it
-            payload = download_blob(blob_uri)
+            with span("job.get_sas_uri"):
+                blob_uri = self.workspace._get_linked_storage_sas_uri(
+                    blob_client.container_name, blob_client.blob_name
+                )
+
+        with span("job.download_data"):
+            payload = download_blob(blob_uri, transport=self.workspace._transport)
+        count("job.download_data.bytes", len(payload))
 
         return payload
 
@@ -298,6 +311,7 @@ class BaseJob(abc.ABC):
         if container_uri is None:
             container_uri = self.workspace.get_container_uri(job_id=self.id)
 
+        kwargs.setdefault("transport", self.workspace._transport)
         uploaded_blob_uri = self.upload_input_data(
             container_uri = container_uri,
             blob_name = name,
@@ -328,7 +342,9 @@ class BaseJob(abc.ABC):
         if container_uri is None:
             container_uri = self.workspace.get_container_uri(job_id=self.id)
         
-        container_client = ContainerClient.from_container_url(container_uri)
+        container_client = ContainerClient.from_container_url(
+            container_uri, transport=self.workspace._transport
+        )
         blob_client = container_client.get_blob_client(name)
         response = blob_client.download_blob().readall()
         return response
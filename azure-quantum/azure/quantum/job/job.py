@@ -9,6 +9,7 @@ import json
 from typing import TYPE_CHECKING
 
 from azure.quantum._client.models import JobDetails
+from azure.quantum.instrumentation import count, span
 from azure.quantum.job.base_job import BaseJob, ContentType, DEFAULT_TIMEOUT
 from azure.quantum.job.filtered_job import FilteredJob
 
@@ -74,27 +75,30 @@ class Job(BaseJob, FilteredJob):
         :type print_progress: bool, optional
         :raises TimeoutError: If the total poll time exceeds timeout, raise
         """
-        self.refresh()
-        poll_wait = 0.2
-        total_time = 0.
-        while not self.has_completed():
-            if timeout_secs is not None and total_time >= timeout_secs:
-                raise TimeoutError(f"The wait time has exceeded {timeout_secs} seconds.")
- 
-            logger.debug(
-                f"Waiting for job {self.id},"
-                + f"it is in status '{self.details.status}'"
-            )
-            if print_progress:
-                print(".", end="", flush=True)
-            time.sleep(poll_wait)
-            total_time += poll_wait
+        with span("job.wait_until_completed", job_id=self.id):
             self.refresh()
-            poll_wait = (
-                max_poll_wait_secs
-                if poll_wait >= max_poll_wait_secs
-                else poll_wait * 1.5
-            )
+            count("job.polls")
+            poll_wait = 0.2
+            total_time = 0.
+            while not self.has_completed():
+                if timeout_secs is not None and total_time >= timeout_secs:
+                    raise TimeoutError(f"The wait time has exceeded {timeout_secs} seconds.")
+
+                logger.debug(
+                    f"Waiting for job {self.id},"
+                    + f"it is in status '{self.details.status}'"
+                )
+                if print_progress:
+                    print(".", end="", flush=True)
+                time.sleep(poll_wait)
+                total_time += poll_wait
+                self.refresh()
+                count("job.polls")
+                poll_wait = (
+                    max_poll_wait_secs
+                    if poll_wait >= max_poll_wait_secs
+                    else poll_wait * 1.5
+                )
 
     def get_results(self, timeout_secs: float = DEFAULT_TIMEOUT):
         """Get job results by downloading the results blob from the
@@ -118,10 +122,11 @@ class Job(BaseJob, FilteredJob):
                 + f"error: {self.details.error_data})"
             )
 
-        payload = self.download_data(self.details.output_data_uri)
-        try:
-            payload = payload.decode("utf8")
-            return json.loads(payload)
-        except:
-            # If errors decoding the data, return the raw payload:
-            return payload
+        with span("job.get_results", job_id=self.id):
+            payload = self.download_data(self.details.output_data_uri)
+            try:
+                payload = payload.decode("utf8")
+                return json.loads(payload)
+            except:
+                # If errors decoding the data, return the raw payload:
+                return payload
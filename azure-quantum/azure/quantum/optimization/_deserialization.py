@@ -0,0 +1,215 @@
+##
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+##
+"""Fast deserialization of problem payloads.
+
+Terms are built directly from the parsed payload, without the conversions
+and type checks of the ``Term`` constructor, since JSON and protobuf
+payloads can only contain ints and floats. JSON payloads are parsed with
+orjson when it is installed, and gzip-compressed payloads are decompressed
+and parsed incrementally, one term at a time, so that the whole decompressed
+payload is never held in memory.
+"""
+import codecs
+import io
+import json
+import logging
+import tarfile
+import zlib
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Union
+
+from azure.quantum.optimization.term import SlcTerm, Term
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+# Size of the chunks in which payloads are decompressed and parsed
+CHUNK_SIZE = 1 << 20
+
+
+def loads(payload: Union[str, bytes]) -> Any:
+    """Parses a JSON payload, with orjson if it is installed."""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def term_from_dict(obj: Dict[str, Any]) -> Term:
+    """Creates a Term from its deserialized dictionary."""
+    c = obj.get("c")
+    if type(c) is not int and type(c) is not float:
+        # Let the constructor handle legacy and invalid terms
+        return Term.from_dict(obj)
+    term = Term.__new__(Term)
+    term.c = c
+    term.ids = obj.get("ids")
+    return term
+
+
+def slc_term_from_dict(obj: Dict[str, Any]) -> SlcTerm:
+    """Creates a SlcTerm from its deserialized dictionary."""
+    return SlcTerm(terms=[term_from_dict(term) for term in obj["terms"]], c=obj["c"])
+
+
+def proto_messages(payload: bytes) -> List[bytes]:
+    """Extracts the protobuf messages of a payload compressed with
+    Problem.compress_protobuf, in order."""
+    messages = []
+    with tarfile.open(fileobj=io.BytesIO(payload), mode="r:gz") as tar:
+        members = [member for member in tar.getmembers() if member.isfile()]
+        # Files are named gzipinputfile_pb_<index>.pb
+        members.sort(key=lambda member: int(member.name.rsplit("_", 1)[-1].split(".")[0]))
+        for member in members:
+            messages.append(tar.extractfile(member).read())
+    return messages
+
+
+def decompress(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Decompresses a stream of chunks if it starts as a gzip stream, and
+    passes it through otherwise."""
+    chunks = iter(chunks)
+    first = b""
+    for first in chunks:
+        if first:
+            break
+    if not first.startswith(GZIP_MAGIC):
+        yield first
+        yield from chunks
+        return
+
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    for chunk in _chain(first, chunks):
+        while chunk:
+            data = decompressor.decompress(chunk, CHUNK_SIZE)
+            if data:
+                yield data
+            chunk = decompressor.unconsumed_tail
+    data = decompressor.flush()
+    if data:
+        yield data
+
+
+def _chain(first: bytes, rest: Iterator[bytes]) -> Iterator[bytes]:
+    yield first
+    yield from rest
+
+
+def split(payload: bytes, size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Splits a payload into chunks, without copying it."""
+    view = memoryview(payload)
+    for start in range(0, len(payload), size):
+        yield view[start:start + size].tobytes()
+
+
+class StreamingJsonParser:
+    """Incremental parser of a JSON document given as a stream of chunks.
+
+    Objects are walked key by key; arrays of terms can be parsed item by
+    item with ``items``, and other values are parsed as a whole with
+    ``value``.
+    """
+    _WHITESPACE = " \t\n\r"
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._done = False
+
+    def _fill(self) -> bool:
+        """Reads the next chunk into the buffer, dropping its consumed part.
+        Returns False once the stream is exhausted."""
+        if self._done:
+            return False
+        for chunk in self._chunks:
+            text = self._utf8.decode(chunk)
+            if text:
+                self._buffer = self._buffer[self._pos:] + text
+                self._pos = 0
+                return True
+        self._done = True
+        text = self._utf8.decode(b"", final=True)
+        self._buffer = self._buffer[self._pos:] + text
+        self._pos = 0
+        return bool(text)
+
+    def _peek(self) -> str:
+        """Skips whitespace and returns the next character, or "" at the end."""
+        while True:
+            buffer = self._buffer
+            pos = self._pos
+            while pos < len(buffer) and buffer[pos] in self._WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, char: str):
+        found = self._peek()
+        if found != char:
+            raise ValueError(f"Invalid JSON payload: expected '{char}' but found '{found}'")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Parses the next value."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number may continue in the next chunk
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def items(self) -> Iterator[Any]:
+        """Parses the next array, one item at a time."""
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            if self._peek() == ",":
+                self._pos += 1
+            else:
+                self._expect("]")
+                return
+
+    def object(self, handlers: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+        """Parses the next object, parsing the values of the keys in handlers
+        with them, and returns the parsed keys and values."""
+        result = {}
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return result
+        while True:
+            key = self.value()
+            self._expect(":")
+            handler = handlers.get(key)
+            result[key] = handler() if handler is not None else self.value()
+            if self._peek() == ",":
+                self._pos += 1
+            else:
+                self._expect("}")
+                return result
+
+    def end(self):
+        if self._peek() != "":
+            raise ValueError("Invalid JSON payload: unexpected data after the problem")
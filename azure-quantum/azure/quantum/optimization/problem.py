@@ -7,15 +7,18 @@ from __future__ import annotations
 import logging
 import io
 import gzip
+import itertools
 import json
 import numpy
+import sys
 import os
 import tarfile
 
 
-from typing import List, Tuple, Union, Dict, Optional, TYPE_CHECKING
+from typing import Any, Iterable, List, Tuple, Union, Dict, Optional, TYPE_CHECKING
 from enum import Enum
 from azure.quantum.optimization import TermBase, Term, GroupType, SlcTerm
+from azure.quantum.optimization import _deserialization
 from azure.quantum.storage import (
     ContainerClient,
     download_blob,
@@ -25,6 +28,7 @@ from azure.quantum.storage import (
 )
 from azure.quantum.job.base_job import ContentType
 from azure.quantum.job.job import Job
+from azure.quantum.instrumentation import span
 from azure.quantum.target.target import Target
 from azure.quantum.serialization import ProtoProblem
 from google.protobuf import struct_pb2
@@ -85,6 +89,7 @@ class Problem:
         # each type of term has its own section for quicker serialization
         self.terms = []
         self.terms_slc = []
+        self._reset_stats()
 
         # set the terms
         if terms:
@@ -160,7 +165,7 @@ class Problem:
                         term.ids.append(self.terms[i].ids[j])
             else:
                 # add the remaining terms to the last message
-                for i in range(terms_remaining):
+                for i in range(terms_read, terms_read + terms_remaining):
                     term = cost_function.terms.add()
                     term.c = self.terms[i].c
                     for j in range (len(self.terms[i].ids)):
@@ -191,15 +196,17 @@ class Problem:
     @classmethod
     def from_json(
             cls, 
-            input_problem: str, 
+            input_problem: Union[str, bytes], 
             name: Optional[str] = None
         ) -> Problem:
         """Deserializes the problem from a
         json serialized with Problem.serialize()
 
         :param input_problem:
-            the json string to be deserialized to a `Problem` instance
-        :type problem_msgs: str
+            the json string to be deserialized to a `Problem` instance,
+            or its (optionally gzip-compressed) bytes. Compressed payloads
+            are decompressed and parsed incrementally.
+        :type problem_msgs: Union[str, bytes]
         :param
         :param name: 
             The name of the problem is optional, since it will try 
@@ -208,40 +215,93 @@ class Problem:
             problem name ignoring the serialized value.
         :type name: Optional[str]
         """
-        result = json.loads(input_problem)
+        if isinstance(input_problem, (bytes, bytearray)) \
+                and input_problem.startswith(_deserialization.GZIP_MAGIC):
+            return cls.from_json_chunks(_deserialization.split(input_problem), name)
 
-        if name is None:
-            metadata = result.get("metadata")
-            if metadata is not None:
-                name = metadata.get("name")
+        result = _deserialization.loads(input_problem)
+        cost_function = result["cost_function"]
+        terms = [_deserialization.term_from_dict(t) for t in cost_function.get("terms", [])]
+        terms_slc = [_deserialization.slc_term_from_dict(t) for t in cost_function.get("terms_slc", [])]
+        return cls._from_deserialized(result.get("metadata"), cost_function, terms, terms_slc, name)
 
-        terms = [Term.from_dict(t) for t in result["cost_function"]["terms"]] if "terms" in result["cost_function"] else []
-        if "terms_slc" in result["cost_function"]:
-            terms.append([SlcTerm.from_dict(t) for t in result["cost_function"]["terms_slc"]])
+    @classmethod
+    def from_json_chunks(
+            cls,
+            chunks: Iterable[bytes],
+            name: Optional[str] = None
+        ) -> Problem:
+        """Deserializes the problem from the chunks of a json serialized
+        with Problem.serialize(), optionally gzip-compressed, e.g. as it is
+        downloaded. Chunks are decompressed and parsed incrementally, so that
+        only the terms, and not the json payload, are held in memory.
+
+        :param chunks:
+            the chunks of the json payload
+        :type chunks: Iterable[bytes]
+        :param name:
+            The name of the problem is optional, since it will try
+            to read the serialized name from the json payload.
+            If this parameter is not empty, it will use it as the
+            problem name ignoring the serialized value.
+        :type name: Optional[str]
+        """
+        parser = _deserialization.StreamingJsonParser(_deserialization.decompress(chunks))
+        terms = []
+        terms_slc = []
+
+        def parse_terms(target, from_dict):
+            def handler():
+                target.extend(from_dict(t) for t in parser.items())
+            return handler
+
+        result = parser.object({
+            "cost_function": lambda: parser.object({
+                "terms": parse_terms(terms, _deserialization.term_from_dict),
+                "terms_slc": parse_terms(terms_slc, _deserialization.slc_term_from_dict),
+            })
+        })
+        parser.end()
+        return cls._from_deserialized(result.get("metadata"), result["cost_function"], terms, terms_slc, name)
+
+    @classmethod
+    def _from_deserialized(
+        cls,
+        metadata: Optional[Dict[str, Any]],
+        cost_function: Dict[str, Any],
+        terms: List[Term],
+        terms_slc: List[SlcTerm],
+        name: Optional[str]
+    ) -> Problem:
+        if name is None and metadata is not None:
+            name = metadata.get("name")
 
         problem = cls(
             name=name,
-            terms=terms,
-            problem_type=ProblemType[result["cost_function"]["type"]],
+            problem_type=ProblemType[cost_function["type"]],
         )
+        problem.terms = terms
+        problem.terms_slc = terms_slc
+        problem.check_for_grouped_term()
 
-        if "initial_configuration" in result["cost_function"]:
-            problem.init_config = result["cost_function"]["initial_configuration"]
+        if "initial_configuration" in cost_function:
+            problem.init_config = cost_function["initial_configuration"]
 
         return problem
     
     @classmethod
     def from_proto(
         cls,
-        input_problem: list,
+        input_problem: Union[list, bytes],
         name: Optional[str] = None
     ) -> Problem:
         """Deserializes the problem from a
         protobuf messages serialized with Problem.serialize()
 
         :param input_problem:
-            the list of protobuf messages to be deserialized to a `Problem` instance
-        :type input_problem: list
+            the list of protobuf messages to be deserialized to a `Problem` instance,
+            or the payload compressed with Problem.compress_protobuf()
+        :type input_problem: Union[list, bytes]
         :param
         :param name: 
             The name of the problem is optional, since it will try 
@@ -250,12 +310,16 @@ class Problem:
             problem name ignoring the serialized value.
         :type name: Optional[str]
         """
+        if isinstance(input_problem, (bytes, bytearray)):
+            input_problem = _deserialization.proto_messages(input_problem)
+
         msg_count = 0
 
         problem = cls(
             name = name
         )
 
+        terms = problem.terms
         for msg in input_problem:
             proto_problem = ProtoProblem()
             proto_problem.ParseFromString(msg)
@@ -267,21 +331,19 @@ class Problem:
                 if name is None:
                     name = metadata["name"]
                     problem.name = name
+            msg_count += 1
             for msg_term in proto_problem.cost_function.terms:
-                term = Term(
-                    c = msg_term.c
-                )
-                term.ids = []
-                for msg_term_id in msg_term.ids:
-                    term.ids.append(msg_term_id)
-                problem.terms.append(term)
+                term = Term.__new__(Term)
+                term.c = msg_term.c
+                term.ids = list(msg_term.ids)
+                terms.append(term)
         
         return problem
 
     @classmethod
     def deserialize(
         cls, 
-        input_problem: Union[str, list],
+        input_problem: Union[str, bytes, list],
         name: Optional[str] = None, 
         content_type: Optional[ContentType] = None) -> Problem:
         """Deserializes the problem from a
@@ -290,7 +352,7 @@ class Problem:
 
         :param input_problem:
             The json string or the list of protobuf messages to be deserialized to a `Problem` instance
-        :type input_problem: Union[str,list]
+        :type input_problem: Union[str, bytes, list]
         :param
         :param name: 
             The name of the problem is optional, since it will try 
@@ -382,17 +444,19 @@ class Problem:
         :return: Blob data
         :rtype: bytes
         """
-        input_problem = self.serialize()
+        with span("problem.serialize"):
+            input_problem = self.serialize()
         debug_input_string = input_problem if type(input_problem) is str else b''.join( input_problem).decode('latin-1')
         logger.debug("Input Problem: " + debug_input_string)
         data = io.BytesIO()
-        if self.content_type == ContentType.protobuf:
-          return self.compress_protobuf(input_problem)                   
-        else:
-            with gzip.GzipFile(fileobj=data, mode="w") as fo:
-                fo.write(input_problem.encode())
+        with span("problem.compress"):
+            if self.content_type == ContentType.protobuf:
+                return self.compress_protobuf(input_problem)
+            else:
+                with gzip.GzipFile(fileobj=data, mode="w") as fo:
+                    fo.write(input_problem.encode())
 
-            return data.getvalue()
+                return data.getvalue()
     
     def _blob_name(self):
         import uuid
@@ -429,18 +493,21 @@ class Problem:
         encoding = "gzip"
         content_type = self.content_type
 
-        blob = self.to_blob()
-        if container_uri is None:
-            container_uri = workspace.get_container_uri(
-                container_name=container_name
+        with span("problem.upload", terms=len(self.terms)):
+            blob = self.to_blob()
+            if container_uri is None:
+                with span("problem.get_container_uri"):
+                    container_uri = workspace.get_container_uri(
+                        container_name=container_name
+                    )
+            input_data_uri = Job.upload_input_data(
+                input_data=blob,
+                blob_name=blob_name,
+                container_uri=container_uri,
+                encoding=encoding,
+                content_type= content_type,
+                transport=workspace._transport
             )
-        input_data_uri = Job.upload_input_data(
-            input_data=blob,
-            blob_name=blob_name,
-            container_uri=container_uri,
-            encoding=encoding,
-            content_type= content_type
-        )
         self.uploaded_blob_params = blob_params
         self.uploaded_blob_uri = input_data_uri
         return input_data_uri
@@ -519,6 +586,97 @@ class Problem:
 
         return total_cost
 
+    def _reset_stats(self):
+        self._variables = set()
+        self._n_couplers = 0
+        # Term lists and number of their terms included in the statistics
+        self._stats_sources = [(None, 0), (None, 0)]
+        self._stats = {
+            "num_variables": 0,
+            "num_terms": 0,
+            "max_coupling": 0,
+            "avg_coupling": 0,
+            "min_coupling": sys.maxsize,
+            "min_coefficient": None,
+            "max_coefficient": None,
+        }
+
+    def _update_stats(self):
+        """Includes the terms added since the last update in the statistics.
+        Terms are only processed once, in bulk, so that adding terms one at
+        a time stays cheap. If a term list was replaced or shrunk, the
+        statistics are recomputed from scratch."""
+        term_lists = [self.terms, self.terms_slc]
+        for (source, count), terms in zip(self._stats_sources, term_lists):
+            if source is not None and (source is not terms or len(terms) < count):
+                self._reset_stats()
+                break
+
+        for i, terms in enumerate(term_lists):
+            count = self._stats_sources[i][1]
+            if len(terms) > count:
+                self._add_stats(list(self._monomials(terms[count:])))
+            self._stats_sources[i] = (terms, len(terms))
+
+    @staticmethod
+    def _monomials(terms: Iterable[TermBase]) -> Iterable[Term]:
+        for term in terms:
+            if isinstance(term, SlcTerm):
+                yield from term.terms
+            else:
+                yield term
+
+    def _add_stats(self, monomials: List[Term]):
+        if not monomials:
+            return
+        lengths = numpy.fromiter(
+            (len(term.ids) for term in monomials), dtype=numpy.int64, count=len(monomials)
+        )
+        n_couplers = int(lengths.sum())
+        ids = numpy.fromiter(
+            itertools.chain.from_iterable(term.ids for term in monomials),
+            dtype=numpy.int64,
+            count=n_couplers
+        )
+        self._variables.update(numpy.unique(ids).tolist())
+        try:
+            coefficients = numpy.fromiter(
+                (term.c for term in monomials), dtype=numpy.float64, count=len(monomials)
+            )
+        except (TypeError, ValueError):
+            # Array-valued coefficients
+            coefficients = numpy.concatenate(
+                [numpy.ravel(term.c).astype(numpy.float64) for term in monomials]
+            )
+
+        stats = self._stats
+        self._n_couplers += n_couplers
+        stats["num_variables"] = len(self._variables)
+        stats["num_terms"] += len(monomials)
+        stats["avg_coupling"] = self._n_couplers / stats["num_terms"]
+        stats["max_coupling"] = max(stats["max_coupling"], int(lengths.max()))
+        stats["min_coupling"] = min(stats["min_coupling"], int(lengths.min()))
+        if len(coefficients):
+            min_c, max_c = float(coefficients.min()), float(coefficients.max())
+            if stats["min_coefficient"] is None or min_c < stats["min_coefficient"]:
+                stats["min_coefficient"] = min_c
+            if stats["max_coefficient"] is None or max_c > stats["max_coefficient"]:
+                stats["max_coefficient"] = max_c
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Statistics of the problem terms: number of distinct variables,
+        number of monomial terms (counting each term of a squared linear
+        combination), minimum, maximum and average number of variables per
+        monomial term and range of the monomial coefficients.
+
+        Statistics are maintained incrementally as terms are added to the
+        problem, so that only the new terms are processed when they are
+        read. Terms modified in place are not taken into account.
+        """
+        self._update_stats()
+        return {"type": self.problem_type.name, **self._stats}
+
     def is_large(self) -> bool:
         """Determines if the current problem is large.
         "large" is an arbitrary threshold and can be easily changed.
@@ -526,22 +684,10 @@ class Problem:
         large problem to be NUM_VARIABLES_LARGE+
         variables AND NUM_TERMS_LARGE+ terms.
         """
-
-        set_vars = set()
-        total_term_count = 0
-        for terms in [self.terms, self.terms_slc]:
-            for term in terms:
-                if isinstance(term, Term):
-                    set_vars.update(term.ids)
-                    total_term_count += 1
-                elif isinstance(term, SlcTerm):
-                    for subterm in term.terms:
-                        set_vars.update(subterm.ids)
-                        total_term_count += 1
-        
+        self._update_stats()
         return (
-            len(set_vars) >= Problem.NUM_VARIABLES_LARGE
-            and total_term_count >= Problem.NUM_TERMS_LARGE
+            self._stats["num_variables"] >= Problem.NUM_VARIABLES_LARGE
+            and self._stats["num_terms"] >= Problem.NUM_TERMS_LARGE
         )
 
     def download(self, workspace: "Workspace"):
@@ -550,13 +696,14 @@ class Problem:
             raise Exception("Problem may not be downloaded before it is uploaded")
         blob_client = BlobClient.from_blob_url(self.uploaded_blob_uri)
         container_client = ContainerClient.from_container_url(
-            workspace._get_linked_storage_sas_uri(blob_client.container_name)
+            workspace._get_linked_storage_sas_uri(blob_client.container_name),
+            transport=workspace._transport
         )
         blob_name = blob_client.blob_name
         blob = container_client.get_blob_client(blob_name)
-        contents = download_blob(blob.url)
-        blob_properties = download_blob_properties(blob.url)        
-        content_type = blob_properties.content_type
+        contents = download_blob(blob.url, transport=workspace._transport)
+        blob_properties = download_blob_properties(blob.url, transport=workspace._transport)
+        content_type = blob_properties.content_settings.content_type
         return Problem.deserialize(contents, self.name, content_type)
 
     def get_terms(self, id: int) -> List[TermBase]:
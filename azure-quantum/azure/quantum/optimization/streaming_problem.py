@@ -14,6 +14,7 @@ import sys
 from typing import List, Union, Dict, Optional
 from azure.quantum import Workspace
 from azure.quantum.optimization import Term, Problem, ProblemType
+from azure.quantum.instrumentation import count, span
 from azure.quantum.storage import (
     StreamedBlob,
     ContainerClient,
@@ -104,19 +105,20 @@ class StreamingProblem(object):
             container_client = ContainerClient.from_container_url(
                 self.workspace._get_linked_storage_sas_uri(
                     blob_client.container_name
-                )
+                ),
+                transport=self.workspace._transport
             )
             blob_name = blob_client.blob_name
         elif not self.workspace.storage:
             # No storage account is passed, use the linked one
             container_uri = self.workspace._get_linked_storage_sas_uri(self.id)
             container_client = ContainerClient.from_container_url(
-                container_uri
+                container_uri, transport=self.workspace._transport
             )
         else:
             # Use the specified storage account
             container_client = ContainerClient.from_connection_string(
-                self.workspace.storage, self.id
+                self.workspace.storage, self.id, transport=self.workspace._transport
             )
 
         return {"blob_name": blob_name, "container_client": container_client}
@@ -183,7 +185,7 @@ class StreamingProblem(object):
 
         coords = self._get_upload_coords()
         blob = coords["container_client"].get_blob_client(coords["blob_name"])
-        contents = download_blob(blob.url)
+        contents = download_blob(blob.url, transport=self.workspace._transport)
         return Problem.deserialize(contents, self.name)
 
     def upload(
@@ -285,29 +287,30 @@ class JsonStreamingProblemUploader:
         return not self.__thread.is_alive()
 
     def _run_queue(self):
-        continue_processing = True
-        terms = []
-        while continue_processing:
-            try:
-                new_terms = self.problem.terms_queue.get(
-                    block=True, timeout=self.__queue_wait_timeout
-                )
-                if new_terms is None:
-                    continue_processing = False
-                else:
-                    terms = terms + new_terms
-                    if len(terms) < self.__upload_terms_threshold:
-                        continue
-            except Empty:
-                pass
-            except Exception as e:
-                raise e
-
-            if len(terms) > 0:
-                self._upload_next(terms)
-                terms = []
-
-        self._finish_upload()
+        with span("streaming_problem.upload"):
+            continue_processing = True
+            terms = []
+            while continue_processing:
+                try:
+                    new_terms = self.problem.terms_queue.get(
+                        block=True, timeout=self.__queue_wait_timeout
+                    )
+                    if new_terms is None:
+                        continue_processing = False
+                    else:
+                        terms = terms + new_terms
+                        if len(terms) < self.__upload_terms_threshold:
+                            continue
+                except Empty:
+                    pass
+                except Exception as e:
+                    raise e
+
+                if len(terms) > 0:
+                    self._upload_next(terms)
+                    terms = []
+
+            self._finish_upload()
 
     def _upload_start(self, terms):
         self.started_upload = True
@@ -375,15 +378,21 @@ class JsonStreamingProblemUploader:
         return compressed
 
     def _upload_chunk(self, chunk: str, is_final: bool = False):
-        compressed = self._maybe_compress_bits(chunk.encode(), is_final)
+        data = chunk.encode()
+        count("streaming_problem.bytes", len(data))
+        with span("streaming_problem.compress"):
+            compressed = self._maybe_compress_bits(data, is_final)
         if compressed is None:
             return
         if len(compressed) > 0:
-            self.blob.upload_data(compressed)
+            with span("streaming_problem.upload_block", bytes=len(compressed)):
+                self.blob.upload_data(compressed)
+            count("streaming_problem.compressed_bytes", len(compressed))
 
     def _finish_upload(self):
         if not self.started_upload:
             self._upload_start([])
 
         self._upload_chunk(f'{"]}}"}', True)
-        self.blob.commit(metadata=self.blob_properties)
+        with span("streaming_problem.commit", blocks=len(self.blob.blocks)):
+            self.blob.commit(metadata=self.blob_properties)
@@ -8,9 +8,11 @@ import json
 import logging
 logger = logging.getLogger(__name__)
 
-from typing import TYPE_CHECKING, Union, List
+from typing import TYPE_CHECKING, Optional, Union, List
+from azure.quantum import Job
 from azure.quantum.version import __version__
 from azure.quantum.qiskit.job import AzureQuantumJob
+from azure.quantum.translation import TranslationCache, TranslationPool, LazyText, submit_jobs
 
 try:
     from qiskit import QuantumCircuit, transpile
@@ -23,10 +25,82 @@ except ImportError:
 To install run: pip install azure-quantum[qiskit]"
 )
 
+# Default number of circuits of a multi-experiment job that are translated and submitted at the same time
+DEFAULT_MAX_PARALLEL_SUBMISSIONS = 8
+
+
+def translate_qir(circuit, basis_gates, capability, skip_transpile, to_qir_kwargs):
+    """ Transpiles the circuit to the given basis gates, unless skipped, and returns its QIR bitcode.
+    This is a module-level function so that it can run on the worker processes of a TranslationPool. """
+    from qiskit_qir import to_qir_bitcode, to_qir
+
+    if not skip_transpile:
+        circuit = transpile(circuit, basis_gates=basis_gates, optimization_level=0)
+
+    # The QIR text is only built if the debug message is actually emitted.
+    logger.debug("QIR:\n%s", LazyText(lambda: to_qir(circuit, capability, **to_qir_kwargs)))
+
+    emit_barrier_calls = "barrier" in basis_gates
+    return bytes(to_qir_bitcode(circuit, capability, emit_barrier_calls=emit_barrier_calls, **to_qir_kwargs))
+
+
+def _circuit_structure(circuit, basis_gates):
+    """ Returns a hashable description of everything in the circuit that affects its QIR translation.
+    The definitions of gates that are not part of the basis are included, as transpilation unrolls them.
+    The circuit name is left out on purpose: qiskit renames every copy made by ``bind_parameters``, and
+    the name only ends up as the QIR module's source file name. """
+    qubits = {bit: index for index, bit in enumerate(circuit.qubits)}
+    clbits = {bit: index for index, bit in enumerate(circuit.clbits)}
+
+    instructions = []
+    for instruction, qargs, cargs in circuit.data:
+        condition = getattr(instruction, "condition", None)
+        if condition is not None:
+            target, value = condition
+            condition = (getattr(target, "name", None) or clbits.get(target), value)
+
+        definition = None
+        if instruction.name not in basis_gates and getattr(instruction, "definition", None) is not None:
+            definition = _circuit_structure(instruction.definition, basis_gates)
+
+        instructions.append((
+            instruction.name,
+            tuple(str(param) for param in instruction.params),
+            tuple(qubits[qubit] for qubit in qargs),
+            tuple(clbits[clbit] for clbit in cargs),
+            condition,
+            definition,
+        ))
+
+    return (
+        tuple((register.name, register.size) for register in circuit.qregs),
+        tuple((register.name, register.size) for register in circuit.cregs),
+        circuit.num_qubits,
+        circuit.num_clbits,
+        tuple(instructions),
+    )
+
+
 class AzureBackend(Backend):
     """Base class for interfacing with an IonQ backend in Azure Quantum"""
     backend_name = None
 
+    # Cache of QIR translations shared by all backends, set to None to disable caching.
+    translation_cache = TranslationCache.from_env()
+
+    # Incremented whenever a subclass is defined, at any depth, so that
+    # AzureQuantumProvider knows when to rebuild its map of backend classes
+    _subclass_generation = 0
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        AzureBackend._subclass_generation += 1
+
+    @property
+    def _translation_pool(self) -> Optional[TranslationPool]:
+        """ The pool QIR translations run on, as configured on the provider. """
+        return getattr(self.provider(), "translation_pool", None)
+
     def _prepare_job_metadata(self, circuit):
         """ Returns the metadata relative to the given circuit that will be attached to the Job"""
         return {
@@ -43,14 +117,9 @@ class AzureBackend(Backend):
             raise ValueError(f"{data_format} is not a supported data format for target {target}.")
 
         logger.info(f"Using QIR as the job's payload format.")
-        from qiskit_qir import to_qir_bitcode, to_qir
-
 
         capability = input_params["targetCapability"] if "targetCapability" in input_params else "AdaptiveExecution"
 
-        if logger.isEnabledFor(logging.DEBUG):
-            logger.debug(f"QIR:\n{to_qir(circuit, capability, **to_qir_kwargs)}")
-
         # all qir payload needs to define an entryPoint and arguments:
         if not "entryPoint" in input_params:
             input_params["entryPoint"] = "main"
@@ -58,54 +127,80 @@ class AzureBackend(Backend):
             input_params["arguments"] = []
 
         # We'll transpile automatically to the supported gates in QIR unless explicitly skipped.
-        if not input_params.get("skipTranspile", False):
-            # Set of gates supported by QIR targets.
-            config = self.configuration()
-            circuit = transpile(circuit, basis_gates=config.basis_gates, optimization_level=0)
-
-            # We'll only log the QIR again if we performed a transpilation.
-            if logger.isEnabledFor(logging.DEBUG):
-                logger.debug(f"QIR (Post-transpilation):\n{to_qir(circuit, capability, **to_qir_kwargs)}")
-        emit_barrier_calls = "barrier" in config.basis_gates
-        qir = bytes(to_qir_bitcode(circuit, capability, emit_barrier_calls=emit_barrier_calls, **to_qir_kwargs))
+        skip_transpile = input_params.get("skipTranspile", False)
+        config = self.configuration()
+
+        def translate():
+            args = (circuit, config.basis_gates, capability, skip_transpile, to_qir_kwargs)
+            if self._translation_pool is None:
+                return translate_qir(*args)
+            return self._translation_pool.translate(translate_qir, *args)
+
+        if self.translation_cache is None:
+            qir = translate()
+        else:
+            key = TranslationCache.make_key(
+                "qir.v1",
+                _circuit_structure(circuit, config.basis_gates),
+                tuple(config.basis_gates),
+                capability,
+                skip_transpile,
+                sorted(to_qir_kwargs.items()),
+            )
+            qir = self.translation_cache.get_or_translate(key, translate)
+
         return (qir, data_format, input_params)
 
     def run(self, circuit, **kwargs):
-        """Submits the given circuit to run on an Azure Quantum backend."""        
+        """Submits the given circuit to run on an Azure Quantum backend.
 
+        A list of circuits is run as a multi-experiment job: the circuits are
+        translated and submitted concurrently, one Azure Quantum job per circuit,
+        and the returned job's result contains one experiment per circuit.
+        The number of concurrent submissions can be set with ``max_parallel_submissions``.
+        If the provider has a ``translation_pool``, QIR translations run on its worker
+        processes while other circuits are being uploaded.
+        """
         # Some Qiskit features require passing lists of circuits, so unpack those here.
-        # We currently only support single-experiment jobs.
-        if isinstance(circuit, (list, tuple)):
-            if len(circuit) > 1:
-                raise NotImplementedError("Multi-experiment jobs are not supported!")
-            circuit = circuit[0]
+        circuits = list(circuit) if isinstance(circuit, (list, tuple)) else [circuit]
 
-        # If the circuit was created using qiskit.assemble,
+        # If a circuit was created using qiskit.assemble,
         # disassemble into QASM here
-        if isinstance(circuit, QasmQobj) or isinstance(circuit, Qobj):
-            from qiskit.assembler import disassemble
-            circuits, run, _ = disassemble(circuit)
-            circuit = circuits[0]
-            if kwargs.get("shots") is None:
-                # Note that the default number of shots for QObj is 1024
-                # unless the user specifies the backend.
-                kwargs["shots"] = run["shots"]
-        
+        experiments = []
+        for circuit in circuits:
+            if isinstance(circuit, QasmQobj) or isinstance(circuit, Qobj):
+                from qiskit.assembler import disassemble
+                disassembled, run, _ = disassemble(circuit)
+                experiments.extend(disassembled)
+                if kwargs.get("shots") is None:
+                    # Note that the default number of shots for QObj is 1024
+                    # unless the user specifies the backend.
+                    kwargs["shots"] = run["shots"]
+            else:
+                experiments.append(circuit)
+
+        if len(experiments) == 0:
+            raise ValueError("No circuits were given to run.")
+
+        max_parallel_submissions = kwargs.pop("max_parallel_submissions", DEFAULT_MAX_PARALLEL_SUBMISSIONS)
+
         # The default of these job parameters come from the AzureBackend configuration:
         config = self.configuration()
-        blob_name = kwargs.pop("blob_name", config.azure["blob_name"])
-        content_type = kwargs.pop("content_type", config.azure["content_type"])
-        provider_id = kwargs.pop("provider_id", config.azure["provider_id"])
-        input_data_format = kwargs.pop("input_data_format", config.azure["input_data_format"])
-        output_data_format = kwargs.pop("output_data_format", config.azure["output_data_format"])
+        job_params = {
+            "blob_name": kwargs.pop("blob_name", config.azure["blob_name"]),
+            "content_type": kwargs.pop("content_type", config.azure["content_type"]),
+            "provider_id": kwargs.pop("provider_id", config.azure["provider_id"]),
+            "input_data_format": kwargs.pop("input_data_format", config.azure["input_data_format"]),
+            "output_data_format": kwargs.pop("output_data_format", config.azure["output_data_format"]),
+        }
 
         # Override QIR translation parameters
         to_qir_kwargs = config.azure.get("to_qir_kwargs", {})
 
         # If not provided as kwargs, the values of these parameters 
-        # are calculated from the circuit itself:
-        job_name = kwargs.pop("job_name", circuit.name)
-        metadata = kwargs.pop("metadata") if "metadata" in kwargs else self._prepare_job_metadata(circuit)
+        # are calculated from each circuit:
+        job_name = kwargs.pop("job_name", None)
+        metadata = kwargs.pop("metadata", None)
 
         # Backend options are mapped to input_params.
         input_params = vars(self.options).copy()
@@ -133,29 +228,46 @@ class AzureBackend(Backend):
         input_params["count"] = shots_count
         input_params["shots"] = shots_count
 
-        # translate
-        (input_data, input_data_format, input_params) = self._translate_input(circuit, input_data_format, input_params, to_qir_kwargs)
-
-        logger.info(f"Submitting new job for backend {self.name()}")
-        job = AzureQuantumJob(
-            backend=self,
-            target=self.name(),
-            name=job_name,
-            input_data=input_data,
-            blob_name=blob_name,
-            content_type=content_type,
-            provider_id=provider_id,
-            input_data_format=input_data_format,
-            output_data_format=output_data_format,
-            input_params = input_params,
-            metadata=metadata,
-            **kwargs
-        )
-
-        logger.info(f"Submitted job with id '{job.id()}' for circuit '{circuit.name}' with shot count of {shots_count}:")
-        logger.info(input_data)
-
-        return job
+        def job_arguments(circuit):
+            """ Translates a single circuit into the arguments of its Azure Quantum job. """
+            (input_data, input_data_format, circuit_input_params) = self._translate_input(
+                circuit, job_params["input_data_format"], input_params.copy(), to_qir_kwargs
+            )
+            return {
+                **job_params,
+                "target": self.name(),
+                "name": job_name if job_name is not None else circuit.name,
+                "input_data": input_data,
+                "input_data_format": input_data_format,
+                "input_params": circuit_input_params,
+                "metadata": metadata if metadata is not None else self._prepare_job_metadata(circuit),
+                **kwargs
+            }
+
+        if len(experiments) == 1:
+            circuit = experiments[0]
+            arguments = job_arguments(circuit)
+
+            logger.info(f"Submitting new job for backend {self.name()}")
+            job = AzureQuantumJob(backend=self, **arguments)
+
+            logger.info(f"Submitted job with id '{job.id()}' for circuit '{circuit.name}' with shot count of {shots_count}:")
+            logger.info(arguments["input_data"])
+
+            return job
+
+        workspace = self.provider().get_workspace()
+
+        def submit(circuit):
+            azure_job = Job.from_input_data(workspace=workspace, **job_arguments(circuit))
+            logger.info(f"Submitted job with id '{azure_job.id}' for circuit '{circuit.name}' with shot count of {shots_count}.")
+            return azure_job
+
+        logger.info(f"Submitting {len(experiments)} new jobs for backend {self.name()}")
+        # If a submission fails, the jobs of the other circuits are cancelled
+        azure_jobs = submit_jobs(submit, experiments, max_parallel_submissions, workspace.cancel_job)
+
+        return AzureQuantumJob(backend=self, azure_job=azure_jobs)
 
     def retrieve_job(self, job_id) -> AzureQuantumJob:
         """ Returns the Job instance associated with the given id."""
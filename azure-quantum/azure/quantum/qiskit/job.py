@@ -2,7 +2,6 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 ##
-from collections import defaultdict
 import numpy as np
 
 try:
@@ -17,8 +16,10 @@ To install run: pip install azure-quantum[qiskit]"
 import ast
 import json
 import re
+import time
 from azure.quantum import Job
 from azure.quantum.qiskit.results.resource_estimator import ResourceEstimatorResult
+from azure.quantum.qiskit.results import histogram
 
 import logging
 logger = logging.getLogger(__name__)
@@ -38,6 +39,19 @@ IONQ_OUTPUT_DATA_FORMAT = "ionq.quantum-results.v1"
 QUANTINUUM_OUTPUT_DATA_FORMAT = "honeywell.quantum-results.v1"
 RESOURCE_ESTIMATOR_OUTPUT_DATA_FORMAT = "microsoft.resource-estimates.v1"
 
+# Separates the ids of the Azure Quantum jobs backing a multi-experiment job:
+JOB_ID_SEPARATOR = ","
+
+# Order in which the statuses of a multi-experiment job's Azure Quantum jobs
+# determine the status of the job as a whole:
+JOB_STATUS_PRECEDENCE = [
+    JobStatus.ERROR,
+    JobStatus.CANCELLED,
+    JobStatus.QUEUED,
+    JobStatus.RUNNING,
+    JobStatus.DONE,
+]
+
 class AzureQuantumJob(JobV1):
     def __init__(
         self,
@@ -47,6 +61,10 @@ class AzureQuantumJob(JobV1):
     ) -> None:
         """
             A Job running on Azure Quantum
+
+            A multi-experiment job is backed by one Azure Quantum job per
+            experiment; in that case ``azure_job`` is the list of those jobs
+            and the job id is their ids joined by ``JOB_ID_SEPARATOR``.
         """
         if azure_job is None:
             azure_job = Job.from_input_data(
@@ -54,43 +72,53 @@ class AzureQuantumJob(JobV1):
                 **kwargs
             )
 
-        self._azure_job = azure_job
+        self._azure_jobs = list(azure_job) if isinstance(azure_job, (list, tuple)) else [azure_job]
+        self._azure_job = self._azure_jobs[0]
         self._workspace = backend.provider().get_workspace()
 
-        super().__init__(backend, self._azure_job.id, **kwargs)
+        super().__init__(backend, self.id(), **kwargs)
 
     def job_id(self):
         """ This job's id."""
-        return self._azure_job.id
+        return self.id()
 
     def id(self):
         """ This job's id."""
-        return self._azure_job.id
+        return JOB_ID_SEPARATOR.join(azure_job.id for azure_job in self._azure_jobs)
 
     def refresh(self):
         """ Refreshes the job metadata from the server."""
-        return self._azure_job.refresh()
+        for azure_job in self._azure_jobs:
+            azure_job.refresh()
 
     def submit(self):
         """ Submits the job for execution. """
-        self._azure_job.submit()
+        for azure_job in self._azure_jobs:
+            azure_job.submit()
         return
 
     def result(self, timeout=None, sampler_seed=None):
-        """Return the results of the job."""
-        self._azure_job.wait_until_completed(timeout_secs=timeout)
-
-        success = self._azure_job.details.status == "Succeeded"
-        results = self._format_results(sampler_seed=sampler_seed)
+        """Return the results of the job, with one experiment result per Azure Quantum job."""
+        deadline = None if timeout is None else time.time() + timeout
+        for azure_job in self._azure_jobs:
+            remaining = None if deadline is None else max(deadline - time.time(), 0)
+            azure_job.wait_until_completed(timeout_secs=remaining)
+
+        success = all(azure_job.details.status == "Succeeded" for azure_job in self._azure_jobs)
+        results = [
+            self._format_results(sampler_seed=sampler_seed, azure_job=azure_job)
+            for azure_job in self._azure_jobs
+        ]
+        failed = [azure_job for azure_job in self._azure_jobs if azure_job.details.error_data is not None]
 
         result_dict = {
-            "results" : [results],
-            "job_id" : self._azure_job.details.id,
+            "results" : results,
+            "job_id" : self.id(),
             "backend_name" : self._backend.name(),
             "backend_version" : self._backend.version,
             "qobj_id" : self._azure_job.details.name,
             "success" : success,
-            "error_data" : None if self._azure_job.details.error_data is None else self._azure_job.details.error_data.as_dict()
+            "error_data" : None if not failed else failed[0].details.error_data.as_dict()
         }
 
         result_type = Result
@@ -101,21 +129,32 @@ class AzureQuantumJob(JobV1):
 
     def cancel(self):
         """Attempt to cancel the job."""
-        self._workspace.cancel_job(self._azure_job)
+        for azure_job in self._azure_jobs:
+            self._workspace.cancel_job(azure_job)
 
     def status(self):
-        """Return the status of the job, among the values of ``JobStatus``."""
-        self._azure_job.refresh()
-        status = AzureJobStatusMap[self._azure_job.details.status]
-        return status
+        """Return the status of the job, among the values of ``JobStatus``.
+
+        For a multi-experiment job, the least advanced status across its
+        Azure Quantum jobs is returned, with failures taking precedence.
+        """
+        statuses = set()
+        for azure_job in self._azure_jobs:
+            azure_job.refresh()
+            statuses.add(AzureJobStatusMap[azure_job.details.status])
+
+        for status in JOB_STATUS_PRECEDENCE:
+            if status in statuses:
+                return status
 
     def queue_position(self):
         """Return the position of the job in the queue. Currently not supported."""
         return None
 
-    def _shots_count(self):
+    def _shots_count(self, azure_job=None):
+        azure_job = azure_job or self._azure_job
         # Some providers use 'count', some other 'shots', give preference to 'count':
-        input_params = self._azure_job.details.input_params
+        input_params = azure_job.details.input_params
         options = self.backend().options
         shots = \
             input_params["count"] if "count" in input_params else \
@@ -125,9 +164,10 @@ class AzureQuantumJob(JobV1):
 
         return shots
 
-    def _format_results(self, sampler_seed=None):
+    def _format_results(self, sampler_seed=None, azure_job=None):
         """ Populates the results datastructures in a format that is compatible with qiskit libraries. """
-        success = self._azure_job.details.status == "Succeeded"
+        azure_job = azure_job or self._azure_job
+        success = azure_job.details.status == "Succeeded"
 
         job_result = {
             "data": {},
@@ -136,27 +176,28 @@ class AzureQuantumJob(JobV1):
         }
 
         if success:
-            is_simulator = "sim" in self._azure_job.details.target
-            if (self._azure_job.details.output_data_format == MICROSOFT_OUTPUT_DATA_FORMAT):
-                job_result["data"] = self._format_microsoft_results(sampler_seed=sampler_seed)
+            is_simulator = "sim" in azure_job.details.target
+            if (azure_job.details.output_data_format == MICROSOFT_OUTPUT_DATA_FORMAT):
+                job_result["data"] = self._format_microsoft_results(sampler_seed=sampler_seed, azure_job=azure_job)
                 
-            elif (self._azure_job.details.output_data_format == IONQ_OUTPUT_DATA_FORMAT):
-                job_result["data"] = self._format_ionq_results(sampler_seed=sampler_seed)
+            elif (azure_job.details.output_data_format == IONQ_OUTPUT_DATA_FORMAT):
+                job_result["data"] = self._format_ionq_results(sampler_seed=sampler_seed, azure_job=azure_job)
 
-            elif (self._azure_job.details.output_data_format == QUANTINUUM_OUTPUT_DATA_FORMAT):
-                job_result["data"] = self._format_quantinuum_results()
+            elif (azure_job.details.output_data_format == QUANTINUUM_OUTPUT_DATA_FORMAT):
+                job_result["data"] = self._format_quantinuum_results(azure_job=azure_job)
 
             else:
-                job_result["data"] = self._format_unknown_results()
+                job_result["data"] = self._format_unknown_results(azure_job=azure_job)
 
-        job_result["header"] = self._azure_job.details.metadata
+        job_result["header"] = azure_job.details.metadata
         if "metadata" in job_result["header"]:
             job_result["header"]["metadata"] = json.loads(job_result["header"]["metadata"])
 
-        job_result["shots"] = self._shots_count()
+        job_result["shots"] = self._shots_count(azure_job=azure_job)
         return job_result
 
-    def _draw_random_sample(self, sampler_seed, probabilities, shots):
+    def _draw_random_sample(self, sampler_seed, probabilities, shots, azure_job=None):
+        azure_job = azure_job or self._azure_job
         _norm = sum(probabilities.values())
         if _norm != 1:
             if np.isclose(_norm, 1.0, rtol=1e-4):
@@ -165,11 +206,10 @@ class AzureQuantumJob(JobV1):
                 raise ValueError(f"Probabilities do not add up to 1: {probabilities}")
         if not sampler_seed:
             import hashlib
-            id = self.job_id()
+            id = azure_job.id
             sampler_seed = int(hashlib.sha256(id.encode('utf-8')).hexdigest(), 16) % (2**32 - 1)
         rand = np.random.RandomState(sampler_seed)
-        rand_values = rand.choice(list(probabilities.keys()), shots, p=list(probabilities.values()))
-        return dict(zip(*np.unique(rand_values, return_counts=True)))
+        return histogram.sample_counts(probabilities, shots, rand)
 
     @staticmethod
     def _to_bitstring(k, num_qubits, meas_map):
@@ -178,30 +218,32 @@ class AzureQuantumJob(JobV1):
         # flip bitstring to convert back to big Endian
         return "".join([bitstring[n] for n in meas_map])[::-1]
 
-    def _format_ionq_results(self, sampler_seed=None):
+    def _format_ionq_results(self, sampler_seed=None, azure_job=None):
         """ Translate IonQ's histogram data into a format that can be consumed by qiskit libraries. """
-        az_result = self._azure_job.get_results()
-        shots = self._shots_count()
+        azure_job = azure_job or self._azure_job
+        az_result = azure_job.get_results()
+        shots = self._shots_count(azure_job=azure_job)
 
-        if "num_qubits" not in self._azure_job.details.metadata:
-            raise ValueError(f"Job with ID {self.id()} does not have the required metadata (num_qubits) to format IonQ results.")
+        if "num_qubits" not in azure_job.details.metadata:
+            raise ValueError(f"Job with ID {azure_job.id} does not have the required metadata (num_qubits) to format IonQ results.")
 
-        meas_map = json.loads(self._azure_job.details.metadata.get("meas_map")) if "meas_map" in self._azure_job.details.metadata else None
-        num_qubits = self._azure_job.details.metadata.get("num_qubits")
+        meas_map = json.loads(azure_job.details.metadata.get("meas_map")) if "meas_map" in azure_job.details.metadata else None
+        num_qubits = azure_job.details.metadata.get("num_qubits")
 
         if not 'histogram' in az_result:
             raise "Histogram missing from IonQ Job results"
 
-        counts = defaultdict(int)
-        probabilities = defaultdict(int)
-        for key, value in az_result['histogram'].items():
-            bitstring = self._to_bitstring(key, num_qubits, meas_map) if meas_map else key
-            probabilities[bitstring] += value
+        probabilities = histogram.ionq_probabilities(
+            az_result['histogram'],
+            num_qubits,
+            meas_map,
+            fallback=lambda key: self._to_bitstring(key, num_qubits, meas_map)
+        )
 
         if self.backend().configuration().simulator:
-            counts = self._draw_random_sample(sampler_seed, probabilities, shots)
+            counts = self._draw_random_sample(sampler_seed, probabilities, shots, azure_job=azure_job)
         else:
-            counts = {bitstring: np.round(shots * value) for bitstring, value in probabilities.items()}
+            counts = histogram.expected_counts(probabilities, shots)
 
         return {"counts": counts, "probabilities": probabilities}
 
@@ -222,55 +264,50 @@ class AzureQuantumJob(JobV1):
         else:
             return str(obj)
 
-    def _format_microsoft_results(self, sampler_seed=None):
+    def _format_microsoft_results(self, sampler_seed=None, azure_job=None):
         """ Translate Microsoft's job results histogram into a format that can be consumed by qiskit libraries. """
-        az_result = self._azure_job.get_results()
-        shots = self._shots_count()
+        azure_job = azure_job or self._azure_job
+        az_result = azure_job.get_results()
+        shots = self._shots_count(azure_job=azure_job)
 
         if not 'Histogram' in az_result:
             raise "Histogram missing from Job results"
 
-        histogram = az_result['Histogram']
-        counts = {}
-        probabilities = {}
+        az_histogram = az_result['Histogram']
         # The Histogram serialization is odd entries are key and even entries values
         # Make sure we have even entries
-        if (len(histogram) % 2) == 0:
-            items = range(0, len(histogram), 2)
-            for i in items:
-                bitstring = AzureQuantumJob._qir_to_qiskit_bitstring(histogram[i])
-
-                value = histogram[i + 1]
-                probabilities[bitstring] = value
+        if (len(az_histogram) % 2) == 0:
+            probabilities = histogram.microsoft_probabilities(
+                az_histogram,
+                fallback=AzureQuantumJob._qir_to_qiskit_bitstring
+            )
         else:
             raise "Invalid number of items in Job results' histogram."
 
         if self.backend().configuration().simulator:
-            counts = self._draw_random_sample(sampler_seed, probabilities, shots)
+            counts = self._draw_random_sample(sampler_seed, probabilities, shots, azure_job=azure_job)
         else:
-            counts = {bitstring: np.round(shots * value) for bitstring, value in probabilities.items()}
+            counts = histogram.expected_counts(probabilities, shots)
 
         return {"counts": counts, "probabilities": probabilities}
     
-    def _format_quantinuum_results(self):
+    def _format_quantinuum_results(self, azure_job=None):
         """ Translate Quantinuum's histogram data into a format that can be consumed by qiskit libraries. """
-        az_result = self._azure_job.get_results()
+        azure_job = azure_job or self._azure_job
+        az_result = azure_job.get_results()
         all_bitstrings = [
             bitstrings for classical_register, bitstrings 
             in az_result.items() if classical_register != "access_token"
         ]
-        counts = {}
-        combined_bitstrings = ["".join(bitstrings) for bitstrings in zip(*all_bitstrings)]
-        shots = len(combined_bitstrings)
-
-        for bitstring in set(combined_bitstrings):
-            counts[bitstring] = combined_bitstrings.count(bitstring)
+        counts = histogram.shot_counts(all_bitstrings)
+        shots = sum(counts.values())
 
-        histogram = {bitstring: count/shots for bitstring, count in counts.items()}
+        probabilities = {bitstring: count/shots for bitstring, count in counts.items()}
 
-        return {"counts": counts, "probabilities": histogram}
+        return {"counts": counts, "probabilities": probabilities}
 
-    def _format_unknown_results(self):
+    def _format_unknown_results(self, azure_job=None):
         """ This method is called to format Job results data when the job output is in an unknown format."""
-        az_result = self._azure_job.get_results()
+        azure_job = azure_job or self._azure_job
+        az_result = azure_job.get_results()
         return az_result
@@ -13,15 +13,27 @@ To install run: pip install azure-quantum[qiskit]"
 
 from typing import Dict, Iterable
 from azure.quantum import Workspace
+from azure.quantum.translation import TranslationPool
 
-from azure.quantum.qiskit.job import AzureQuantumJob
+from azure.quantum.qiskit.job import AzureQuantumJob, JOB_ID_SEPARATOR
 from azure.quantum.qiskit.backends import *
+from azure.quantum.qiskit.backends.backend import AzureBackend
 
 QISKIT_USER_AGENT = "azure-quantum-qiskit"
 
 
 class AzureQuantumProvider(Provider):
-    def __init__(self, workspace=None, **kwargs):
+    # Backend classes by name, memoized by _get_backend_classes
+    _backend_classes = ((), {})
+
+    def __init__(self, workspace=None, translation_pool: TranslationPool = None, **kwargs):
+        """AzureQuantumProvider class
+
+        :param workspace: Azure Quantum workspace. If missing it will create a new Workspace passing `kwargs` to the constructor. Defaults to None.
+        :type workspace: Workspace, optional
+        :param translation_pool: Pool of worker processes to translate circuits on, defaults to translating on the caller's thread.
+        :type translation_pool: TranslationPool, optional
+        """
         self._backends = None
         if workspace is None:
             workspace = Workspace(**kwargs)
@@ -29,6 +41,7 @@ class AzureQuantumProvider(Provider):
         workspace.append_user_agent(QISKIT_USER_AGENT)
 
         self._workspace = workspace
+        self.translation_pool = translation_pool
 
     def get_workspace(self) -> Workspace:
         return self._workspace
@@ -40,6 +53,25 @@ class AzureQuantumProvider(Provider):
             all_subclasses.extend(self._get_all_subclasses(subclass))
         return all_subclasses
 
+    def _get_backend_classes(self) -> Dict[str, type]:
+        """Get all backend classes by backend name, walking the subclasses of
+        Backend only once. The map is rebuilt if subclasses of AzureBackend,
+        at any depth, or new direct subclasses of Backend have been defined
+        since."""
+        from qiskit.providers import BackendV1 as Backend
+
+        version = (
+            AzureBackend._subclass_generation,
+            tuple(Backend.__subclasses__())
+        )
+        if AzureQuantumProvider._backend_classes[0] != version:
+            AzureQuantumProvider._backend_classes = (version, {
+                name: _t for _t in self._get_all_subclasses(Backend)
+                if hasattr(_t, "backend_names")
+                for name in _t.backend_names
+            })
+        return AzureQuantumProvider._backend_classes[1]
+
     def get_backend(self, name=None, **kwargs):
         """
         Return a single backend matching the specified filtering.
@@ -67,18 +99,11 @@ see https://aka.ms/AQ/Docs/AddProvider")
         from qiskit.providers import BackendV1 as Backend
         from azure.quantum.qiskit.backends import DEFAULT_TARGETS
 
-        all_targets = {
-            name: _t for t in self._get_all_subclasses(Backend)
-            for _t in [t]
-            if hasattr(_t, "backend_names")
-            for name in _t.backend_names
-        }
-
         target_factory = TargetFactory(
             base_cls=Backend,
             workspace=self._workspace,
             default_targets=DEFAULT_TARGETS,
-            all_targets=all_targets
+            all_targets=self._get_backend_classes()
         )
 
         targets = target_factory.get_targets(
@@ -94,7 +119,11 @@ see https://aka.ms/AQ/Docs/AddProvider")
         return [targets]
 
     def get_job(self, job_id) -> AzureQuantumJob:
-        """ Returns the Job instance associated with the given id."""
-        azure_job = self._workspace.get_job(job_id)
-        backend = self.get_backend(azure_job.details.target)
-        return AzureQuantumJob(backend, azure_job)
+        """ Returns the Job instance associated with the given id.
+
+        The id of a multi-experiment job lists the ids of all its
+        Azure Quantum jobs, separated by ``JOB_ID_SEPARATOR``.
+        """
+        azure_jobs = [self._workspace.get_job(id) for id in job_id.split(JOB_ID_SEPARATOR)]
+        backend = self.get_backend(azure_jobs[0].details.target)
+        return AzureQuantumJob(backend, azure_jobs if len(azure_jobs) > 1 else azure_jobs[0])
@@ -0,0 +1,162 @@
+##
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+##
+"""Vectorized helpers to convert provider histograms into qiskit counts.
+
+Outcomes are kept as integer-packed numpy arrays for as long as possible;
+bitstrings are only produced when building the final dictionaries.
+"""
+import re
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Widest outcome that can be packed into an unsigned 64-bit integer
+MAX_PACKED_WIDTH = 64
+
+_BIT_LIST = re.compile(r"\[[01,\s]*\]")
+_BIT_TUPLE = re.compile(r"\(?\s*\[[01,\s]*\](\s*,\s*\[[01,\s]*\])*\s*,?\s*\)?")
+_REGISTER = re.compile(r"\[([01,\s]*)\]")
+_DROP_SEPARATORS = str.maketrans("", "", ", ")
+
+
+def to_bitstrings(outcomes: np.ndarray, width: int) -> List[str]:
+    """Formats packed outcomes as big endian bitstrings of the given width."""
+    return [format(outcome, f"0{width}b") for outcome in outcomes.tolist()]
+
+
+def remap_bits(outcomes: np.ndarray, meas_map: Sequence[int]) -> np.ndarray:
+    """Builds new packed outcomes whose bit ``i`` is bit ``meas_map[i]`` of the input."""
+    remapped = np.zeros_like(outcomes)
+    one = outcomes.dtype.type(1)
+    for position, qubit in enumerate(meas_map):
+        remapped |= ((outcomes >> outcomes.dtype.type(qubit)) & one) << outcomes.dtype.type(position)
+    return remapped
+
+
+def aggregate(outcomes: np.ndarray, weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Sums the weights of identical outcomes.
+
+    :return: The distinct outcomes and their summed weights
+    """
+    unique, inverse = np.unique(outcomes, return_inverse=True)
+    return unique, np.bincount(inverse.ravel(), weights=weights, minlength=len(unique))
+
+
+def ionq_probabilities(
+    histogram: Dict[str, float],
+    num_qubits: int,
+    meas_map: Optional[Sequence[int]],
+    fallback: Callable[[str], str],
+) -> Dict[str, float]:
+    """Converts an IonQ histogram, keyed by the integer value of the measured
+    qubits, into probabilities keyed by qiskit bitstrings."""
+    if not meas_map:
+        return dict(histogram)
+
+    if int(num_qubits) > MAX_PACKED_WIDTH:
+        probabilities = {}
+        for key, value in histogram.items():
+            bitstring = fallback(key)
+            probabilities[bitstring] = probabilities.get(bitstring, 0) + value
+        return probabilities
+
+    keys = np.fromiter((int(key) for key in histogram), dtype=np.uint64, count=len(histogram))
+    values = np.fromiter(histogram.values(), dtype=np.float64, count=len(histogram))
+    outcomes, probabilities = aggregate(remap_bits(keys, meas_map), values)
+    return dict(zip(to_bitstrings(outcomes, len(meas_map)), probabilities.tolist()))
+
+
+def qir_bitstring(obj, fallback: Callable[[object], str]) -> str:
+    """Converts a single Microsoft histogram key into a qiskit bitstring.
+
+    The common shapes ``"[0, 1]"`` and ``"([0, 1], [1])"`` are converted with
+    string operations; anything else is handed to ``fallback``.
+    """
+    if isinstance(obj, str):
+        if _BIT_LIST.fullmatch(obj):
+            return obj[1:-1].translate(_DROP_SEPARATORS)
+        if _BIT_TUPLE.fullmatch(obj):
+            registers = _REGISTER.findall(obj)
+            return " ".join(register.translate(_DROP_SEPARATORS) for register in reversed(registers))
+    return fallback(obj)
+
+
+def microsoft_probabilities(histogram: List, fallback: Callable[[object], str]) -> Dict[str, float]:
+    """Converts a flattened ``[key, value, key, value, ...]`` histogram into probabilities."""
+    bitstrings = [qir_bitstring(key, fallback) for key in histogram[0::2]]
+    return dict(zip(bitstrings, histogram[1::2]))
+
+
+def _pack_register(bitstrings: List[str]) -> Optional[Tuple[np.ndarray, int]]:
+    """Packs per-shot bitstrings of a single register into integers.
+
+    :return: The packed outcomes and the register width, or None if the
+        bitstrings cannot be packed.
+    """
+    if len(bitstrings) == 0:
+        return np.zeros(0, dtype=np.uint64), 0
+
+    try:
+        raw = np.array(bitstrings, dtype=np.bytes_)
+    except UnicodeEncodeError:
+        return None
+    width = raw.dtype.itemsize
+    if width > MAX_PACKED_WIDTH:
+        return None
+
+    digits = raw.view(np.uint8).reshape(len(bitstrings), width)
+    bits = digits - np.uint8(ord("0"))
+    # Shorter bitstrings are padded with null bytes and other characters
+    # fall outside of {0, 1}: neither can be packed.
+    if (bits > 1).any():
+        return None
+
+    weights = np.left_shift(np.uint64(1), np.arange(width - 1, -1, -1, dtype=np.uint64))
+    return bits.dot(weights), width
+
+
+def shot_counts(registers: List[List[str]]) -> Dict[str, int]:
+    """Counts the combined outcomes of per-shot register bitstrings.
+
+    The combined bitstring of a shot is the concatenation of the register
+    bitstrings, in the order the registers are given.
+    """
+    if len(registers) == 0:
+        return {}
+
+    shots = len(registers[0])
+    combined = np.zeros(shots, dtype=np.uint64)
+    total_width = 0
+    for bitstrings in registers:
+        packed = _pack_register(bitstrings) if len(bitstrings) == shots else None
+        if packed is None or total_width + packed[1] > MAX_PACKED_WIDTH:
+            break
+        outcomes, width = packed
+        combined = (combined << np.uint64(width)) | outcomes
+        total_width += width
+    else:
+        outcomes, counts = np.unique(combined, return_counts=True)
+        return dict(zip(to_bitstrings(outcomes, total_width), counts.tolist()))
+
+    # Irregular or very wide outcomes: count the joined strings instead
+    joined = np.array(["".join(shot) for shot in zip(*registers)])
+    outcomes, counts = np.unique(joined, return_counts=True)
+    return dict(zip(outcomes.tolist(), counts.tolist()))
+
+
+def sample_counts(
+    probabilities: Dict[str, float], shots: int, random_state: np.random.RandomState
+) -> Dict[str, int]:
+    """Draws ``shots`` samples from the given distribution and counts them."""
+    bitstrings = list(probabilities.keys())
+    samples = random_state.choice(len(bitstrings), shots, p=list(probabilities.values()))
+    counts = np.bincount(samples, minlength=len(bitstrings))
+    return {bitstrings[index]: count for index, count in enumerate(counts.tolist()) if count > 0}
+
+
+def expected_counts(probabilities: Dict[str, float], shots: int) -> Dict[str, float]:
+    """Scales probabilities by the number of shots, rounding to the nearest count."""
+    values = np.round(shots * np.fromiter(probabilities.values(), dtype=np.float64, count=len(probabilities)))
+    return dict(zip(probabilities.keys(), values.tolist()))
@@ -5,6 +5,7 @@
 import logging
 from typing import Any, Dict
 from azure.core import exceptions
+from azure.core.pipeline.transport import HttpTransport
 from azure.storage.blob import (
     BlobServiceClient,
     ContainerClient,
@@ -18,17 +19,48 @@ from azure.storage.blob import (
 from datetime import datetime, timedelta
 from enum import Enum
 
+from azure.quantum.instrumentation import InstrumentedRequestsTransport
+
 logger = logging.getLogger(__name__)
 
+# Number of connections kept alive per host by shared transports
+DEFAULT_CONNECTION_POOL_SIZE = 16
+
+
+def create_shared_transport(pool_size: int = DEFAULT_CONNECTION_POOL_SIZE) -> HttpTransport:
+    """
+    Creates an HTTP transport with a pool of keep-alive connections, to be
+    shared by the service and blob clients of a workspace so that they
+    reuse connections instead of opening (and TLS handshaking) new ones.
+    Closing a client does not close the shared connections. The HTTP
+    requests sent through it are counted when instrumentation is enabled,
+    see azure.quantum.instrumentation.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    # Retries are handled by the Azure pipelines, as in RequestsTransport
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=False, redirect=False, raise_on_status=False),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return InstrumentedRequestsTransport(session=session, session_owner=False)
+
+
 
 def create_container(
-    connection_string: str, container_name: str
+    connection_string: str, container_name: str, transport: HttpTransport = None
 ) -> ContainerClient:
     """
     Creates and initialize a container; returns the client needed to access it.
     """
     blob_service_client = BlobServiceClient.from_connection_string(
-        connection_string
+        connection_string, transport=transport
     )
     logger.info(
         f'{"Initializing storage client for account:"}'
@@ -52,12 +84,14 @@ def create_container_using_client(container_client: ContainerClient):
         container_client.create_container()
 
 
-def get_container_uri(connection_string: str, container_name: str) -> str:
+def get_container_uri(
+    connection_string: str, container_name: str, transport: HttpTransport = None
+) -> str:
     """
     Creates and initialize a container;
     returns a URI with a SAS read/write token to access it.
     """
-    container = create_container(connection_string, container_name)
+    container = create_container(connection_string, container_name, transport=transport)
     logger.info(
         f'{"Creating SAS token for container"}'
         + f"'{container_name}' on account: '{container.account_name}'"
@@ -179,11 +213,11 @@ def get_blob_uri_with_sas_token(blob: BlobClient):
     return blob.url + "?" + sas_token
 
 
-def download_blob(blob_url: str) -> Any:
+def download_blob(blob_url: str, transport: HttpTransport = None) -> Any:
     """
     Downloads the given blob from the container.
     """
-    blob_client = BlobClient.from_blob_url(blob_url)
+    blob_client = BlobClient.from_blob_url(blob_url, transport=transport)
     logger.info(
         f"Downloading blob '{blob_client.blob_name}'"
         + f"from container '{blob_client.container_name}'"
@@ -196,9 +230,9 @@ def download_blob(blob_url: str) -> Any:
     return response
 
 
-def download_blob_properties(blob_url: str) -> Dict[str, str]:
+def download_blob_properties(blob_url: str, transport: HttpTransport = None) -> Dict[str, str]:
     """Downloads the blob properties from Azure for the given blob URI"""
-    blob_client = BlobClient.from_blob_url(blob_url)
+    blob_client = BlobClient.from_blob_url(blob_url, transport=transport)
     logger.info(
         f"Downloading blob properties '{blob_client.blob_name}'"
         + f"from container '{blob_client.container_name}'"
@@ -211,15 +245,15 @@ def download_blob_properties(blob_url: str) -> Dict[str, str]:
     return response
 
 
-def download_blob_metadata(blob_url: str) -> Dict[str, str]:
+def download_blob_metadata(blob_url: str, transport: HttpTransport = None) -> Dict[str, str]:
     """Downloads the blob metadata from the
     blob properties in Azure for the given blob URI"""
-    return download_blob_properties(blob_url).metadata
+    return download_blob_properties(blob_url, transport=transport).metadata
 
 
-def set_blob_metadata(blob_url: str, metadata: Dict[str, str]):
+def set_blob_metadata(blob_url: str, metadata: Dict[str, str], transport: HttpTransport = None):
     """Sets the provided dictionary as the metadata on the Azure blob"""
-    blob_client = BlobClient.from_blob_url(blob_url)
+    blob_client = BlobClient.from_blob_url(blob_url, transport=transport)
     logger.info(
         f"Setting blob properties '{blob_client.blob_name}'"
         + f"from container '{blob_client.container_name}' on account:"
@@ -5,12 +5,15 @@
 import io
 import json
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
+
+import numpy as np
 
 from azure.quantum.target.target import Target
 from azure.quantum.job.job import Job
 from azure.quantum.workspace import Workspace
 from azure.quantum._client.models import CostEstimate, UsageEvent
+from azure.quantum.target.qasm import GateCounts
 
 COST_1QUBIT_GATE_MAP = {
     "ionq.simulator" : 0.0,
@@ -39,6 +42,7 @@ def int_to_bitstring(k: int, num_qubits: int, measured_qubit_ids: List[int]):
 
 class IonQ(Target):
     """IonQ target."""
+    currency_code = "USD"
     target_names = (
         "ionq.qpu",
         "ionq.simulator",
@@ -109,6 +113,49 @@ class IonQ(Target):
             **kwargs
         )
 
+    @staticmethod
+    def _gate_counts(circuit: Dict[str, Any]) -> GateCounts:
+        """Counts the one-qubit and two-qubit gates of an IonQ JSON circuit.
+        Multi-controlled gates count as their decomposition into two-qubit gates."""
+        N_1q, N_2q = 0, 0
+        for gate in circuit.get("circuit", []):
+            if "controls" not in gate and "control" not in gate:
+                N_1q += 1
+            else:
+                controls = gate.get("controls")
+                if controls is None or len(controls) == 1:
+                    # Only one control qubit
+                    N_2q += 1
+                else:
+                    # Multiple control qubits
+                    N_2q += 6 * (len(controls) - 2)
+        return GateCounts(N_1q, N_2q, 0)
+
+    def _price(
+        self,
+        N_1q: Union[int, np.ndarray],
+        N_2q: Union[int, np.ndarray],
+        N_m: Union[int, np.ndarray],
+        num_shots: Union[int, np.ndarray],
+        price_1q: float = None,
+        price_2q: float = None,
+        min_price: float = None
+    ) -> np.ndarray:
+        """Applies the pricing formula of this target, element-wise over
+        broadcastable arrays of gate counts and numbers of shots."""
+        # Get the costs for the gates depending on the provider if not specified
+        if price_1q is None:
+            price_1q = COST_1QUBIT_GATE_MAP[self.name]
+
+        if price_2q is None:
+            price_2q = COST_2QUBIT_GATE_MAP[self.name]
+
+        if min_price is None:
+            min_price = MIN_PRICE_MAP[self.name]
+
+        price = (price_1q * np.asarray(N_1q) + price_2q * np.asarray(N_2q)) * np.asarray(num_shots)
+        return np.maximum(price, min_price)
+
     def estimate_cost(
         self,
         circuit: Dict[str, Any],
@@ -152,36 +199,8 @@ class IonQ(Target):
         :param min_price: The minimum price for running a job.
         :type min_price: float, optional
         """
-        def is_1q_gate(gate: Dict[str, Any]):
-            return "controls" not in gate and "control" not in gate
-
-        def is_multi_q_gate(gate):
-            return "controls" in gate or "control" in gate
-
-        def num_2q_gates(gate):
-            controls = gate.get("controls")
-            if controls is None or len(controls) == 1:
-                # Only one control qubit
-                return 1
-            # Multiple control qubits
-            return 6 * (len(controls) - 2)
-
-        # Get the costs for the gates depending on the provider if not specified
-        if price_1q is None:
-            price_1q = COST_1QUBIT_GATE_MAP[self.name]
-
-        if price_2q is None:
-            price_2q = COST_2QUBIT_GATE_MAP[self.name]
-
-        if min_price is None:
-            min_price = MIN_PRICE_MAP[self.name]
-
-        gates = circuit.get("circuit", [])
-        N_1q = sum(map(is_1q_gate, gates))
-        N_2q = sum(map(num_2q_gates, filter(is_multi_q_gate, gates)))
-
-        price = (price_1q * N_1q + price_2q * N_2q) * num_shots
-        price = max(price, min_price)
+        N_1q, N_2q, _ = self._gate_counts(circuit)
+        price = float(self._price(N_1q, N_2q, 0, num_shots, price_1q, price_2q, min_price))
 
         return CostEstimate(
             events = [
@@ -202,6 +221,6 @@ class IonQ(Target):
                     unit_price=0.0
                 )
             ],
-            currency_code="USD",
+            currency_code=self.currency_code,
             estimated_total=price
         )
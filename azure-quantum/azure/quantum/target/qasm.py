@@ -0,0 +1,185 @@
+##
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+##
+"""Lightweight OpenQASM 2.0 gate counting, without building a circuit."""
+import itertools
+import re
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Tuple, Union
+
+__all__ = ["GateCounts", "count_gates"]
+
+_COMMENT = re.compile(r"//[^\n]*")
+_STATEMENT_END = re.compile(r"[;{}]")
+_CONDITION = re.compile(r"^if\s*\([^)]*\)\s*")
+_NAME = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*")
+_REGISTER = re.compile(r"^(?:qreg|creg)\s+([A-Za-z_][A-Za-z0-9_]*)\s*\[\s*(\d+)\s*\]$")
+_ARGUMENT = re.compile(r"^([A-Za-z_][A-Za-z0-9_]*)\s*(\[\s*\d+\s*\])?$")
+
+# Statements that do not apply operations on qubits
+_DECLARATIONS = ("OPENQASM", "include", "creg")
+
+
+class GateCounts(NamedTuple):
+    """Number of one-qubit gates, multi-qubit gates and measurement
+    operations (measurements and resets) applied by a circuit."""
+    one_qubit: int = 0
+    two_qubit: int = 0
+    measurements: int = 0
+
+    def __add__(self, other: "GateCounts") -> "GateCounts":
+        return GateCounts(
+            self.one_qubit + other.one_qubit,
+            self.two_qubit + other.two_qubit,
+            self.measurements + other.measurements,
+        )
+
+    def __mul__(self, times: int) -> "GateCounts":
+        return GateCounts(self.one_qubit * times, self.two_qubit * times, self.measurements * times)
+
+
+def _statements(chunks: Iterable[str]) -> Iterator[Tuple[str, str]]:
+    """Yields the statements of a program, together with the character that
+    terminates each of them (``;``, ``{`` or ``}``), reading it chunk by chunk."""
+    buffer = ""
+    for chunk in itertools.chain(chunks, [None]):
+        if chunk is None:
+            text, buffer = _COMMENT.sub("", buffer), ""
+        else:
+            # Only strip comments that are complete, i.e. followed by a new line
+            buffer += chunk
+            end_of_lines = buffer.rfind("\n") + 1
+            text, buffer = _COMMENT.sub("", buffer[:end_of_lines]), buffer[end_of_lines:]
+        start = 0
+        for match in _STATEMENT_END.finditer(text):
+            yield text[start:match.start()].strip(), match.group()
+            start = match.end()
+        buffer = text[start:] + buffer
+
+    if buffer.strip():
+        raise ValueError(f"Unterminated OpenQASM statement: '{buffer.strip()}'")
+
+
+def _keyword(statement: str) -> str:
+    """Returns the first identifier of a statement, e.g. ``measure``."""
+    match = _NAME.match(statement)
+    return match.group() if match else ""
+
+
+def _split_call(statement: str) -> Tuple[str, List[str]]:
+    """Splits an operation into its name and its (qubit) arguments,
+    skipping classical parameters."""
+    name = _NAME.match(statement)
+    if name is None:
+        raise ValueError(f"Invalid OpenQASM statement: '{statement}'")
+    rest = statement[name.end():].lstrip()
+    if rest.startswith("("):
+        depth = 0
+        for index, char in enumerate(rest):
+            depth += char == "("
+            depth -= char == ")"
+            if depth == 0:
+                rest = rest[index + 1:]
+                break
+        else:
+            raise ValueError(f"Unbalanced parentheses in OpenQASM statement: '{statement}'")
+    arguments = [argument.strip() for argument in rest.split(",") if argument.strip()]
+    return name.group(), arguments
+
+
+class _Counter:
+    def __init__(self):
+        self.registers: Dict[str, int] = {}
+        self.gates: Dict[str, GateCounts] = {}
+
+    def _width(self, arguments: List[str], broadcast: bool = True) -> int:
+        """Number of times an operation is applied: whole-register arguments
+        broadcast the operation over every qubit of the register."""
+        width = 1
+        for argument in arguments:
+            match = _ARGUMENT.match(argument)
+            if match is None:
+                raise ValueError(f"Invalid OpenQASM argument: '{argument}'")
+            if broadcast and match.group(2) is None and match.group(1) in self.registers:
+                width = max(width, self.registers[match.group(1)])
+        return width
+
+    def operation(self, statement: str, broadcast: bool = True) -> GateCounts:
+        """Counts the gates applied by a single operation. Arguments of
+        operations in gate bodies are never registers (``broadcast=False``)."""
+        statement = _CONDITION.sub("", statement)
+        if _keyword(statement) == "measure":
+            target = statement[len("measure"):].split("->")[0]
+            return GateCounts(measurements=self._width([target.strip()], broadcast))
+
+        name, arguments = _split_call(statement)
+        if name == "barrier":
+            return GateCounts()
+        if name == "reset":
+            return GateCounts(measurements=self._width(arguments, broadcast))
+
+        if name in self.gates:
+            gate = self.gates[name]
+        elif len(arguments) == 1:
+            gate = GateCounts(one_qubit=1)
+        else:
+            gate = GateCounts(two_qubit=1)
+        return gate * self._width(arguments, broadcast)
+
+    def count(self, chunks: Iterable[str]) -> GateCounts:
+        total = GateCounts()
+        statements = _statements(chunks)
+        for statement, terminator in statements:
+            keyword = _keyword(statement)
+            if terminator == "{":
+                # gate name(params) args { body }
+                if keyword != "gate":
+                    raise ValueError(f"Unexpected block in OpenQASM program: '{statement}'")
+                name, _ = _split_call(statement[len("gate"):].strip())
+                body = GateCounts()
+                for inner, inner_terminator in statements:
+                    if inner:
+                        body += self.operation(inner, broadcast=False)
+                    if inner_terminator == "}":
+                        break
+                else:
+                    raise ValueError(f"Unterminated definition of gate '{name}'")
+                self.gates[name] = body
+            elif terminator == "}":
+                if statement:
+                    raise ValueError(f"Unexpected '}}' in OpenQASM program after '{statement}'")
+            elif not statement or keyword in _DECLARATIONS:
+                continue
+            elif keyword == "qreg":
+                match = _REGISTER.match(statement)
+                if match is None:
+                    raise ValueError(f"Invalid register declaration: '{statement}'")
+                self.registers[match.group(1)] = int(match.group(2))
+            elif keyword == "opaque":
+                # Declarations of opaque gates apply no operation. As opaque
+                # gates have no body, calls to them are counted by the number
+                # of qubits they act on, like built-in gates.
+                continue
+            else:
+                total += self.operation(statement)
+        return total
+
+
+def count_gates(qasm: Union[str, Iterable[str]]) -> GateCounts:
+    """Counts the one-qubit gates, multi-qubit gates and measurement
+    operations (measurements and resets) of an OpenQASM 2.0 program.
+
+    The program is tokenized statement by statement, without building a
+    circuit: ``qasm`` can be a string or any iterable of text chunks, such as
+    an open file. Operations on whole registers are counted once per qubit
+    of the register, calls to gates defined with ``gate`` count the
+    operations of their body, and barriers are not counted.
+
+    :param qasm: OpenQASM 2.0 program
+    :type qasm: Union[str, Iterable[str]]
+    :raises ValueError: If the program cannot be tokenized
+    :return: Gate counts
+    :rtype: GateCounts
+    """
+    chunks = [qasm] if isinstance(qasm, str) else qasm
+    return _Counter().count(chunks)
@@ -3,12 +3,15 @@
 # Licensed under the MIT License.
 ##
 import io
-from typing import Any, Dict
+from typing import Any, Dict, Union
+
+import numpy as np
 
 from azure.quantum.target.target import Target
 from azure.quantum.job.job import Job
 from azure.quantum.workspace import Workspace
 from azure.quantum._client.models import CostEstimate, UsageEvent
+from azure.quantum.target.qasm import count_gates
 
 
 class Quantinuum(Target):
@@ -85,6 +88,30 @@ class Quantinuum(Target):
             **kwargs
         )
 
+    _gate_counts = staticmethod(count_gates)
+
+    @property
+    def currency_code(self) -> str:
+        """Emulators are billed in EHQC, other targets in HQC."""
+        if "-sim" in self.name or "sim.h1-1e" in self.name or "sim.h1-2e" in self.name:
+            return "EHQC"
+        return "HQC"
+
+    def _price(
+        self,
+        N_1q: Union[int, np.ndarray],
+        N_2q: Union[int, np.ndarray],
+        N_m: Union[int, np.ndarray],
+        num_shots: Union[int, np.ndarray]
+    ) -> np.ndarray:
+        """Applies the HQC formula of this target, element-wise over
+        broadcastable arrays of gate counts and numbers of shots."""
+        if "apival" in self.name or "sc" in self.name:
+            shape = np.broadcast(N_1q, N_2q, N_m, 0 if num_shots is None else num_shots).shape
+            return np.zeros(shape)
+        weighted = np.asarray(N_1q) + 10 * np.asarray(N_2q) + 5 * np.asarray(N_m)
+        return 5 + np.asarray(num_shots) * weighted / 5000
+
     def estimate_cost(
         self,
         circuit: str = None,
@@ -116,44 +143,12 @@ class Quantinuum(Target):
         :param N_m: Number of measurement operations, if not specified,
             this is estimated from the circuit
         :type N_m: int, optional
-        :raises ImportError: If N_1q, N_2q and N_m are not specified,
-            this will require a qiskit installation.
+        :raises ValueError: If the circuit is not a valid OpenQASM 2.0 program
         """
         if circuit is not None and (N_1q is None or N_2q is None or N_m is None):
-            try:
-                from qiskit.circuit.quantumcircuit import Qasm
-                from qiskit.converters import ast_to_dag
-
-            except ImportError:
-                raise ImportError(
-                    "Missing dependency qiskit. Please run `pip install azure-quantum[qiskit]` " \
-"to estimate the circuit cost. Alternatively, specify the number of one-qubit and two-qubit " \
-"gates in the method input arguments.")
-
-            else:
-                from qiskit.dagcircuit.dagnode import DAGOpNode
-                qasm = Qasm(data=circuit)
-                ast = qasm.parse()
-                dag = ast_to_dag(ast)
-                N_1q, N_2q, N_m = 0, 0, 0
-                for node in dag._multi_graph.nodes():
-                    if isinstance(node, DAGOpNode):
-                        if node.op.name in ["measure", "reset"]:
-                            N_m += 1
-                        elif node.op.num_qubits == 1:
-                            N_1q += 1
-                        else:
-                            N_2q += 1
+            N_1q, N_2q, N_m = self._gate_counts(circuit)
 
-        if "-sim" in self.name or "sim.h1-1e" in self.name or "sim.h1-2e" in self.name:
-            currency_code = "EHQC"
-        else:
-            currency_code = "HQC"
-
-        if "apival" in self.name or "sc" in self.name:
-            HQC = 0.0
-        else:
-            HQC = 5 + num_shots * (N_1q + 10 * N_2q + 5 * N_m) / 5000
+        HQC = float(self._price(N_1q, N_2q, N_m, num_shots))
 
         return CostEstimate(
             events=[
@@ -182,6 +177,6 @@ class Quantinuum(Target):
                     unit_price=0.0
                 )
             ],
-            currency_code=currency_code,
+            currency_code=self.currency_code,
             estimated_total=HQC
         )
@@ -11,7 +11,10 @@ __all__ = [
 ]
 
 import json
-from typing import Union, Dict, List, TypeVar, cast
+import re
+from typing import Optional, Union, Dict, List, TypeVar, cast
+
+import numpy as np
 
 from ...job import Job
 
@@ -21,19 +24,23 @@ RawData = Union[int, float, List[float]]
 class Result:
     """Downloads the data of a completed Job and extracts the ``Readout`` for each register.
 
+    Each register is decoded into a ``numpy.ndarray`` of shape ``(shots, width)``.
+
     >>> from azure.quantum.job import Job
     >>> from azure.quantum.target.rigetti import Result
     >>> job = Job(...)  # This job should come from a Rigetti target
     >>> job.wait_until_completed()
-    >>> result = Result(job)
+    >>> result = Result(job, program=quil)
     >>> ro_data = result["ro"]
     >>> first_shot_data = ro_data[0]
     """
 
-    def __init__(self, job: Job) -> None:
+    def __init__(self, job: Job, program: Optional[str] = None) -> None:
         """
         Decode the results of a Job with output type of "rigetti.quil-results.v1"
 
+        :param program: Quil program of the job. The dtype of every register is derived from its
+            ``DECLARE`` statement; without it, integer registers are decoded as ``int64``.
         :raises: RuntimeError if the job has not completed successfully
         """
 
@@ -44,25 +51,87 @@ class Result:
                 f"error: {job.details.error_data})"
             )
         data = cast(Dict[str, List[List[RawData]]], json.loads(job.download_data(job.details.output_data_uri)))
-        self.data_per_register: Dict[str, Readout] = {k: create_readout(v) for k, v in data.items()}
+        declarations = parse_declarations(program) if program is not None else {}
+        self.data_per_register: Dict[str, np.ndarray] = {
+            k: create_readout(v, declarations.get(k)) for k, v in data.items()
+        }
 
-    def __getitem__(self, register_name: str) -> "Readout":
+    def __getitem__(self, register_name: str) -> np.ndarray:
         return self.data_per_register[register_name]
 
+    def to_list(self, register_name: str) -> "Readout":
+        """Returns the data of a register as nested Python lists, one inner list per shot."""
+        return self.data_per_register[register_name].tolist()
+
+    def per_substitution(self, register_name: str, num_substitutions: int) -> np.ndarray:
+        """Returns the data of a register grouped by substitution parameter set.
+
+        Jobs submitted with ``InputParams.substitutions`` run ``count`` shots for each
+        parameter set, one set after the other. The returned array is a view of shape
+        ``(num_substitutions, count, width)``; no data is copied.
+
+        :param register_name: Name of the readout register
+        :type register_name: str
+        :param num_substitutions: Number of substitution vectors passed with the job
+        :type num_substitutions: int
+        :raises: ValueError if the number of shots is not a multiple of num_substitutions
+        """
+        data = self.data_per_register[register_name]
+        if num_substitutions <= 0 or data.shape[0] % num_substitutions != 0:
+            raise ValueError(
+                f"Cannot split {data.shape[0]} shots into {num_substitutions} substitution sets."
+            )
+        return data.reshape(num_substitutions, -1, *data.shape[1:])
+
 
 T = TypeVar("T", bound=Union[int, float, complex])
 Readout = List[List[T]]
-"""Contains the data of a declared "readout" memory region, usually the ``ro`` register.
+"""Contains the data of a declared "readout" memory region, usually the ``ro`` register, as nested lists.
+
+This is the list view returned by ``Result.to_list``. ``Result`` itself stores each register as a
+``numpy.ndarray`` of shape ``(shots, width)`` whose dtype corresponds to the declared Quil data type:
 
-All data for all shots for a single Readout will have the same datatype T corresponding to the declared Quil data type:
+* ``BIT``: ``int8``
+* ``OCTET``: ``uint8``
+* ``INTEGER``: ``int64``
+* ``REAL``: ``float64``
+* complex data: ``complex128``
 
-* ``BIT`` | ``OCTET`` | ``INTEGER``: ``int``
-* ``REAL``: ``float``
+Integer registers whose declaration is unknown are decoded as ``int64``.
 """
 
+DECLARED_DTYPES = {
+    "BIT": np.int8,
+    "OCTET": np.uint8,
+    "INTEGER": np.int64,
+    "REAL": np.float64,
+}
+
+_DECLARE_PATTERN = re.compile(r"^\s*DECLARE\s+(\w+)\s+(\w+)", re.MULTILINE)
+
 
-def create_readout(raw_data: List[List[RawData]]) -> Readout:
-    if isinstance(raw_data[0][0], list):
-        raw_data = [[complex(entry[0], entry[1]) for entry in shot] for shot in raw_data]
+def parse_declarations(program: str) -> Dict[str, str]:
+    """Returns the declared Quil data type (e.g. ``BIT``) of every memory region of a program."""
+    return {name: data_type.upper() for name, data_type in _DECLARE_PATTERN.findall(program)}
 
-    return raw_data
+
+def create_readout(raw_data: List[List[RawData]], data_type: Optional[str] = None) -> np.ndarray:
+    """Converts the decoded JSON data of a single register into a ``(shots, width)`` array.
+
+    :param data_type: Declared Quil data type of the register, e.g. ``BIT``
+    """
+    dtype = DECLARED_DTYPES.get(data_type)
+    if len(raw_data) == 0:
+        return np.empty((0, 0), dtype=dtype or np.int64)
+
+    data = np.asarray(raw_data)
+    if data.ndim == 3:
+        # Complex entries are encoded as [real, imaginary] pairs, which is
+        # exactly the memory layout of complex128
+        return np.ascontiguousarray(data, dtype=np.float64).view(np.complex128)[..., 0]
+
+    if dtype is not None:
+        return data.astype(dtype, copy=False)
+    if data.dtype.kind in "iu":
+        return data.astype(np.int64, copy=False)
+    return data.astype(np.float64, copy=False)
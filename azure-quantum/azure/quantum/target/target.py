@@ -12,6 +12,7 @@ from azure.quantum.job.job import Job
 from azure.quantum.job.base_job import ContentType
 if TYPE_CHECKING:
     from azure.quantum import Workspace
+    from azure.quantum.target.qasm import GateCounts
 
 
 class Target:
@@ -21,6 +22,13 @@ class Target:
     # target class for a given provider, specify the
     # default_targets constructor argument.
     target_names = ()
+    # Incremented whenever a subclass is defined, at any depth, so that
+    # TargetFactory knows when to rebuild its registries
+    _subclass_generation = 0
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        Target._subclass_generation += 1
 
     def __init__(
         self,
@@ -73,7 +81,7 @@ avg. queue time={self._average_queue_time} s, {self._current_availability}>"
     
     def refresh(self):
         """Update the target availability and queue time"""
-        targets = self.workspace._get_target_status(self.name, self.provider_id)
+        targets = self.workspace._get_target_status(self.name, self.provider_id, refresh=True)
         if len(targets) > 0:
             _, target_status = targets[0]
             self._current_availability = target_status.current_availability
@@ -159,6 +167,20 @@ target '{self.name}' of provider '{self.provider_id}' not found."
         """
         return False
     
+    # Currency of the estimates returned by estimate_cost
+    currency_code = None
+
+    @staticmethod
+    def _gate_counts(input_data: Any) -> "GateCounts":
+        """Counts the gates of a program, as needed by the pricing formula
+        of the target (see ``_price``). Used by ``Workspace.estimate_costs``."""
+        raise NotImplementedError("Price estimation is not implemented yet for this target.")
+
+    def _price(self, N_1q, N_2q, N_m, num_shots):
+        """Applies the pricing formula of the target, element-wise over
+        broadcastable arrays of gate counts and numbers of shots."""
+        raise NotImplementedError("Price estimation is not implemented yet for this target.")
+
     def estimate_cost(
         self,
         input_data: Any,
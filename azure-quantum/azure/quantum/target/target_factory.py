@@ -20,6 +20,8 @@ class TargetFactory:
     provider and target name
     """
     __instances = {}
+    # Target classes by name, memoized per factory type and base class
+    __registries = {}
 
     def __new__(cls, *args, **kwargs):
         base_cls = kwargs.get("base_cls")
@@ -54,7 +56,23 @@ class TargetFactory:
         self._base_cls = base_cls
         # case insensitive lookup
         self._default_targets = {k.lower(): v for k, v in default_targets.items()}
-        self._all_targets = all_targets or self._get_all_target_cls()
+        self._all_targets = all_targets or self._get_registry()
+
+    def _get_registry(self) -> Dict[str, Target]:
+        """Get all target classes by target name, walking the subclasses of
+        the base class only once. The registry is rebuilt if subclasses of
+        the base class have been defined since, as counted by its
+        _subclass_generation, or new direct subclasses if it has none."""
+        key = (type(self), self._base_cls)
+        version = (
+            getattr(self._base_cls, "_subclass_generation", None),
+            tuple(self._base_cls.__subclasses__())
+        )
+        cached = TargetFactory.__registries.get(key)
+        if cached is None or cached[0] != version:
+            cached = (version, self._get_all_target_cls())
+            TargetFactory.__registries[key] = cached
+        return cached[1]
 
     def _get_all_target_cls(self) -> Dict[str, Target]:
         """Get all target classes by target name"""
@@ -118,6 +136,7 @@ https://github.com/microsoft/qdk-python/issues.")
         self,
         name: str,
         provider_id: str,
+        refresh: bool = False,
         **kwargs
     ) -> Union[Target, List[Target]]:
         """Create targets that are available to this workspace
@@ -129,10 +148,13 @@ https://github.com/microsoft/qdk-python/issues.")
         :type workspace: Workspace
         :param provider_id: Provider name
         :type provider_id: str
+        :param refresh: Fetch the latest target status instead of
+            the status cached by the workspace, defaults to False
+        :type refresh: bool
         :return: One or more Target objects
         :rtype: Union[Target, List[Target]]
         """
-        target_statuses = self._workspace._get_target_status(name, provider_id)
+        target_statuses = self._workspace._get_target_status(name, provider_id, refresh=refresh)
 
         if len(target_statuses) == 1:
             return self.from_target_status(*target_statuses[0], **kwargs)
@@ -0,0 +1,288 @@
+##
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+##
+"""Caching and parallel execution of circuit translations (e.g. QIR
+bitcode) shared by the qiskit and cirq integrations."""
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import (
+    FIRST_EXCEPTION, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+)
+from typing import Any, Callable, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["TranslationCache", "TranslationPool", "LazyText", "submit_jobs"]
+
+# Default number of translations kept in memory
+DEFAULT_MAX_SIZE = 256
+
+# Environment variable used to persist the default cache on disk
+CACHE_DIR_ENV_VAR = "AZURE_QUANTUM_TRANSLATION_CACHE_DIR"
+
+
+class TranslationCache:
+    """Least recently used cache of translated circuit payloads.
+
+    Entries are keyed by a structural hash of the circuit and of every
+    parameter that affects its translation, see ``make_key``. When
+    ``cache_dir`` is given, ``bytes`` payloads are also persisted to disk
+    so that other processes, or later runs, can reuse them; other payloads
+    are only kept in memory.
+
+    :param max_size: Maximum number of payloads kept in memory
+    :type max_size: int
+    :param cache_dir: Optional directory where payloads are persisted
+    :type cache_dir: str
+    """
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, cache_dir: Optional[str] = None):
+        self.max_size = max_size
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        # Futures of the translations in progress, by key
+        self._pending = {}
+        self._lock = threading.Lock()
+
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    @classmethod
+    def from_env(cls) -> "TranslationCache":
+        """Creates a cache persisted to the directory set in the
+        ``AZURE_QUANTUM_TRANSLATION_CACHE_DIR`` environment variable, if any."""
+        return cls(cache_dir=os.environ.get(CACHE_DIR_ENV_VAR) or None)
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """Hashes the representation of the given parts into a cache key."""
+        return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries or (
+            self.cache_dir is not None and os.path.exists(self._path(key))
+        )
+
+    def get(self, key: str) -> Optional[Any]:
+        """Returns the cached payload for the given key, or None."""
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return payload
+
+        payload = self._read(key)
+        with self._lock:
+            if payload is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._store(key, payload)
+        return payload
+
+    def put(self, key: str, payload: Any):
+        """Adds a payload to the cache, evicting the least recently used
+        entries from memory if needed."""
+        with self._lock:
+            self._store(key, payload)
+        self._write(key, payload)
+
+    def get_or_translate(self, key: str, translate: Callable[[], Any]) -> Any:
+        """Returns the cached payload for the given key, calling ``translate``
+        to create and cache it on a miss. Concurrent calls for a key that is
+        being translated wait for that translation instead of starting
+        another one."""
+        payload = self.get(key)
+        if payload is not None:
+            return payload
+
+        with self._lock:
+            pending = self._pending.get(key)
+            is_owner = pending is None
+            if is_owner:
+                # Another thread may have cached the payload in the meantime
+                payload = self._entries.get(key)
+                if payload is not None:
+                    return payload
+                pending = self._pending[key] = Future()
+            else:
+                self.hits += 1
+        if not is_owner:
+            return pending.result()
+
+        try:
+            payload = translate()
+            self.put(key, payload)
+            pending.set_result(payload)
+            return payload
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._pending[key]
+
+    def clear(self):
+        """Removes all entries from memory. Persisted payloads are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def _store(self, key: str, payload: Any):
+        self._entries[key] = payload
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.bin")
+
+    def _read(self, key: str) -> Optional[bytes]:
+        if self.cache_dir is None:
+            return None
+        try:
+            with open(self._path(key), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Could not read cached translation {key}: {e}")
+            return None
+
+    def _write(self, key: str, payload: Any):
+        if self.cache_dir is None or not isinstance(payload, bytes):
+            return
+        tmp_path = None
+        try:
+            # Write to a temporary file first so that concurrent readers
+            # never see a partially written payload
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir)
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            logger.warning(f"Could not persist cached translation {key}: {e}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+class TranslationPool:
+    """Runs CPU-bound circuit translations on a pool of worker processes.
+
+    A single pool can be shared by the qiskit ``AzureQuantumProvider`` and
+    the cirq ``AzureQuantumService``. Submissions of several circuits run on
+    threads that hand their translation to the pool and upload the result as
+    soon as it is ready, so translations of the next circuits proceed while
+    earlier ones are being uploaded and submitted.
+
+    Translation functions and their arguments must be picklable, that is
+    module-level functions (or static/class methods) and plain data.
+
+    >>> from azure.quantum.translation import TranslationPool
+    >>> with TranslationPool(max_workers=4) as pool:
+    ...     provider = AzureQuantumProvider(workspace, translation_pool=pool)
+    ...     job = provider.get_backend("quantinuum.sim.h1-1e").run(circuits)
+
+    :param max_workers: Number of worker processes, defaults to the number of CPUs
+    :type max_workers: int
+    :param executor: Executor to run translations on instead of a new process pool
+    :type executor: concurrent.futures.Executor
+    """
+    def __init__(self, max_workers: Optional[int] = None, executor: Optional[Executor] = None):
+        self._executor = executor if executor is not None else ProcessPoolExecutor(max_workers=max_workers)
+
+    def __enter__(self) -> "TranslationPool":
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+
+    def submit(self, translate: Callable, *args, **kwargs) -> Future:
+        """Schedules a translation and returns the future of its result."""
+        return self._executor.submit(translate, *args, **kwargs)
+
+    def translate(self, translate: Callable, *args, **kwargs) -> Any:
+        """Runs a translation on the pool and waits for its result."""
+        return self.submit(translate, *args, **kwargs).result()
+
+    def map(self, translate: Callable, items: Iterable) -> List:
+        """Translates all items in parallel, returning the results in order."""
+        return list(self._executor.map(translate, items))
+
+    def shutdown(self, wait: bool = True):
+        """Stops the worker processes."""
+        self._executor.shutdown(wait=wait)
+
+
+class LazyText:
+    """Defers building a (potentially expensive) text until it is first
+    formatted, for instance by a log record, and reuses it afterwards."""
+    def __init__(self, create: Callable[[], str]):
+        self._create = create
+        self._text = None
+
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = self._create()
+        return self._text
+
+
+def submit_jobs(
+    submit: Callable[[Any], Any],
+    items: Iterable,
+    max_workers: int,
+    cancel: Callable[[Any], Any]
+) -> List:
+    """Submits one job per item on a pool of threads and returns the jobs in
+    the order of the items.
+
+    If a submission fails, items whose submission has not started yet are
+    skipped, the jobs already created for the other items are cancelled with
+    ``cancel``, and the first error is raised with these jobs attached as its
+    ``submitted_jobs`` attribute, so that they are never silently orphaned.
+
+    :param submit: Function creating the job of an item
+    :type submit: Callable
+    :param items: Items to submit
+    :type items: Iterable
+    :param max_workers: Maximum number of jobs submitted at the same time
+    :type max_workers: int
+    :param cancel: Function cancelling a job
+    :type cancel: Callable
+    :return: Jobs, in the order of the items
+    :rtype: List
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(submit, item) for item in items]
+        wait(futures, return_when=FIRST_EXCEPTION)
+        for future in futures:
+            future.cancel()
+
+    jobs = []
+    error = None
+    for future in futures:
+        if future.cancelled():
+            continue
+        if future.exception() is not None:
+            error = error or future.exception()
+        else:
+            jobs.append(future.result())
+    if error is None:
+        return jobs
+
+    for job in jobs:
+        try:
+            cancel(job)
+        except Exception as e:
+            logger.warning(f"Could not cancel job {getattr(job, 'id', job)}: {e}")
+    error.submitted_jobs = jobs
+    raise error
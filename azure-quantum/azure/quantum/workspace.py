@@ -6,6 +6,8 @@ from datetime import datetime
 import logging
 import os
 import re
+import threading
+import time
 
 from typing import Any, Dict, Iterable, List, Optional, TYPE_CHECKING, Tuple, Union
 from deprecated import deprecated
@@ -23,13 +25,20 @@ from azure.quantum._client.operations import (
 )
 from azure.quantum._client.models import BlobDetails, JobStatus
 from azure.quantum import Job
-from azure.quantum.storage import create_container_using_client, get_container_uri, ContainerClient
+from azure.quantum.storage import (
+    create_container_using_client,
+    create_shared_transport,
+    get_container_uri,
+    ContainerClient,
+)
+from azure.quantum.translation import TranslationCache
 
 from .version import __version__
 
 if TYPE_CHECKING:
     from azure.quantum._client.models import TargetStatus
     from azure.quantum.target import Target
+    from azure.quantum.cost_estimation import CostEstimates
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +46,10 @@ __all__ = ["Workspace"]
 
 DEFAULT_CONTAINER_NAME_FORMAT = "job-{job_id}"
 USER_AGENT_APPID_ENV_VAR_NAME = "AZURE_QUANTUM_PYTHON_APPID"
+# Number of seconds for which the status of targets is cached by default
+DEFAULT_TARGET_STATUS_TTL = 60
+# Number of circuits whose gate counts are cached by estimate_costs
+GATE_COUNTS_CACHE_SIZE = 65536
 
 
 def sdk_environment(name):
@@ -121,6 +134,13 @@ class Workspace:
 
     credentials = None
 
+    # HTTP transport shared by the service client and the storage helpers
+    _transport = None
+
+    # Number of seconds for which the status of providers and targets is
+    # cached. Set to 0 to always fetch the latest status.
+    target_status_ttl = DEFAULT_TARGET_STATUS_TTL
+
     def __init__(
         self,
         subscription_id: Optional[str] = None,
@@ -184,9 +204,20 @@ class Workspace:
         # "West US" should be converted to "westus".
         self.location = "".join(location.split()).lower()
 
+        # HTTP transport with a pool of keep-alive connections, shared by
+        # the service client and by the storage helpers of the workspace
+        self._transport = create_shared_transport()
+
         # Create QuantumClient
         self._client = self._create_client()
 
+        # Status of the providers and their targets, see _get_target_status
+        self._target_status_cache = (float("-inf"), [])
+        self._target_status_lock = threading.Lock()
+
+        # Gate counts of circuits, used by estimate_costs
+        self._gate_counts_cache = TranslationCache(max_size=GATE_COUNTS_CACHE_SIZE)
+
     def _create_client(self) -> QuantumClient:
         base_url = BASE_URL(self.location)
         logger.debug(
@@ -200,7 +231,8 @@ class Workspace:
             resource_group_name=self.resource_group,
             workspace_name=self.name,
             base_url=base_url,
-            user_agent=self.user_agent
+            user_agent=self.user_agent,
+            transport=self._transport
         )
         return client
 
@@ -301,28 +333,49 @@ class Workspace:
 
         return result
 
-    def _get_target_status(self, name: str, provider_id: str) -> List[Tuple[str, "TargetStatus"]]:
-        """Get provider ID and status for targets"""
+    def _get_target_status(
+        self, name: str, provider_id: str, refresh: bool = False
+    ) -> List[Tuple[str, "TargetStatus"]]:
+        """Get provider ID and status for targets.
+
+        The status of all providers is cached for ``target_status_ttl``
+        seconds; ``refresh=True`` fetches it again regardless."""
         return [
-            (provider.id, target)
-            for provider in self._client.providers.get_status()
-            for target in provider.targets
-            if (provider_id is None or provider.id.lower() == provider_id.lower())
+            (_provider_id, target)
+            for _provider_id, target in self._get_all_target_status(refresh)
+            if (provider_id is None or _provider_id.lower() == provider_id.lower())
                 and (name is None or target.id.lower() == name.lower())
         ]
 
+    def _get_all_target_status(self, refresh: bool = False) -> List[Tuple[str, "TargetStatus"]]:
+        with self._target_status_lock:
+            cached_at, statuses = self._target_status_cache
+            if refresh or time.monotonic() - cached_at >= self.target_status_ttl:
+                statuses = [
+                    (provider.id, target)
+                    for provider in self._client.providers.get_status()
+                    for target in provider.targets
+                ]
+                self._target_status_cache = (time.monotonic(), statuses)
+            return statuses
+
     def get_targets(
         self, 
         name: str = None, 
         provider_id: str = None,
+        refresh: bool = False,
         **kwargs
     ) -> Union["Target", Iterable["Target"]]:
         """Returns all available targets for this workspace filtered by name and provider ID.
+
+        The status of the targets is cached for ``target_status_ttl`` seconds.
         
         :param name: Optional target name to filter by, defaults to None
         :type name: str, optional
         :param provider_id: Optional provider Id to filter by, defaults to None
         :type provider_id: str, optional
+        :param refresh: Fetch the latest status instead of the cached one, defaults to False
+        :type refresh: bool, optional
         :return: Targets
         :rtype: Iterable[Target]
         """
@@ -336,8 +389,49 @@ class Workspace:
 
         return target_factory.get_targets(
             name=name,
-            provider_id=provider_id
+            provider_id=provider_id,
+            refresh=refresh
+        )
+
+    def estimate_costs(
+        self,
+        circuits: Iterable[Any],
+        targets: Iterable[Union[str, "Target"]],
+        shots: Union[int, Iterable[int]],
+    ) -> "CostEstimates":
+        """Estimates the cost of running every circuit on every target, for
+        every number of shots.
+
+        The gate counts of each circuit are computed once and cached on the
+        workspace by circuit hash, so that repeated estimates of the same
+        circuits are cheap. Target names are resolved without querying the
+        status of the providers.
+
+        :param circuits: Circuits, in the input format of the targets
+            (e.g. OpenQASM 2.0 for Quantinuum, JSON circuits for IonQ)
+        :type circuits: Iterable[Any]
+        :param targets: Target names or Target instances
+        :type targets: Iterable[Union[str, Target]]
+        :param shots: Number of shots, or list of numbers of shots
+        :type shots: Union[int, Iterable[int]]
+        :raises NotImplementedError: If a target does not support cost estimation
+        :return: Table of cost estimates, one row per (circuit, target, shots)
+        :rtype: CostEstimates
+        """
+        from azure.quantum.cost_estimation import estimate_costs
+        from azure.quantum.target.target_factory import TargetFactory
+        from azure.quantum.target import Target
+
+        target_factory = TargetFactory(
+            base_cls=Target,
+            workspace=self
         )
+        targets = [
+            target_factory.create_target(provider_id=target.split(".")[0], name=target)
+            if isinstance(target, str) else target
+            for target in targets
+        ]
+        return estimate_costs(circuits, targets, shots, cache=self._gate_counts_cache)
 
     def get_quotas(self) -> List[Dict[str, Any]]:
         """Get a list of job quotas for the given workspace.
@@ -393,13 +487,13 @@ class Workspace:
                 container_name
             )
             container_client = ContainerClient.from_container_url(
-                container_uri
+                container_uri, transport=self._transport
             )
             create_container_using_client(container_client)
         else:
             # Use the storage acount specified to generate container URI,
             # create a new container if it does not yet exist
             container_uri = get_container_uri(
-                self.storage, container_name
+                self.storage, container_name, transport=self._transport
             )
         return container_uri
@@ -0,0 +1,58 @@
+##
+# conftest.py: Options and fixtures of the benchmark suite
+##
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+##
+from collections import OrderedDict
+
+import pytest
+
+from azure.quantum.optimization import Problem
+from problems import DEFAULT_MAX_TERMS, create_problem
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    # The benchmarks require pytest-benchmark, see README.md
+    collect_ignore_glob = ["test_*.py"]
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--perf-max-terms",
+        type=float,
+        default=DEFAULT_MAX_TERMS,
+        help="Largest problem size (in terms) to benchmark, up to 1e7. "
+        f"Defaults to {DEFAULT_MAX_TERMS:.0e}.",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    max_terms = config.getoption("--perf-max-terms")
+    skip = pytest.mark.skip(reason=f"larger than --perf-max-terms={max_terms:.0e}")
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        if callspec is not None and callspec.params.get("size", 0) > max_terms:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def problem_factory(request):
+    """Returns the problems of the given kind and size, created once per
+    session since creating the largest ones takes minutes. The least
+    recently used problems are dropped once the cached problems have more
+    than --perf-max-terms terms in total, to bound memory usage."""
+    max_terms = request.config.getoption("--perf-max-terms")
+    problems = OrderedDict()
+
+    def factory(kind: str, size: int) -> Problem:
+        key = (kind, size)
+        if key in problems:
+            problems.move_to_end(key)
+            return problems[key]
+        while problems and sum(s for _, s in problems) + size > max_terms:
+            problems.popitem(last=False)
+        problems[key] = create_problem(kind, size)
+        return problems[key]
+    return factory
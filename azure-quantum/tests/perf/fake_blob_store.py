@@ -0,0 +1,91 @@
+##
+# fake_blob_store.py: In-memory Azure Blob Storage service for benchmarks
+##
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+##
+import base64
+import io
+import re
+from urllib.parse import parse_qs, urlparse
+from unittest import mock
+
+import requests
+import urllib3
+from azure.core.pipeline.transport import RequestsTransport
+
+from azure.quantum.workspace import Workspace
+
+ACCOUNT_URL = "https://benchmarks.blob.core.windows.net"
+SAS_TOKEN = "sv=2020-10-02&se=2099-01-01&sp=racw&sig=benchmarks"
+
+
+class FakeBlobSession(requests.Session):
+    """requests session answering the Blob Storage REST calls used by
+    azure.quantum (containers, blobs and block blobs) from memory, so that
+    uploads go through the real storage clients without any network I/O."""
+    def __init__(self):
+        super().__init__()
+        self.containers = set()
+        self.blobs = {}
+        self.blocks = {}
+
+    def request(self, method, url, headers=None, data=None, **kwargs):
+        parsed = urlparse(url)
+        query = parse_qs(parsed.query)
+        path = tuple(parsed.path.strip("/").split("/", 1))
+        if data is not None and not isinstance(data, bytes):
+            data = data.encode() if isinstance(data, str) \
+                else data.read() if hasattr(data, "read") \
+                else b"".join(data)
+
+        status, body, response_headers = 201, b"", {}
+        if len(path) == 1:
+            if method == "PUT":
+                self.containers.add(path[0])
+            elif path[0] in self.containers:
+                status = 200
+            else:
+                status, response_headers = 404, {"x-ms-error-code": "ContainerNotFound"}
+        elif query.get("comp") == ["block"]:
+            self.blocks.setdefault(path, {})[query["blockid"][0]] = data
+        elif query.get("comp") == ["blocklist"]:
+            staged = self.blocks.pop(path, {})
+            ids = re.findall(rb"<Latest>(.*?)</Latest>", data)
+            self.blobs[path] = b"".join(staged[block_id.decode()] for block_id in ids)
+        elif method == "PUT":
+            self.blobs[path] = data or b""
+        elif path in self.blobs:
+            status, body = 200, self.blobs[path]
+        else:
+            status, response_headers = 404, {"x-ms-error-code": "BlobNotFound"}
+
+        response = requests.Response()
+        response.status_code = status
+        response.url = url
+        response.headers.update(response_headers)
+        response.headers["Content-Length"] = str(len(body))
+        response.headers["ETag"] = '"0x8D0000000000000"'
+        response.headers["Last-Modified"] = "Mon, 01 Jan 2024 00:00:00 GMT"
+        response.headers["Content-MD5"] = base64.b64encode(b"0" * 16).decode()
+        response.raw = urllib3.HTTPResponse(body=io.BytesIO(body), preload_content=False)
+        response.request = requests.Request(method, url).prepare()
+        return response
+
+
+def create_fake_workspace(session: FakeBlobSession) -> Workspace:
+    """Creates a workspace whose linked storage is the given fake blob store."""
+    workspace = mock.Mock(spec=Workspace)
+    workspace.storage = None
+    workspace._transport = RequestsTransport(session=session, session_owner=False)
+
+    def sas_uri(container_name, blob_name=None):
+        path = container_name if blob_name is None else f"{container_name}/{blob_name}"
+        return f"{ACCOUNT_URL}/{path}?{SAS_TOKEN}"
+
+    def container_uri(job_id=None, container_name=None):
+        return sas_uri(container_name or f"job-{job_id}")
+
+    workspace.get_container_uri.side_effect = container_uri
+    workspace._get_linked_storage_sas_uri.side_effect = sas_uri
+    return workspace
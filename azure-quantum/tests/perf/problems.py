@@ -0,0 +1,73 @@
+##
+# problems.py: Problems and helpers of the benchmark suite
+##
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+##
+import tracemalloc
+
+import numpy as np
+
+from azure.quantum.optimization import Problem, ProblemType, SlcTerm, Term
+
+# Problem sizes, in number of terms, that benchmarks are parameterized with
+PROBLEM_SIZES = [10**3, 10**4, 10**5, 10**6, 10**7]
+DEFAULT_MAX_TERMS = 10**5
+
+PROBLEM_KINDS = ["pubo", "ising", "slc"]
+
+# Number of linear terms in each squared linear combination term
+SLC_TERM_SIZE = 4
+
+
+def num_variables(size: int) -> int:
+    """Number of variables of the benchmarked problems of the given size."""
+    return max(10, size // 100)
+
+
+def create_terms(kind: str, size: int, seed: int = 0) -> list:
+    """Creates ``size`` random terms of one or two variables, or, for SLC
+    problems, ``size / SLC_TERM_SIZE`` squared linear combination terms."""
+    random = np.random.RandomState(seed)
+    variables = num_variables(size)
+    if kind == "slc":
+        count = size // SLC_TERM_SIZE
+        ids = np.array([random.choice(variables, SLC_TERM_SIZE, replace=False) for _ in range(count)])
+        costs = random.uniform(-1, 1, ids.shape).tolist()
+        return [
+            SlcTerm([Term(c=c, indices=[i]) for c, i in zip(term_costs, term_ids)], c=1)
+            for term_costs, term_ids in zip(costs, ids.tolist())
+        ]
+
+    ids = random.randint(0, variables, (size, 2))
+    lengths = random.randint(1, 3, size)
+    costs = random.uniform(-1, 1, size).tolist()
+    return [
+        Term(c=c, indices=term_ids[:length])
+        for c, term_ids, length in zip(costs, ids.tolist(), lengths.tolist())
+    ]
+
+
+def create_problem(kind: str, size: int, **kwargs) -> Problem:
+    problem_type = ProblemType.ising if kind == "ising" else ProblemType.pubo
+    return Problem(f"{kind}-{size}", create_terms(kind, size), problem_type=problem_type, **kwargs)
+
+
+def create_configuration(problem_type: ProblemType, size: int, seed: int = 0) -> dict:
+    random = np.random.RandomState(seed)
+    values = random.randint(0, 2, num_variables(size))
+    if problem_type == ProblemType.ising:
+        values = 2 * values - 1
+    return dict(enumerate(values.tolist()))
+
+
+def record_peak_memory(benchmark, function, *args, **kwargs):
+    """Runs the function once under tracemalloc and records its peak
+    memory allocation in the benchmark results, in bytes."""
+    tracemalloc.start()
+    try:
+        function(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["peak_memory_bytes"] = peak
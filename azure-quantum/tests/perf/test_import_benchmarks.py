@@ -0,0 +1,20 @@
+#!/bin/env python
+# -*- coding: utf-8 -*-
+##
+# test_import_benchmarks.py: Benchmarks of importing azure.quantum
+##
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+##
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize("module", ["azure.quantum", "azure.quantum.optimization"])
+def test_import(benchmark, module):
+    # Every round imports the module in a fresh interpreter
+    benchmark.pedantic(
+        subprocess.check_call, args=([sys.executable, "-c", f"import {module}"],), rounds=5, iterations=1
+    )
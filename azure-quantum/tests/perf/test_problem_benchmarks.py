@@ -0,0 +1,151 @@
+#!/bin/env python
+# -*- coding: utf-8 -*-
+##
+# test_problem_benchmarks.py: Benchmarks of Problem construction, serialization and upload
+##
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+##
+import pytest
+
+from azure.quantum.job.base_job import ContentType
+from azure.quantum.optimization import Problem, ProblemType, StreamingProblem
+from fake_blob_store import FakeBlobSession, create_fake_workspace
+from problems import (
+    PROBLEM_KINDS,
+    PROBLEM_SIZES,
+    create_configuration,
+    create_terms,
+    num_variables,
+    record_peak_memory,
+)
+
+sizes = pytest.mark.parametrize("size", PROBLEM_SIZES)
+kinds = pytest.mark.parametrize("kind", PROBLEM_KINDS)
+# Protobuf serialization does not support SLC terms
+proto_kinds = pytest.mark.parametrize("kind", ["pubo", "ising"])
+
+# Streamed problems are uploaded in blocks of this many terms
+STREAMING_CHUNK_SIZE = 10**4
+
+
+def _run(benchmark, function, *args, rounds=3, setup=None):
+    """Benchmarks a slow function over a few rounds, after recording its
+    peak memory, and returns its result."""
+    if setup is not None:
+        setup()
+    record_peak_memory(benchmark, function, *args)
+    return benchmark.pedantic(
+        function, args=args, rounds=rounds, iterations=1, setup=setup
+    )
+
+
+@kinds
+@sizes
+def test_construct(benchmark, kind, size):
+    terms = create_terms(kind, size)
+    problem_type = ProblemType.ising if kind == "ising" else ProblemType.pubo
+    problem = _run(benchmark, Problem, kind, terms, None, problem_type)
+    assert len(problem.terms) + len(problem.terms_slc) == len(terms)
+
+
+@kinds
+@sizes
+def test_to_json(benchmark, problem_factory, kind, size):
+    problem = problem_factory(kind, size)
+    _run(benchmark, problem.to_json)
+
+
+@proto_kinds
+@sizes
+def test_to_proto(benchmark, problem_factory, kind, size):
+    problem = problem_factory(kind, size)
+    _run(benchmark, problem.to_proto)
+
+
+@proto_kinds
+@sizes
+def test_compress_protobuf(benchmark, problem_factory, kind, size):
+    problem = problem_factory(kind, size)
+    messages = problem.to_proto()
+    _run(benchmark, problem.compress_protobuf, messages)
+
+
+@kinds
+@sizes
+def test_to_blob(benchmark, problem_factory, kind, size):
+    problem = problem_factory(kind, size)
+    _run(benchmark, problem.to_blob)
+
+
+@kinds
+@sizes
+def test_from_json(benchmark, problem_factory, kind, size):
+    serialized = problem_factory(kind, size).to_json()
+    _run(benchmark, Problem.from_json, serialized)
+
+
+@proto_kinds
+@sizes
+def test_from_proto(benchmark, problem_factory, kind, size):
+    messages = problem_factory(kind, size).to_proto()
+    _run(benchmark, Problem.from_proto, messages)
+
+
+@kinds
+@sizes
+def test_evaluate(benchmark, problem_factory, kind, size):
+    problem = problem_factory(kind, size)
+    configuration = create_configuration(problem.problem_type, size)
+    _run(benchmark, problem.evaluate, configuration)
+
+
+@kinds
+@sizes
+def test_set_fixed_variables(benchmark, problem_factory, kind, size):
+    problem = problem_factory(kind, size)
+    configuration = create_configuration(problem.problem_type, size)
+    # Fix half of the variables
+    fixed = {i: configuration[i] for i in range(0, num_variables(size), 2)}
+    _run(benchmark, problem.set_fixed_variables, fixed)
+
+
+@kinds
+@sizes
+def test_is_large(benchmark, problem_factory, kind, size):
+    problem = problem_factory(kind, size)
+    _run(benchmark, problem.is_large)
+
+
+@pytest.mark.parametrize("content_type", [ContentType.json, ContentType.protobuf])
+@sizes
+def test_upload(benchmark, size, content_type):
+    problem = Problem("upload", create_terms("pubo", size), problem_type=ProblemType.pubo,
+                      content_type=content_type)
+    session = FakeBlobSession()
+    workspace = create_fake_workspace(session)
+
+    def setup():
+        # Problem.upload returns the URI of the previous upload otherwise
+        problem.uploaded_blob_uri = None
+
+    _run(benchmark, problem.upload, workspace, setup=setup)
+    benchmark.extra_info["uploaded_bytes"] = len(next(iter(session.blobs.values())))
+
+
+@sizes
+def test_streaming_upload(benchmark, size):
+    terms = create_terms("pubo", size)
+    session = FakeBlobSession()
+    workspace = create_fake_workspace(session)
+
+    def stream():
+        problem = StreamingProblem(workspace, name="streaming", problem_type=ProblemType.pubo)
+        problem.upload_terms_threshold = STREAMING_CHUNK_SIZE
+        for start in range(0, len(terms), STREAMING_CHUNK_SIZE):
+            problem.add_terms(terms[start:start + STREAMING_CHUNK_SIZE])
+        return problem.upload(workspace)
+
+    uri = _run(benchmark, stream)
+    assert uri.startswith(workspace._get_linked_storage_sas_uri("x").split("/x?")[0])
+    benchmark.extra_info["uploaded_bytes"] = len(next(iter(session.blobs.values())))
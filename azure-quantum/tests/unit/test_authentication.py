@@ -6,21 +6,50 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 ##
+import asyncio
 import json
 import os
 from pathlib import Path
+import threading
 import time
 
 import pytest
 from unittest.mock import patch
 
+from azure.core.credentials import AccessToken
+from azure.core.exceptions import ClientAuthenticationError
 from azure.identity import CredentialUnavailableError
-from azure.quantum._authentication import _TokenFileCredential
+from azure.quantum._authentication import _DefaultAzureCredential, _TokenFileCredential
+from azure.quantum._authentication._cache import _PersistentTokenCache, _REFRESH_MARGIN_SECONDS
+from azure.quantum.aio._authentication._default import _DefaultAzureCredential as _AioDefaultAzureCredential
 from common import QuantumTestBase
 
 _AZURE_QUANTUM_SCOPE = "https://quantum.microsoft.com/.default"
 
 
+class _FakeCredential(object):
+    def __init__(self, token=None, expires_in=60*60):
+        self.token = token
+        self.expires_in = expires_in
+        self.calls = 0
+
+    def get_token(self, *scopes, **kwargs):
+        self.calls += 1
+        if self.token is None:
+            raise CredentialUnavailableError(message="Unavailable")
+        return AccessToken(self.token, int(time.time() + self.expires_in))
+
+
+class _OtherFakeCredential(_FakeCredential):
+    pass
+
+
+def _default_credential(credentials, **kwargs):
+    credential = _DefaultAzureCredential(subscription_id="sub", interactive_browser_tenant_id="tenant", **kwargs)
+    credential.credentials = credentials
+    return credential
+
+
 class TestWorkspace(QuantumTestBase):
     def test_azure_quantum_token_credential_file_not_set(self):
         credential = _TokenFileCredential()
@@ -96,4 +125,155 @@ class TestWorkspace(QuantumTestBase):
             token = credential.get_token(_AZURE_QUANTUM_SCOPE)
         
         assert token.token == "fake_token"
-        assert token.expires_on == pytest.approx(one_hour_ahead)
\ No newline at end of file
+        assert token.expires_on == pytest.approx(one_hour_ahead)
+
+    def test_azure_quantum_token_credential_file_parsed_once(self):
+        content = {
+            "access_token": "fake_token",
+            "expires_on": (time.time() + 60*60) * 1000
+        }
+
+        tmpdir = self.create_temp_dir()
+        file = Path(tmpdir) / "token.json"
+        file.write_text(json.dumps(content))
+        with patch.dict(os.environ, { "AZURE_QUANTUM_TOKEN_FILE": str(file.resolve()) }, clear=True):
+            credential = _TokenFileCredential()
+            with patch.object(credential, "_parse_token_file", wraps=credential._parse_token_file) as parse:
+                assert credential.get_token(_AZURE_QUANTUM_SCOPE).token == "fake_token"
+                assert credential.get_token(_AZURE_QUANTUM_SCOPE).token == "fake_token"
+                assert parse.call_count == 1
+
+                # The file is parsed again when it changes
+                content["access_token"] = "new_fake_token!"
+                file.write_text(json.dumps(content))
+                assert credential.get_token(_AZURE_QUANTUM_SCOPE).token == "new_fake_token!"
+                assert parse.call_count == 2
+
+    def test_default_credential_caches_tokens(self):
+        with patch.dict(os.environ, {}, clear=True):
+            fake = _FakeCredential("fake_token")
+            credential = _default_credential([_FakeCredential(), fake])
+            assert credential.get_token(_AZURE_QUANTUM_SCOPE).token == "fake_token"
+            assert credential.get_token(_AZURE_QUANTUM_SCOPE).token == "fake_token"
+            assert fake.calls == 1
+
+            # Claims challenges are never served from the cache
+            credential.get_token(_AZURE_QUANTUM_SCOPE, claims="claims")
+            assert fake.calls == 2
+
+            # Tokens for other tenants are cached separately
+            credential.get_token(_AZURE_QUANTUM_SCOPE, tenant_id="other")
+            assert fake.calls == 3
+
+    def test_default_credential_refreshes_tokens_before_expiry(self):
+        with patch.dict(os.environ, {}, clear=True):
+            fake = _FakeCredential("fake_token", expires_in=_REFRESH_MARGIN_SECONDS - 10)
+            credential = _default_credential([fake])
+            credential.get_token(_AZURE_QUANTUM_SCOPE)
+            credential.get_token(_AZURE_QUANTUM_SCOPE)
+            assert fake.calls == 2
+
+            # A token that is about to expire is used if it cannot be refreshed
+            fake.token = None
+            assert credential.get_token(_AZURE_QUANTUM_SCOPE).token == "fake_token"
+
+            # but not once it expired
+            credential._token_cache._tokens.clear()
+            with pytest.raises(ClientAuthenticationError):
+                credential.get_token(_AZURE_QUANTUM_SCOPE)
+
+    def test_default_credential_persistent_token_cache(self):
+        tmpdir = self.create_temp_dir()
+        path = str(Path(tmpdir) / "cache" / "tokens.json")
+        with patch.dict(os.environ, { "AZURE_QUANTUM_TOKEN_CACHE": path }, clear=True):
+            fake = _OtherFakeCredential("fake_token")
+            credential = _default_credential([_FakeCredential(), fake])
+            credential.get_token(_AZURE_QUANTUM_SCOPE)
+            assert os.path.isfile(path)
+            if os.name != "nt":
+                assert os.stat(path).st_mode & 0o777 == 0o600
+
+            # Another credential (e.g. in another process) reuses the token
+            other_fake = _OtherFakeCredential("other_token")
+            other = _default_credential([_FakeCredential(), other_fake])
+            assert other.get_token(_AZURE_QUANTUM_SCOPE).token == "fake_token"
+            assert other_fake.calls == 0
+
+            # and starts with the credential that succeeded last
+            first = _FakeCredential("first_token")
+            other = _default_credential([first, other_fake])
+            other.get_token(_AZURE_QUANTUM_SCOPE, claims="claims")
+            assert first.calls == 0
+            assert other_fake.calls == 1
+
+    def test_default_credential_cache_key_has_tenant_and_identity(self):
+        tmpdir = self.create_temp_dir()
+        path = str(Path(tmpdir) / "tokens.json")
+        fake = _FakeCredential("fake_token")
+        initialize_credentials = _DefaultAzureCredential._initialize_credentials
+
+        def _initialize_credentials(credential):
+            initialize_credentials(credential)
+            credential.credentials = [fake]
+
+        with patch.dict(os.environ, { "AZURE_QUANTUM_TOKEN_CACHE": path }, clear=True), \
+             patch.object(_DefaultAzureCredential, "_get_tenant_id", return_value="resolved") as get_tenant_id, \
+             patch.object(_DefaultAzureCredential, "_initialize_credentials", _initialize_credentials):
+            # The tenant is only resolved when no token is cached
+            credential = _DefaultAzureCredential(subscription_id="sub")
+            credential.get_token(_AZURE_QUANTUM_SCOPE)
+            assert credential.interactive_browser_tenant_id == "resolved"
+            assert get_tenant_id.call_count == 3
+
+            other = _DefaultAzureCredential(subscription_id="sub")
+            assert other.get_token(_AZURE_QUANTUM_SCOPE).token == "fake_token"
+            assert other.credentials is None or len(other.credentials) == 0
+            assert get_tenant_id.call_count == 3
+
+            # Tokens of other tenants and identities are cached separately
+            other_fake = _FakeCredential("other_token")
+            for kwargs in [
+                {"interactive_browser_tenant_id": "other"},
+                {"managed_identity_client_id": "client"},
+                {"shared_cache_username": "user"},
+            ]:
+                other = _DefaultAzureCredential(subscription_id="sub", **kwargs)
+                other.credentials = [other_fake]
+                assert other.get_token(_AZURE_QUANTUM_SCOPE).token == "other_token"
+            assert other_fake.calls == 3
+
+    def test_aio_default_credential_persistent_token_cache(self):
+        tmpdir = self.create_temp_dir()
+        path = str(Path(tmpdir) / "tokens.json")
+        threads = []
+        get = _PersistentTokenCache.get
+
+        def _get(cache, key):
+            threads.append(threading.current_thread())
+            return get(cache, key)
+
+        with patch.dict(os.environ, { "AZURE_QUANTUM_TOKEN_CACHE": path }, clear=True), \
+             patch.object(_PersistentTokenCache, "get", _get), \
+             patch.object(_AioDefaultAzureCredential, "_initialize_credentials") as initialize_credentials:
+            credential = _default_credential([_FakeCredential("fake_token")])
+            credential.get_token(_AZURE_QUANTUM_SCOPE)
+
+            # A token cached by another process is used without initializing
+            # the credentials, and the cache file is read off the event loop
+            aio_credential = _AioDefaultAzureCredential(subscription_id="sub", interactive_browser_tenant_id="tenant")
+            token = asyncio.run(aio_credential.get_token(_AZURE_QUANTUM_SCOPE))
+            assert token.token == "fake_token"
+            assert initialize_credentials.call_count == 0
+            assert threads[-1] is not threading.main_thread()
+
+    def test_persistent_token_cache_ignores_invalid_file(self):
+        tmpdir = self.create_temp_dir()
+        file = Path(tmpdir) / "tokens.json"
+        file.write_text("not a json")
+        cache = _PersistentTokenCache(str(file))
+        assert cache.get("key") is None
+
+        token = AccessToken("fake_token", int(time.time() + 60*60))
+        cache.put("key", token, "Credential")
+        assert _PersistentTokenCache(str(file)).get("key") == token
+        assert _PersistentTokenCache(str(file)).get_credential_name("key") == "Credential"
@@ -18,6 +18,10 @@ from cirq import ParamResolver
 from azure.quantum.job.job import Job
 from azure.quantum.cirq import AzureQuantumService
 from azure.quantum.cirq.targets.target import Target
+from azure.quantum.cirq.targets import IonQTarget, QuantinuumTarget
+from azure.quantum.target import Quantinuum
+from azure.quantum.target.target_factory import TargetFactory
+from azure.quantum.translation import TranslationPool
 
 from cirq_ionq import Job as CirqIonqJob
 
@@ -169,6 +173,98 @@ class TestCirq(QuantumTestBase):
                     assert result.measurements["q0"].sum() == result.measurements["q1"].sum()
                     assert result.measurements["q1"].sum() == result.measurements["q2"].sum()
 
+    def test_translate_on_translation_pool(self):
+        workspace = self.create_workspace()
+        program = self._3_qubit_ghz_cirq()
+        with TranslationPool(max_workers=1) as pool:
+            service = AzureQuantumService(workspace=workspace, translation_pool=pool)
+            created = {
+                name: service._target_factory.create_target(provider_id=provider_id, name=name)
+                for provider_id, name in [("quantinuum", "quantinuum.sim.h1-1e"), ("ionq", "ionq.simulator")]
+            }
+            # Targets are created without a pool, the service wires its own into them
+            assert all(target.translation_pool is None for target in created.values())
+
+            def get_targets(self, name=None, provider_id=None):
+                return created[name]
+
+            with mock.patch.object(TargetFactory, "get_targets", get_targets):
+                target = service.get_target("quantinuum.sim.h1-1e")
+                ionq_target = service.get_target("ionq.simulator")
+
+            assert target.translation_pool is pool
+            assert ionq_target.translation_pool is pool
+            assert target.translation_cache is ionq_target.translation_cache
+            assert target._translate_program(program) == program.to_qasm()
+            assert ionq_target._translate_program(program).body == IonQTarget._translate_cirq_circuit(program).body
+
+    def test_run_sweep_quantinuum(self):
+        import cirq
+        import sympy
+
+        theta = sympy.Symbol("theta")
+        q0 = cirq.LineQubit(0)
+        program = cirq.Circuit(cirq.rx(theta).on(q0), cirq.measure(q0, key="q0"))
+        sweep = cirq.Points("theta", [0.0, np.pi, 0.0, np.pi, 0.0])
+
+        workspace = self.create_workspace()
+        service = AzureQuantumService(workspace=workspace)
+        target = service._target_factory.create_target(
+            provider_id="quantinuum", name="quantinuum.sim.h1-1e"
+        )
+        service._configure_target(target)
+
+        submitted = []
+        def submit(circuit, name, num_shots, metadata, **kwargs):
+            azure_job = mock.MagicMock()
+            azure_job.details.metadata = metadata
+            bit = "1" if "pi" in circuit else "0"
+            azure_job.get_results.return_value = {"m_q0": [bit] * num_shots}
+            submitted.append(circuit)
+            return azure_job
+
+        with mock.patch.object(service, "get_target", return_value=target), \
+            mock.patch.object(Quantinuum, "submit", side_effect=submit), \
+            mock.patch.object(QuantinuumTarget, "_translate_cirq_circuit", wraps=QuantinuumTarget._translate_cirq_circuit) as translate:
+            results = service.run_sweep(program, params=sweep, repetitions=3, max_parallel_submissions=2)
+
+        assert len(submitted) == 5
+        # Sweep points that resolve to the same circuit are only translated once
+        assert translate.call_count == 2
+        assert [result.params["theta"] for result in results] == [0.0, np.pi, 0.0, np.pi, 0.0]
+        assert [result.measurements["q0"].sum() for result in results] == [0, 3, 0, 3, 0]
+
+    def test_run_sweep_partial_failure(self):
+        import cirq
+        import sympy
+
+        theta = sympy.Symbol("theta")
+        q0 = cirq.LineQubit(0)
+        program = cirq.Circuit(cirq.rx(theta).on(q0), cirq.measure(q0, key="q0"))
+        sweep = cirq.Points("theta", [0.0, np.pi])
+
+        workspace = self.create_workspace()
+        service = AzureQuantumService(workspace=workspace)
+        target = service._target_factory.create_target(
+            provider_id="quantinuum", name="quantinuum.sim.h1-1e"
+        )
+
+        submitted = []
+        def submit(program, repetitions, name):
+            # Sweep points are submitted in order with a single worker, the second one fails
+            if submitted:
+                raise RuntimeError("Upload failed")
+            job = mock.MagicMock()
+            submitted.append(job)
+            return job
+
+        with mock.patch.object(target, "submit", side_effect=submit):
+            with pytest.raises(RuntimeError) as excinfo:
+                service._submit_sweep(target, program, 3, list(cirq.to_resolvers(sweep)), "sweep", 1)
+
+        assert excinfo.value.submitted_jobs == submitted
+        submitted[0].cancel.assert_called_once_with()
+
     @pytest.mark.quantinuum
     def test_plugins_estimate_cost_cirq_quantinuum(self):
         workspace = self.create_workspace()
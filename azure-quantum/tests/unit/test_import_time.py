@@ -0,0 +1,61 @@
+#!/bin/env python
+# -*- coding: utf-8 -*-
+##
+# test_import_time.py: Checks that importing azure.quantum stays lazy
+##
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+##
+import json
+import subprocess
+import sys
+import unittest
+
+# Modules that must only be loaded on first use, loading them takes several
+# hundred milliseconds (see tests/perf/test_import_benchmarks.py)
+LAZY_MODULES = (
+    "azure.quantum._client",
+    "azure.quantum.job",
+    "azure.quantum.optimization",
+    "azure.quantum.serialization",
+    "azure.quantum.storage",
+    "azure.quantum.target",
+    "azure.quantum.workspace",
+    "azure.storage.blob",
+    "google.protobuf",
+    "numpy",
+)
+
+_IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import azure.quantum
+seconds = time.perf_counter() - start
+print(json.dumps({"seconds": seconds, "modules": sorted(sys.modules)}))
+"""
+
+
+def _import_azure_quantum():
+    output = subprocess.check_output([sys.executable, "-c", _IMPORT_SCRIPT])
+    return json.loads(output)
+
+
+class TestImportTime(unittest.TestCase):
+    def test_import_is_lazy(self):
+        modules = set(_import_azure_quantum()["modules"])
+        loaded = [module for module in LAZY_MODULES if module in modules]
+        self.assertEqual([], loaded)
+
+    def test_lazy_attributes(self):
+        import azure.quantum
+        from azure.quantum import Job, JobStatus, Workspace
+        from azure.quantum.job.job import Job as JobClass
+        from azure.quantum.workspace import Workspace as WorkspaceClass
+
+        self.assertIs(Job, JobClass)
+        self.assertIs(Workspace, WorkspaceClass)
+        self.assertEqual("Succeeded", JobStatus.SUCCEEDED.value)
+        self.assertIsNotNone(azure.quantum.optimization.Problem)
+        self.assertIn("Workspace", dir(azure.quantum))
+        with self.assertRaises(AttributeError):
+            azure.quantum.does_not_exist
@@ -0,0 +1,151 @@
+#!/bin/env python
+# -*- coding: utf-8 -*-
+##
+# test_instrumentation.py: Checks the metrics and tracing of the job pipeline
+##
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+##
+import contextlib
+import io
+import unittest
+from unittest import mock
+
+import pytest
+import requests
+import urllib3
+from azure.core import PipelineClient
+from azure.core.pipeline.policies import RetryPolicy
+from azure.core.rest import HttpRequest
+
+from azure.quantum import instrumentation
+from azure.quantum.instrumentation import InstrumentedRequestsTransport, metrics
+from azure.quantum.job.job import Job
+from azure.quantum.optimization import Problem, Term
+from azure.quantum.workspace import Workspace
+
+CONTAINER_URI = "https://account.blob.core.windows.net/job"
+
+
+class _FakeSession(requests.Session):
+    """Session answering requests with the given status codes."""
+    def __init__(self, status_codes):
+        super().__init__()
+        self.status_codes = list(status_codes)
+
+    def request(self, method, url, **kwargs):
+        response = requests.Response()
+        response.status_code = self.status_codes.pop(0)
+        response.raw = urllib3.HTTPResponse(body=io.BytesIO(b"{}"), preload_content=False)
+        response.headers["Content-Length"] = "2"
+        response.url = url
+        response.request = requests.Request(method, url).prepare()
+        return response
+
+
+class _FakeTracer:
+    def __init__(self):
+        self.spans = []
+
+    @contextlib.contextmanager
+    def start_as_current_span(self, name, attributes=None):
+        span = mock.Mock()
+        self.spans.append((name, attributes, span))
+        yield span
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        metrics.reset()
+        instrumentation.enable(tracing=False)
+
+    def tearDown(self):
+        instrumentation.disable()
+        metrics.reset()
+
+    def test_disabled_is_noop(self):
+        instrumentation.disable()
+        assert not instrumentation.is_enabled()
+        with instrumentation.span("stage") as span:
+            span.set_attribute("key", "value")
+        instrumentation.count("bytes", 10)
+        assert instrumentation.span("other") is span
+        assert metrics.snapshot() == {"counters": {}, "timers": {}}
+
+    def test_metrics_registry(self):
+        with instrumentation.span("stage"):
+            pass
+        with pytest.raises(ValueError):
+            with instrumentation.span("stage"):
+                raise ValueError()
+        instrumentation.count("bytes", 10)
+        instrumentation.count("bytes", 5)
+
+        timer = metrics.timer("stage")
+        assert timer["count"] == 2
+        assert 0 <= timer["min"] <= timer["max"] <= timer["total"]
+        assert metrics.counter("stage.errors") == 1
+        assert metrics.counter("bytes") == 15
+        assert metrics.counter("missing") == 0
+        assert metrics.timer("missing") is None
+        assert set(metrics.snapshot()["timers"]) == {"stage"}
+
+    def test_tracing(self):
+        tracer = _FakeTracer()
+        instrumentation.enable(tracer=tracer)
+        with instrumentation.span("stage", bytes=3) as span:
+            span.set_attribute("status_code", 200)
+
+        [(name, attributes, otel_span)] = tracer.spans
+        assert name == "stage"
+        assert attributes == {"bytes": 3}
+        otel_span.set_attribute.assert_called_once_with("status_code", 200)
+        assert metrics.timer("stage")["count"] == 1
+
+    def test_transport_counts_retries(self):
+        transport = InstrumentedRequestsTransport(
+            session=_FakeSession([503, 503, 200]), session_owner=False
+        )
+        client = PipelineClient(
+            "https://example.com",
+            policies=[RetryPolicy(retry_backoff_factor=0)],
+            transport=transport,
+        )
+        response = client.send_request(HttpRequest("PUT", "https://example.com/blob", content=b"abcd"))
+        assert response.status_code == 200
+        assert metrics.counter("http.requests") == 3
+        assert metrics.counter("http.retries") == 2
+        assert metrics.counter("http.bytes_sent") == 12
+        assert metrics.counter("http.bytes_received") == 6
+        assert metrics.timer("http.PUT")["count"] == 3
+
+    def test_problem_upload(self):
+        ws = mock.Mock(spec=Workspace)
+        ws.get_container_uri.return_value = CONTAINER_URI
+        problem = Problem(name="test", terms=[Term(c=1, indices=[0, 1])])
+        with mock.patch("azure.quantum.job.base_job.upload_blob") as upload_blob:
+            upload_blob.return_value = CONTAINER_URI + "/inputData"
+            problem.upload(ws)
+
+        for stage in ("problem.upload", "problem.serialize", "problem.compress",
+                      "problem.get_container_uri", "job.upload_input_data"):
+            assert metrics.timer(stage)["count"] == 1, stage
+        assert metrics.counter("job.upload_input_data.bytes") == len(upload_blob.call_args[0][4])
+
+    def test_job_wait_and_results(self):
+        ws = mock.Mock(spec=Workspace)
+        details = mock.Mock(id="id", status="Succeeded", output_data_uri=CONTAINER_URI + "/out?se=2099")
+        ws.get_job.side_effect = [
+            mock.Mock(details=mock.Mock(status="Executing")),
+            mock.Mock(details=details),
+        ]
+        job = Job(ws, mock.Mock(id="id", status="Waiting"))
+        with mock.patch("azure.quantum.job.base_job.download_blob", return_value=b'{"a": 1}'), \
+             mock.patch("time.sleep"):
+            assert job.get_results() == {"a": 1}
+
+        assert metrics.counter("job.polls") == 2
+        assert metrics.timer("job.wait_until_completed")["count"] == 1
+        assert metrics.timer("job.get_results")["count"] == 1
+        assert metrics.timer("job.download_data")["count"] == 1
+        assert metrics.counter("job.download_data.bytes") == 8
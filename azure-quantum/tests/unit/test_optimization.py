@@ -216,13 +216,14 @@ class TestProblem(QuantumTestBase):
         deserialized = Problem.deserialize(problem.serialize(), problem.name)
         self.assertEqual(problem.name, deserialized.name)
         self.assertEqual(problem.problem_type, deserialized.problem_type)
-        self.assertEqual(count + 1, len(deserialized.terms))
+        self.assertEqual(count, len(deserialized.terms))
+        self.assertEqual(1, len(deserialized.terms_slc))
         self.assertEqual(problem.init_config, deserialized.init_config)
-        self.assertEqual(Term(c=0, indices=[0, 1]), problem.terms[0])
-        self.assertEqual(Term(c=1, indices=[1, 2]), problem.terms[1])
+        self.assertEqual(Term(c=0, indices=[0, 1]), deserialized.terms[0])
+        self.assertEqual(Term(c=1, indices=[1, 2]), deserialized.terms[1])
         self.assertEqual(
             SlcTerm(subterms, c=1),
-            problem.terms_slc[-1]
+            deserialized.terms_slc[-1]
         )
 
     def test_deserialize_init_config(self):
@@ -379,6 +380,38 @@ class TestProblem(QuantumTestBase):
         problem.add_slc_term([(1.0, i) for i in range(3000)])
         self.assertTrue(problem.is_large())
 
+    def test_problem_stats(self):
+        problem = Problem(name="test", terms=[], problem_type=ProblemType.pubo)
+        self.assertEqual(0, problem.stats["num_terms"])
+        self.assertEqual(0, problem.stats["num_variables"])
+
+        problem.add_term(2.0, [0, 1, 2])
+        problem.add_terms([Term(indices=[1], c=-1.5), Term(indices=[], c=4)])
+        stats = problem.stats
+        self.assertEqual("pubo", stats["type"])
+        self.assertEqual(3, stats["num_terms"])
+        self.assertEqual(3, stats["num_variables"])
+        self.assertEqual(3, stats["max_coupling"])
+        self.assertEqual(0, stats["min_coupling"])
+        self.assertEqual(4 / 3, stats["avg_coupling"])
+        self.assertEqual(-1.5, stats["min_coefficient"])
+        self.assertEqual(4, stats["max_coefficient"])
+
+        # Terms of squared linear combinations are counted individually
+        problem.add_slc_term([(3.0, 5), (-7.0, None)])
+        stats = problem.stats
+        self.assertEqual("pubo_grouped", stats["type"])
+        self.assertEqual(5, stats["num_terms"])
+        self.assertEqual(4, stats["num_variables"])
+        self.assertEqual(-7, stats["min_coefficient"])
+
+        # Statistics are recomputed when the term lists are replaced
+        problem.terms = problem.terms[:1]
+        stats = problem.stats
+        self.assertEqual(3, stats["num_terms"])
+        self.assertEqual(4, stats["num_variables"])
+        self.assertEqual(3, stats["max_coefficient"])
+
 
 class TestSolvers(QuantumTestBase):
     def test_available_solvers(self):
@@ -405,6 +405,56 @@ class TestProblemClass(unittest.TestCase):
         self.assertEqual( len(deserialized_problem.terms), 12 )
         self.assertEqual(deserialized_problem.problem_type, ProblemType.pubo)
         self.assertEqual(deserialized_problem.name, problem.name)
+
+    def test_proto_round_trip(self):
+        problem = Problem(name="test_proto", problem_type=ProblemType.ising, content_type=ContentType.protobuf)
+        problem.terms = [Term(c=i + 0.5, indices=[i, i + 1]) for i in range(2500)]
+
+        deserialized_problem = Problem.deserialize(problem.serialize())
+        self.assertEqual(deserialized_problem.terms, problem.terms)
+        self.assertEqual(deserialized_problem.problem_type, ProblemType.ising)
+
+        # Compressed payload, as uploaded
+        deserialized_problem = Problem.deserialize(problem.to_blob(), content_type=ContentType.protobuf)
+        self.assertEqual(deserialized_problem.terms, problem.terms)
+        self.assertEqual(deserialized_problem.name, problem.name)
+
+    def test_json_round_trip(self):
+        problem = Problem(
+            name="test_json",
+            terms=[
+                Term(c=3, indices=[1, 0]),
+                Term(c=-0.5, indices=[]),
+                SlcTerm([Term(c=1, indices=[0]), Term(c=-2.5, indices=[1]), Term(c=1, indices=[])], c=2),
+                SlcTerm([Term(c=1, indices=[2])], c=0.5),
+            ],
+            init_config={"0": 1, "1": 0, "2": 1},
+            problem_type=ProblemType.pubo,
+        )
+        serialized = problem.serialize()
+        compressed = problem.to_blob()
+        for payload in [serialized, serialized.encode(), compressed]:
+            deserialized = Problem.deserialize(payload)
+            self.assertEqual(deserialized.name, problem.name)
+            self.assertEqual(deserialized.problem_type, ProblemType.pubo_grouped)
+            self.assertEqual(deserialized.terms, problem.terms)
+            self.assertEqual(deserialized.terms_slc, problem.terms_slc)
+            self.assertEqual(deserialized.init_config, problem.init_config)
+            self.assertEqual(deserialized.serialize(), serialized)
+
+        # Incremental parsing of tiny chunks
+        for payload in [serialized.encode(), compressed]:
+            chunks = [payload[i:i + 3] for i in range(0, len(payload), 3)]
+            deserialized = Problem.from_json_chunks(chunks, name="renamed")
+            self.assertEqual(deserialized.name, "renamed")
+            self.assertEqual(deserialized.serialize(), serialized.replace("test_json", "renamed"))
+
+    def test_from_json_chunks_invalid(self):
+        payload = Problem(name="test", terms=[Term(c=1, indices=[0])]).serialize().encode()
+        with self.assertRaises(ValueError):
+            Problem.from_json_chunks([payload[:-1]])
+        with self.assertRaises(ValueError):
+            Problem.from_json_chunks([payload + b"{}"])
     
     def tearDown(self):
         test_files = [
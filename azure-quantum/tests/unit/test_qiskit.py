@@ -11,10 +11,16 @@ import warnings
 import pytest
 import json
 import random
+import tempfile
+import threading
+import time
 
 import numpy as np
 
-from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
+from concurrent.futures import ThreadPoolExecutor
+
+from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister, transpile
+from qiskit.circuit import Parameter
 from qiskit.providers import JobStatus
 from qiskit.providers.exceptions import QiskitBackendNotFoundError
 from qiskit_ionq.exceptions import IonQGateError
@@ -23,10 +29,43 @@ from qiskit_ionq import GPIGate, GPI2Gate, MSGate
 from azure.quantum.job.job import Job
 from azure.quantum.qiskit import AzureQuantumProvider
 from azure.quantum.qiskit.job import AzureQuantumJob
+from azure.quantum.qiskit.results import histogram
+from azure.quantum.translation import TranslationCache, TranslationPool
 from azure.quantum.qiskit.backends import QuantinuumEmulatorBackend
+from azure.quantum.qiskit.backends.ionq import IonQSimulatorBackend
+from azure.quantum.qiskit.backends.quantinuum import QuantinuumSyntaxCheckerBackend
 
 from common import QuantumTestBase, ZERO_UID
 
+class FakeAzureJob:
+    """ Stands in for an Azure Quantum job that completed successfully. """
+    def __init__(self, id, kwargs):
+        self.id = id
+        self.kwargs = kwargs
+        self.results = None
+        self.details = unittest.mock.MagicMock()
+        self.details.id = id
+        self.details.name = kwargs["name"]
+        self.details.target = kwargs["target"]
+        self.details.status = "Succeeded"
+        self.details.error_data = None
+        self.details.input_params = kwargs["input_params"]
+        self.details.output_data_format = kwargs["output_data_format"]
+        self.details.metadata = {
+            key: value if isinstance(value, str) else json.dumps(value)
+            for key, value in kwargs["metadata"].items()
+        }
+
+    def wait_until_completed(self, timeout_secs=None):
+        pass
+
+    def refresh(self):
+        pass
+
+    def get_results(self):
+        return self.results
+
+
 class TestQiskit(QuantumTestBase):
     """TestIonq
 
@@ -85,6 +124,43 @@ class TestQiskit(QuantumTestBase):
         assert AzureQuantumJob._qir_to_qiskit_bitstring(azure_registers) == " ".join(f"{bit}10" for bit in reversed(bits))
         assert AzureQuantumJob._qir_to_qiskit_bitstring(bitstring) == bitstring
 
+    def test_qir_to_qiskit_bitstring_fast_path(self):
+        keys = ["[0, 1, 1]", "([0, 1], [1])", "[0, 1],[1, 1, 0]", "([1],)", "101", 5]
+        for key in keys:
+            assert histogram.qir_bitstring(key, AzureQuantumJob._qir_to_qiskit_bitstring) \
+                == AzureQuantumJob._qir_to_qiskit_bitstring(key)
+
+    def test_ionq_histogram_to_probabilities(self):
+        az_histogram = {"0": 0.25, "1": 0.25, "5": 0.25, "7": 0.25}
+        meas_map = [0, 2]
+        probabilities = histogram.ionq_probabilities(
+            az_histogram,
+            3,
+            meas_map,
+            fallback=lambda key: AzureQuantumJob._to_bitstring(key, 3, meas_map)
+        )
+        assert probabilities == {"00": 0.25, "01": 0.25, "11": 0.5}
+
+    def test_quantinuum_shot_counts(self):
+        shots = 1000
+        registers = [
+            random.choices(["000", "011", "111"], k=shots),
+            random.choices(["0", "1"], k=shots),
+        ]
+        combined = ["".join(bitstrings) for bitstrings in zip(*registers)]
+        expected = {bitstring: combined.count(bitstring) for bitstring in set(combined)}
+        assert histogram.shot_counts(registers) == expected
+
+        # Outcomes wider than 64 bits are counted as strings
+        wide = [["0" * 40 + "1"] * 3, ["1" * 30] * 3]
+        assert histogram.shot_counts(wide) == {"0" * 40 + "1" + "1" * 30: 3}
+
+    def test_sample_counts_matches_seeded_choice(self):
+        probabilities = {"00": 0.25, "01": 0.5, "11": 0.25}
+        samples = np.random.RandomState(42).choice(list(probabilities), 500, p=list(probabilities.values()))
+        expected = dict(zip(*np.unique(samples, return_counts=True)))
+        assert histogram.sample_counts(probabilities, 500, np.random.RandomState(42)) == expected
+
     def test_qiskit_submit_ionq_5_qubit_superposition(self):
         with unittest.mock.patch.object(
             Job,
@@ -192,22 +268,36 @@ class TestQiskit(QuantumTestBase):
                 )
             assert "some.invalid.format is not a supported data format for target ionq.simulator." == str(excinfo.value)
 
-    @pytest.mark.ionq
-    @pytest.mark.live_test
     def test_plugins_submit_qiskit_multi_circuit_experiment_to_ionq(self):
-        circuit = self._3_qubit_ghz()
-
-        workspace = self.create_workspace()
-        provider = AzureQuantumProvider(workspace=workspace)
-        assert "azure-quantum-qiskit" in provider._workspace.user_agent
-        backend = provider.get_backend("ionq.simulator")
-
-        with pytest.raises(NotImplementedError) as exc:
-            backend.run(
-                circuit=[circuit, circuit],
-                shots=500
-            )
-        assert str(exc.value) == "Multi-experiment jobs are not supported!"
+        circuits = [self._3_qubit_ghz(), self._5_qubit_superposition()]
+        circuits[1].name = "superposition"
+
+        provider = AzureQuantumProvider(workspace=unittest.mock.MagicMock())
+        backend = IonQSimulatorBackend(name="ionq.simulator", provider=provider)
+
+        azure_jobs = {}
+        def from_input_data(workspace, **kwargs):
+            azure_job = FakeAzureJob(f"job-{len(azure_jobs)}", kwargs)
+            azure_jobs[kwargs["name"]] = azure_job
+            return azure_job
+
+        with unittest.mock.patch.object(Job, "from_input_data", side_effect=from_input_data):
+            qiskit_job = backend.run(circuit=circuits, shots=500)
+
+        assert set(azure_jobs) == {circuits[0].name, "superposition"}
+        assert qiskit_job.id() == ",".join(
+            azure_jobs[circuit.name].id for circuit in circuits
+        )
+
+        azure_jobs[circuits[0].name].results = {"histogram": {"0": 0.5, "7": 0.5}}
+        azure_jobs["superposition"].results = {"histogram": {"0": 0.5, "1": 0.5}}
+        result = qiskit_job.result()
+        assert len(result.results) == 2
+        assert result.data(0)["probabilities"] == {"000": 0.5, "111": 0.5}
+        assert result.data(1)["probabilities"] == {"0": 0.5, "1": 0.5}
+        assert sum(result.get_counts(circuits[0]).values()) == 500
+        assert sum(result.get_counts("superposition").values()) == 500
+        assert qiskit_job.status() == JobStatus.DONE
 
     @pytest.mark.ionq
     @pytest.mark.live_test
@@ -421,23 +511,55 @@ class TestQiskit(QuantumTestBase):
         circuit = self._3_qubit_ghz()
         self._test_qiskit_submit_quantinuum(circuit=[circuit])
 
-    @pytest.mark.quantinuum
-    @pytest.mark.live_test
     def test_plugins_submit_qiskit_multi_circuit_experiment_to_quantinuum(self):
         circuit = self._3_qubit_ghz()
 
-        workspace = self.create_workspace()
+        provider = AzureQuantumProvider(workspace=unittest.mock.MagicMock())
+        backend = QuantinuumSyntaxCheckerBackend(name="quantinuum.hqs-lt-s1-apival", provider=provider)
+
+        submitted = []
+        def from_input_data(workspace, **kwargs):
+            azure_job = FakeAzureJob(f"job-{len(submitted)}", kwargs)
+            azure_job.results = {"c": ["000"] * 4 + ["111"] * 6}
+            submitted.append(azure_job)
+            return azure_job
+
+        with unittest.mock.patch.object(Job, "from_input_data", side_effect=from_input_data):
+            qiskit_job = backend.run(circuit=[circuit, circuit], shots=10, max_parallel_submissions=2)
+
+        assert len(submitted) == 2
+        assert all(azure_job.kwargs["input_params"]["count"] == 10 for azure_job in submitted)
+
+        result = qiskit_job.result()
+        assert len(result.results) == 2
+        for index in range(2):
+            assert result.data(index)["counts"] == {"000": 4, "111": 6}
+
+        submitted[1].details.status = "Executing"
+        assert qiskit_job.status() == JobStatus.RUNNING
+        submitted[0].details.status = "Failed"
+        assert qiskit_job.status() == JobStatus.ERROR
+
+    def test_plugins_submit_qiskit_multi_circuit_experiment_partial_failure(self):
+        circuits = [self._3_qubit_ghz(), self._5_qubit_superposition()]
+        circuits[1].name = "superposition"
+
+        workspace = unittest.mock.MagicMock()
         provider = AzureQuantumProvider(workspace=workspace)
-        backend = provider.get_backend("quantinuum.hqs-lt-s1-apival")
-        assert "quantinuum.hqs-lt-s1-apival" in backend.backend_names
-        assert backend.backend_names[0] in [t.name for t in workspace.get_targets(provider_id="quantinuum")]
+        backend = IonQSimulatorBackend(name="ionq.simulator", provider=provider)
 
-        with pytest.raises(NotImplementedError) as exc:
-            backend.run(
-                circuit=[circuit, circuit],
-                shots=None
-            )
-        assert str(exc.value) == "Multi-experiment jobs are not supported!"
+        def from_input_data(workspace, **kwargs):
+            if kwargs["name"] == "superposition":
+                raise RuntimeError("Upload failed")
+            return FakeAzureJob("job-0", kwargs)
+
+        with unittest.mock.patch.object(Job, "from_input_data", side_effect=from_input_data):
+            with pytest.raises(RuntimeError) as excinfo:
+                backend.run(circuit=circuits, shots=500, max_parallel_submissions=1)
+
+        submitted_jobs = excinfo.value.submitted_jobs
+        assert [azure_job.id for azure_job in submitted_jobs] == ["job-0"]
+        workspace.cancel_job.assert_called_once_with(submitted_jobs[0])
 
     def _test_qiskit_submit_quantinuum(self, circuit, **kwargs):
 
@@ -506,6 +628,113 @@ class TestQiskit(QuantumTestBase):
         assert "arguments" in params
         assert "targetCapability" in params
 
+    def test_translate_qir_uses_translation_cache(self):
+        provider = AzureQuantumProvider(workspace=unittest.mock.MagicMock())
+        backend = QuantinuumEmulatorBackend("quantinuum.sim.h1-2sc-preview", provider)
+        backend.translation_cache = TranslationCache(max_size=2)
+        input_format = backend.configuration().azure["input_data_format"]
+
+        def translate(circuit):
+            (payload, _, _) = backend._translate_input(circuit, input_format, {"targetCapability": "AdaptiveExecution"})
+            return payload
+
+        theta = Parameter("theta")
+        template = QuantumCircuit(1, 1, name="rotation")
+        template.rx(theta, 0)
+        template.measure(0, 0)
+
+        with unittest.mock.patch("azure.quantum.qiskit.backends.backend.transpile", wraps=transpile) as transpile_mock:
+            first = translate(template.bind_parameters({theta: 0.5}))
+            assert translate(template.bind_parameters({theta: 0.5})) == first
+            assert transpile_mock.call_count == 1
+            assert backend.translation_cache.hits == 1
+
+            assert translate(template.bind_parameters({theta: 1.5})) != first
+            assert transpile_mock.call_count == 2
+
+            # Least recently used entries are evicted
+            translate(self._3_qubit_ghz())
+            assert len(backend.translation_cache) == 2
+            translate(template.bind_parameters({theta: 0.5}))
+            assert transpile_mock.call_count == 4
+
+    def test_translate_qir_on_translation_pool(self):
+        circuit = self._3_qubit_ghz()
+        input_params = {"targetCapability": "AdaptiveExecution"}
+
+        backend = QuantinuumEmulatorBackend(
+            "quantinuum.sim.h1-2sc-preview", AzureQuantumProvider(workspace=unittest.mock.MagicMock())
+        )
+        backend.translation_cache = None
+        input_format = backend.configuration().azure["input_data_format"]
+        (expected, _, _) = backend._translate_input(circuit, input_format, input_params.copy())
+
+        with TranslationPool(max_workers=2) as pool:
+            provider = AzureQuantumProvider(workspace=unittest.mock.MagicMock(), translation_pool=pool)
+            backend = QuantinuumEmulatorBackend("quantinuum.sim.h1-2sc-preview", provider)
+            backend.translation_cache = None
+            with unittest.mock.patch.object(pool, "translate", wraps=pool.translate) as translate:
+                (payload, _, _) = backend._translate_input(circuit, input_format, input_params.copy())
+                assert translate.call_count == 1
+
+        # qiskit-qir does not emit declarations in a deterministic order
+        from pyqir.generator import bitcode_to_ir
+        assert sorted(bitcode_to_ir(payload).splitlines()) == sorted(bitcode_to_ir(expected).splitlines())
+
+    def test_translation_cache_persists_to_disk(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = TranslationCache(cache_dir=cache_dir)
+            key = TranslationCache.make_key("circuit", 1)
+            assert cache.get_or_translate(key, lambda: b"qir") == b"qir"
+
+            other_process_cache = TranslationCache(cache_dir=cache_dir)
+            assert key in other_process_cache
+            assert other_process_cache.get_or_translate(key, lambda: b"unexpected") == b"qir"
+            assert other_process_cache.hits == 1
+
+    def test_backend_classes_include_new_subclasses(self):
+        workspace = self.create_workspace()
+        provider = AzureQuantumProvider(workspace=workspace)
+        backend_classes = provider._get_backend_classes()
+        assert backend_classes["ionq.simulator"] is IonQSimulatorBackend
+        # The subclasses are not walked again
+        with unittest.mock.patch.object(
+            AzureQuantumProvider, "_get_all_subclasses", side_effect=AssertionError
+        ):
+            assert provider._get_backend_classes() is backend_classes
+
+        class NewIonQSimulatorBackend(IonQSimulatorBackend):
+            backend_names = ("new.ionq.simulator",)
+
+        # Subclasses of existing backends are picked up
+        backend_classes = provider._get_backend_classes()
+        assert backend_classes["new.ionq.simulator"] is NewIonQSimulatorBackend
+
+    def test_translation_cache_deduplicates_in_flight_translations(self):
+        cache = TranslationCache()
+        key = TranslationCache.make_key("circuit", 1)
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def translate():
+            calls.append(1)
+            started.set()
+            release.wait(timeout=10)
+            return b"qir"
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(cache.get_or_translate, key, translate)
+            started.wait(timeout=10)
+            second = executor.submit(cache.get_or_translate, key, translate)
+            # The second call waits for the translation of the first one
+            time.sleep(0.1)
+            assert not second.done()
+            release.set()
+            assert first.result() == b"qir"
+            assert second.result() == b"qir"
+        assert len(calls) == 1
+
 
     @pytest.mark.quantinuum
     @pytest.mark.live_test
@@ -16,10 +16,33 @@ from azure.core.exceptions import HttpResponseError
 from azure.quantum.job.job import Job
 from azure.quantum._client.models import CostEstimate, UsageEvent
 from azure.quantum.target import Quantinuum
+from azure.quantum.target.qasm import GateCounts, count_gates
 
 from common import QuantumTestBase, ZERO_UID
 
 
+def _count_gates_qiskit(circuit: str) -> GateCounts:
+    """Counts the gates of a circuit by converting it into a qiskit DAG, to
+    cross-check count_gates. Unlike count_gates, calls to gates defined in
+    the circuit count as a single gate, and barriers are counted as
+    multi-qubit gates."""
+    from qiskit.circuit.quantumcircuit import Qasm
+    from qiskit.converters import ast_to_dag
+    from qiskit.dagcircuit.dagnode import DAGOpNode
+
+    dag = ast_to_dag(Qasm(data=circuit).parse())
+    N_1q, N_2q, N_m = 0, 0, 0
+    for node in dag._multi_graph.nodes():
+        if isinstance(node, DAGOpNode):
+            if node.op.name in ["measure", "reset"]:
+                N_m += 1
+            elif node.op.num_qubits == 1:
+                N_1q += 1
+            else:
+                N_2q += 1
+    return GateCounts(N_1q, N_2q, N_m)
+
+
 class TestQuantinuum(QuantumTestBase):
     mock_create_job_id_name = "create_job_id"
     create_job_id = Job.create_job_id
@@ -51,6 +74,79 @@ class TestQuantinuum(QuantumTestBase):
         measure q[1] -> c2[0];
         """
 
+    def test_count_gates(self):
+        circuit = self._teleport()
+        assert count_gates(circuit) == GateCounts(one_qubit=7, two_qubit=2, measurements=3)
+        # Streaming line by line gives the same result
+        assert count_gates(circuit.splitlines(keepends=True)) == count_gates(circuit)
+
+    def test_count_gates_expands_registers_and_definitions(self):
+        circuit = """OPENQASM 2.0;
+        include "qelib1.inc";
+        // Comments; with {separators}
+        gate bell(theta) a, b { h a; rz(theta * (pi / 2), 0) b; cx a, b; }
+        gate twice a, b { bell(0) a, b; barrier a, b; bell(pi) b, a; }
+        opaque magic a, b;
+        qreg q[4];
+        qreg r[4];
+        creg c[4];
+        reset q;
+        h q;
+        cx q, r;
+        cx q[0], r;
+        twice q[0], q[1];
+        bell(0.5) q, r;
+        magic q[2], q[3];
+        barrier q, r;
+        if (c==3) u3(0.1, 0.2, 0.3) r[1];
+        measure q -> c;
+        measure r[0] -> c[0];
+        """
+        assert count_gates(circuit) == GateCounts(
+            one_qubit=4 + 4 + 8 + 1,
+            two_qubit=4 + 4 + 2 + 4 + 1,
+            measurements=4 + 4 + 1,
+        )
+
+    def test_count_gates_matches_keywords_exactly(self):
+        circuit = """OPENQASM 2.0;
+include "qelib1.inc";
+qreg q[2];
+creg c[2];
+opaque include_x a;
+opaque cregfoo a, b;
+gate measure_x a { h a; }
+include_x q[0];
+cregfoo q[0], q[1];
+measure_x q;
+measure q -> c;
+"""
+        assert count_gates(circuit) == GateCounts(one_qubit=3, two_qubit=1, measurements=2)
+
+    def test_count_gates_invalid(self):
+        with pytest.raises(ValueError):
+            count_gates("qreg q[1]; h q[0]")
+        with pytest.raises(ValueError):
+            count_gates("qreg q[1]; gate g a { h a; ")
+
+    def test_count_gates_matches_qiskit(self):
+        pytest.importorskip("qiskit")
+
+        circuit = self._teleport()
+        assert count_gates(circuit) == _count_gates_qiskit(circuit)
+
+        # Random circuits of standard gates, including register-wide ops
+        gates = ["h q[{0}];", "rz(pi/{1}) q[{0}];", "cx q[{0}], q[{2}];", "ccx q[0], q[1], q[2];",
+                 "reset q[{0}];", "x q;", "cx q, r;", "measure q[{0}] -> c[{0}];", "measure r -> c;"]
+        random = np.random.RandomState(42)
+        for _ in range(5):
+            lines = ['OPENQASM 2.0;', 'include "qelib1.inc";', "qreg q[5];", "qreg r[5];", "creg c[5];"]
+            for gate in random.choice(gates, 50):
+                first, second = random.choice(5, 2, replace=False)
+                lines.append(gate.format(first, random.randint(1, 8), second))
+            qasm = "\n".join(lines)
+            assert count_gates(qasm) == _count_gates_qiskit(qasm)
+
     @pytest.mark.quantinuum
     def test_job_estimate_cost_quantinuum(self):
         with unittest.mock.patch.object(
@@ -5,7 +5,7 @@ from typing import Dict, Any, Union, Optional
 from unittest.mock import MagicMock
 
 import pytest
-from numpy import pi, mean
+from numpy import pi, mean, int8, uint8, int64, float64, complex128, shares_memory
 
 from azure.quantum.job import Job
 from azure.quantum.target import Rigetti
@@ -84,7 +84,7 @@ class TestRigettiTarget(QuantumTestBase):
             job = workspace.get_job(job.id)
             assert job.has_completed()
 
-            return Result(job)
+            return Result(job, program=quil)
 
     def test_job_submit_rigetti_typed_input_params(self) -> None:
         num_shots = 5
@@ -148,9 +148,59 @@ class FakeJob:
 
 class TestResult:
     def test_integers(self) -> None:
+        result = Result(FakeJob(b'{"ro": [[0, 0], [1, 1]]}'), program=BELL_STATE_QUIL)
+
+        readout = result[READOUT]
+        assert readout.dtype == int8
+        assert readout.shape == (2, 2)
+        assert result.to_list(READOUT) == [[0, 0], [1, 1]]
+
+    def test_undeclared_integers(self) -> None:
         result = Result(FakeJob(b'{"ro": [[0, 0], [1, 1]]}'))
 
-        assert result[READOUT] == [[0, 0], [1, 1]]
+        assert result[READOUT].dtype == int64
+        assert result.to_list(READOUT) == [[0, 0], [1, 1]]
+
+    def test_declared_dtype_does_not_depend_on_values(self) -> None:
+        program = f"DECLARE {READOUT} OCTET[2]\n"
+        small = Result(FakeJob(b'{"ro": [[0, 1], [2, 3]]}'), program=program)
+        large = Result(FakeJob(b'{"ro": [[0, 255], [128, 3]]}'), program=program)
+
+        assert small[READOUT].dtype == uint8
+        assert large[READOUT].dtype == uint8
+        assert large.to_list(READOUT) == [[0, 255], [128, 3]]
+
+    def test_wide_integers(self) -> None:
+        program = f"DECLARE {READOUT} INTEGER[2]\n"
+        result = Result(FakeJob(b'{"ro": [[0, 255], [-1, 1000]]}'), program=program)
+
+        assert result[READOUT].dtype == int64
+        assert result.to_list(READOUT) == [[0, 255], [-1, 1000]]
+
+    def test_reals(self) -> None:
+        result = Result(FakeJob(b'{"ro": [[0.5, 1], [1, 0.25]]}'))
+
+        assert result[READOUT].dtype == float64
+        assert result.to_list(READOUT) == [[0.5, 1.0], [1.0, 0.25]]
+
+    def test_complex(self) -> None:
+        result = Result(FakeJob(b'{"ro": [[[1.0, 2.0]], [[3.0, -4.0]]]}'))
+
+        readout = result[READOUT]
+        assert readout.dtype == complex128
+        assert readout.shape == (2, 1)
+        assert result.to_list(READOUT) == [[complex(1, 2)], [complex(3, -4)]]
+
+    def test_per_substitution(self) -> None:
+        result = Result(FakeJob(b'{"ro": [[0], [0], [1], [1], [0], [0]]}'))
+
+        per_substitution = result.per_substitution(READOUT, 3)
+        assert per_substitution.shape == (3, 2, 1)
+        assert shares_memory(per_substitution, result[READOUT])
+        assert per_substitution[1].tolist() == [[1], [1]]
+
+        with pytest.raises(ValueError):
+            result.per_substitution(READOUT, 4)
 
     def test_unsuccessful_job(self) -> None:
         details = MagicMock()
@@ -66,6 +66,24 @@ class TestIonQ(QuantumTestBase):
         cost = target.estimate_cost(circuit, num_shots=100e3)
         assert np.round(cost.estimated_total) == 63.0
 
+    def test_estimate_costs_ionq(self):
+        workspace = self.create_workspace()
+        circuits = [self._3_qubit_ghz(), {"qubits": 1, "circuit": [{"gate": "h", "target": 0}]}]
+        targets = ["ionq.simulator", IonQ(workspace=workspace, name="ionq.qpu")]
+        shots = [100, 100000]
+
+        estimates = workspace.estimate_costs(circuits, targets, shots)
+        assert len(estimates) == 8
+        assert estimates["circuit"].tolist() == [0, 0, 0, 0, 1, 1, 1, 1]
+        assert estimates["target"].tolist() == ["ionq.simulator"] * 2 + ["ionq.qpu"] * 2 + \
+            ["ionq.simulator"] * 2 + ["ionq.qpu"] * 2
+        assert estimates["shots"].tolist() == shots * 4
+        for row in estimates:
+            target = IonQ(workspace=workspace, name=row["target"])
+            cost = target.estimate_cost(circuits[row["circuit"]], num_shots=row["shots"])
+            assert row["estimated_total"] == pytest.approx(cost.estimated_total)
+            assert row["currency_code"] == cost.currency_code == "USD"
+
 
     @pytest.mark.ionq
     @pytest.mark.live_test
@@ -236,6 +254,25 @@ class TestQuantinuum(QuantumTestBase):
             cost = target.estimate_cost(circuit, num_shots=100e3)
             assert cost.estimated_total == 845.0
 
+    def test_estimate_costs_quantinuum(self):
+        workspace = self.create_workspace()
+        circuits = [self._teleport(), "qreg q[2]; creg c[2]; cx q[0], q[1]; measure q -> c;"]
+        targets = ["quantinuum.qpu.h1-1", "quantinuum.sim.h1-1e", "quantinuum.sim.h1-1sc"]
+
+        estimates = workspace.estimate_costs(circuits, targets, 100e3)
+        assert len(estimates) == 6
+        assert estimates["estimated_total"].tolist() == [845.0, 845.0, 0.0, 405.0, 405.0, 0.0]
+        assert estimates["currency_code"].tolist() == ["HQC", "EHQC", "HQC"] * 2
+        assert estimates["one_qubit"].tolist() == [7] * 3 + [0] * 3
+        assert estimates["two_qubit"].tolist() == [2] * 3 + [1] * 3
+        assert estimates["measurements"].tolist() == [3] * 3 + [2] * 3
+
+        # Gate counts are computed once per circuit and cached on the workspace
+        cache = workspace._gate_counts_cache
+        assert (len(cache), cache.misses, cache.hits) == (2, 2, 4)
+        workspace.estimate_costs(circuits[::-1], targets[:1], [1, 10])
+        assert (cache.misses, cache.hits) == (2, 6)
+
     @pytest.mark.quantinuum
     @pytest.mark.live_test
     def test_job_submit_quantinuum(self):
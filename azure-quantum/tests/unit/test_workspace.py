@@ -8,8 +8,14 @@
 ##
 import pytest
 import os
+from types import SimpleNamespace
+from unittest import mock
 from azure.quantum import Workspace
 from azure.quantum.workspace import USER_AGENT_APPID_ENV_VAR_NAME
+from azure.quantum.target import IonQ, Target
+from azure.quantum.target.target_factory import TargetFactory
+from azure.quantum.job.job import Job
+from azure.storage.blob import BlobClient
 from common import QuantumTestBase
 
 class TestWorkspace(QuantumTestBase):
@@ -150,6 +156,92 @@ class TestWorkspace(QuantumTestBase):
             target.name = "foo"
             target.refresh()
 
+    def _mock_provider_status(self, ws):
+        status = [
+            SimpleNamespace(id="ionq", targets=[
+                SimpleNamespace(id="ionq.simulator", current_availability="Available", average_queue_time=1),
+                SimpleNamespace(id="ionq.qpu", current_availability="Degraded", average_queue_time=100),
+            ]),
+        ]
+        return mock.patch.object(ws._client.providers, "get_status", return_value=status)
+
+    def test_workspace_get_targets_cached(self):
+        ws = self.create_workspace()
+        with self._mock_provider_status(ws) as get_status:
+            targets = ws.get_targets()
+            assert sorted(t.name for t in targets) == ["ionq.qpu", "ionq.simulator"]
+            target = ws.get_targets("IonQ.QPU")
+            assert isinstance(target, IonQ)
+            assert target.average_queue_time == 100
+            assert get_status.call_count == 1
+
+            # Explicit refreshes bypass the cache
+            target.refresh()
+            assert get_status.call_count == 2
+            ws.get_targets("ionq.qpu", refresh=True)
+            assert get_status.call_count == 3
+
+            # Expired entries are fetched again
+            ws.target_status_ttl = 0
+            ws.get_targets("ionq.simulator")
+            assert get_status.call_count == 4
+
+    def test_target_factory_registry_memoized(self):
+        ws = self.create_workspace()
+        registry = TargetFactory(base_cls=Target, workspace=ws)._all_targets
+        assert registry["ionq.qpu"] is IonQ
+        assert TargetFactory(base_cls=Target, workspace=ws)._all_targets is registry
+
+        class NewTarget(Target):
+            target_names = ("new.target",)
+
+        # New subclasses are picked up
+        registry = TargetFactory(base_cls=Target, workspace=ws)._all_targets
+        assert registry["new.target"] is NewTarget
+
+        class NewIonQ(IonQ):
+            target_names = ("new.ionq",)
+
+        # So are subclasses of existing targets
+        registry = TargetFactory(base_cls=Target, workspace=ws)._all_targets
+        assert registry["new.ionq"] is NewIonQ
+        assert registry["new.target"] is NewTarget
+        assert TargetFactory(base_cls=Target, workspace=ws)._all_targets is registry
+
+    def test_workspace_shared_transport(self):
+        ws = self.create_workspace()
+        transport = ws._transport
+        assert ws._client._client._pipeline._transport is transport
+        ws.append_user_agent("test-shared-transport")
+        assert ws._client._client._pipeline._transport is transport
+
+        # Closing a client keeps the pooled connections open for the others
+        blob_url = "https://account.blob.core.windows.net/container/blob?se=2099-01-01"
+        with BlobClient.from_blob_url(blob_url, transport=transport) as blob_client:
+            assert blob_client._pipeline._transport is transport
+        assert transport.session is not None
+
+        # Other workspaces have their own connection pool
+        assert self.create_workspace()._transport is not transport
+
+    def test_job_helpers_use_shared_transport(self):
+        ws = self.create_workspace()
+        with mock.patch("azure.quantum.job.base_job.upload_blob") as upload_blob, \
+             mock.patch("azure.quantum.job.base_job.download_blob") as download_blob, \
+             mock.patch.object(ws, "get_container_uri", return_value="https://account.blob.core.windows.net/job"):
+            upload_blob.return_value = "https://account.blob.core.windows.net/job/inputData"
+            job = Job.from_input_data(
+                ws, name="job", target="ionq.simulator", input_data=b"{}",
+                content_type="application/json", provider_id="ionq",
+                input_data_format="ionq.circuit.v1", output_data_format="ionq.quantum-results.v1",
+                submit_job=False,
+            )
+            container_client = upload_blob.call_args[0][0]
+            assert container_client._pipeline._transport is ws._transport
+
+            job.download_data("https://account.blob.core.windows.net/job/rawOutputData?se=2099-01-01")
+            assert download_blob.call_args[1]["transport"] is ws._transport
+
     @pytest.mark.live_test
     def test_workspace_job_quotas(self):
         ws = self.create_workspace()
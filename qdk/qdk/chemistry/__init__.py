@@ -1,3 +1,4 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 from qdk.chemistry.molecule import Molecule
+from qdk.chemistry.batch import create_inputs
@@ -0,0 +1,34 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+##
+# Module for the results of batch operations, shared by batch and submission
+##
+import traceback
+
+from typing import Dict
+
+
+class StageResult(object):
+    """Base class of the results of one item of a batch, which record the
+    errors that occurred by stage instead of raising them. Subclasses are
+    dataclasses with an errors field.
+    """
+    errors: Dict[str, str]
+
+    @property
+    def succeeded(self) -> bool:
+        return not self.errors
+
+
+def format_error(error: BaseException) -> str:
+    """Format an exception with its traceback, to record it in a result
+
+    :param error: Exception
+    :type error: BaseException
+    :return: Formatted exception and traceback
+    :rtype: str
+    """
+    return "".join(
+        traceback.format_exception(type(error), error, error.__traceback__)
+    )
@@ -37,6 +37,16 @@ from qdk.chemistry._xyz2mol.bo import *
 _log = logging.getLogger(__name__)
 
 
+# Budget of the bond order search in AC2BO, so that molecules with many
+# unsaturated atoms or ambiguous valences cannot hang
+MAX_BO_SEARCH_STEPS = 1000000
+BO_SEARCH_TIMEOUT = 30.0
+
+# Above this number of atoms, bonded pairs are found with a cell list instead
+# of the dense distance matrix
+DENSE_AC_MAX_ATOMS = 1000
+
+
 def get_AC(mol, covalent_factor=1.3):
     """
     Generate adjacent matrix from atoms and coordinates.
@@ -50,24 +60,69 @@ def get_AC(mol, covalent_factor=1.3):
         AC - adjacent matrix
     """
 
-    # Calculate distance matrix
-    dMat = Chem.Get3DDistanceMatrix(mol)
-
+    # Covalent radii of the atoms, looked up once per element
     pt = Chem.GetPeriodicTable()
-    num_atoms = mol.GetNumAtoms()
+    atomic_nums = np.array([atom.GetAtomicNum() for atom in mol.GetAtoms()], dtype=int)
+    elements, inverse = np.unique(atomic_nums, return_inverse=True)
+    radii = np.array([pt.GetRcovalent(int(z)) for z in elements])[inverse] * covalent_factor
+
+    num_atoms = len(atomic_nums)
+    if num_atoms <= DENSE_AC_MAX_ATOMS:
+        # Calculate distance matrix
+        dMat = Chem.Get3DDistanceMatrix(mol)
+        AC = (dMat <= radii[:, np.newaxis] + radii[np.newaxis, :]).astype(int)
+        np.fill_diagonal(AC, 0)
+        return AC
+
+    positions = mol.GetConformer().GetPositions()
+    i, j = get_neighbor_pairs(positions, cutoff=2 * radii.max())
+    bonded = np.linalg.norm(positions[i] - positions[j], axis=1) <= radii[i] + radii[j]
     AC = np.zeros((num_atoms, num_atoms), dtype=int)
+    AC[i[bonded], j[bonded]] = 1
+    AC[j[bonded], i[bonded]] = 1
+    return AC
 
-    for i in range(num_atoms):
-        a_i = mol.GetAtomWithIdx(i)
-        Rcov_i = pt.GetRcovalent(a_i.GetAtomicNum()) * covalent_factor
-        for j in range(i + 1, num_atoms):
-            a_j = mol.GetAtomWithIdx(j)
-            Rcov_j = pt.GetRcovalent(a_j.GetAtomicNum()) * covalent_factor
-            if dMat[i, j] <= Rcov_i + Rcov_j:
-                AC[i, j] = 1
-                AC[j, i] = 1
 
-    return AC
+def get_neighbor_pairs(positions, cutoff):
+    """
+    Find the pairs of atoms that may be closer than cutoff with a cell list,
+    without computing the distances between all pairs of atoms.
+    args:
+        positions - (num_atoms, 3) array of coordinates
+        cutoff - largest distance of the returned pairs
+    returns:
+        i, j - arrays of the atom indices of the candidate pairs, with i < j
+    """
+    num_atoms = len(positions)
+    if num_atoms < 2 or cutoff <= 0:
+        empty = np.zeros(0, dtype=int)
+        return empty, empty
+
+    # Assign the atoms to cubic cells of size cutoff, padded by one cell on
+    # each side so that the keys of neighbouring cells never wrap around
+    cells = np.floor((positions - positions.min(axis=0)) / cutoff).astype(np.int64) + 1
+    dims = cells.max(axis=0) + 2
+    keys = (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+
+    pairs_i, pairs_j = [], []
+    for dx, dy, dz in itertools.product((-1, 0, 1), repeat=3):
+        # Atoms of the neighbouring cell are a contiguous range of order
+        target = keys + (dx * dims[1] + dy) * dims[2] + dz
+        start = np.searchsorted(sorted_keys, target, side="left")
+        counts = np.searchsorted(sorted_keys, target, side="right") - start
+        total = counts.sum()
+        if total == 0:
+            continue
+        i = np.repeat(np.arange(num_atoms), counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        j = order[np.repeat(start, counts) + offsets]
+        mask = i < j
+        pairs_i.append(i[mask])
+        pairs_j.append(j[mask])
+
+    return np.concatenate(pairs_i), np.concatenate(pairs_j)
 
 
 def xyz2AC(atoms, xyz, charge, use_huckel=False):
@@ -150,12 +205,106 @@ def xyz2AC_huckel(atomicNumList, xyz, charge):
     return AC, mol
 
 
-def AC2BO(AC, atoms, charge, allow_charged_fragments=True, use_graph=True):
+def _prune_valences(AC, AC_valence, valences_list_of_lists):
+    """
+    Restrict atoms that cannot get more bonds, because none of their
+    neighbours can be unsaturated, to the valence of their single bonds.
+    Larger valences leave them unsaturated, which never gives a valid bond
+    order matrix, so these valence states need not be searched.
+    """
+    changed = True
+    while changed:
+        changed = False
+        can_be_unsaturated = [
+            max(valences) > valence
+            for valences, valence in zip(valences_list_of_lists, AC_valence)
+        ]
+        for i, valences in enumerate(valences_list_of_lists):
+            if not can_be_unsaturated[i] or AC_valence[i] not in valences:
+                continue
+            neighbours = np.flatnonzero(AC[i])
+            if not any(can_be_unsaturated[j] for j in neighbours):
+                valences_list_of_lists[i] = [AC_valence[i]]
+                changed = True
+    return valences_list_of_lists
+
+
+def _iter_valence_states(AC, AC_valence, valences_list_of_lists, atoms, charge,
+                         allow_charged_fragments, budget):
+    """
+    Generate the valence states, in the order of itertools.product, that can
+    give a valid bond order matrix, with a depth-first search pruned by
+    conditions that every valid (saturated) bond order matrix satisfies:
+        - the formal charges of the atoms add up to the total charge,
+        - every atom has enough unsaturated neighbours for its unsaturation,
+        - the total unsaturation is even, as every bond saturates two atoms.
+    """
+    num_atoms = len(valences_list_of_lists)
+    if num_atoms == 0:
+        return
+    if not allow_charged_fragments and charge != 0:
+        # charge_is_OK fails for every bond order matrix
+        return
+
+    # Formal charges of the atoms for every valence option
+    charges = [
+        [get_atomic_charge(atom, atomic_valence_electrons[atom], valence) for valence in valences]
+        for atom, valences in zip(atoms, valences_list_of_lists)
+    ]
+    if allow_charged_fragments:
+        min_charge = np.cumsum([0] + [min(q) for q in charges[::-1]])[::-1]
+        max_charge = np.cumsum([0] + [max(q) for q in charges[::-1]])[::-1]
+
+    # Check the unsaturation of every atom once its neighbours are assigned
+    neighbours = [np.flatnonzero(AC[i]) for i in range(num_atoms)]
+    checks = [[] for _ in range(num_atoms)]
+    for i in range(num_atoms):
+        checks[max([i, *neighbours[i]])].append(i)
+
+    valences = [0] * num_atoms
+    DU = [0] * num_atoms
+    Q = [0] * (num_atoms + 1)
+    DU_sum = [0] * (num_atoms + 1)
+    choice = [-1] * num_atoms
+    k = 0
+    while k >= 0:
+        choice[k] += 1
+        if choice[k] == len(valences_list_of_lists[k]):
+            choice[k] = -1
+            k -= 1
+            continue
+        budget.step()
+
+        valences[k] = valences_list_of_lists[k][choice[k]]
+        DU[k] = valences[k] - AC_valence[k]
+        Q[k + 1] = Q[k] + charges[k][choice[k]]
+        DU_sum[k + 1] = DU_sum[k] + DU[k]
+        if allow_charged_fragments and not (
+            Q[k + 1] + min_charge[k + 1] <= charge <= Q[k + 1] + max_charge[k + 1]
+        ):
+            continue
+        if any(DU[i] > sum(DU[j] for j in neighbours[i]) for i in checks[k]):
+            continue
+
+        if k < num_atoms - 1:
+            k += 1
+        elif DU_sum[num_atoms] % 2 == 0:
+            yield tuple(valences)
+
+
+def AC2BO(AC, atoms, charge, allow_charged_fragments=True, use_graph=True,
+          max_steps=MAX_BO_SEARCH_STEPS, timeout=BO_SEARCH_TIMEOUT):
     """
     implemenation of algorithm shown in Figure 2
     UA: unsaturated atoms
     DU: degree of unsaturation (u matrix in Figure)
     best_BO: Bcurr in Figure
+    optional:
+        max_steps - maximum number of steps of the search, or None
+        timeout - maximum time of the search in seconds, or None
+    The valence states that can give a valid bond order matrix are searched
+    first, then the others for the best invalid one. If the search exceeds
+    its budget, the best bond order matrix found so far is returned.
     """
     # make a list of valences, e.g. for CO: [[4],[2,1]]
     valences_list_of_lists = []
@@ -177,13 +326,21 @@ def AC2BO(AC, atoms, charge, allow_charged_fragments=True, use_graph=True):
             sys.exit()
         valences_list_of_lists.append(possible_valence)
 
-    # convert [[4],[2,1]] to [[4,2],[4,1]]
-    valences_list = itertools.product(*valences_list_of_lists)
+    valences_list_of_lists = _prune_valences(AC, AC_valence, valences_list_of_lists)
 
     best_BO = AC.copy()
-
-    for valences in valences_list:
-
+    charge_OK = True
+    budget = SearchBudget(max_steps=max_steps, timeout=timeout)
+    # UA pairs by set of unsaturated atoms, shared by all valence states
+    UA_pairs_cache = {}
+    # Valence states searched in the first pass
+    searched = set()
+
+    def search(valences):
+        """
+        Returns a valid bond order matrix for the valence state, or None
+        """
+        nonlocal best_BO, charge_OK
         UA, DU_from_AC = get_UA(valences, AC_valence)
 
         check_len = len(UA) == 0
@@ -202,11 +359,16 @@ def AC2BO(AC, atoms, charge, allow_charged_fragments=True, use_graph=True):
             check_bo = None
 
         if check_len and check_bo:
-            return AC, atomic_valence_electrons
+            return AC
 
-        UA_pairs_list = get_UA_pairs(UA, AC, use_graph=use_graph)
+        UA_pairs_list = get_UA_pairs(
+            UA, AC, use_graph=use_graph, budget=budget, cache=UA_pairs_cache
+        )
         for UA_pairs in UA_pairs_list:
-            BO = get_BO(AC, UA, DU_from_AC, valences, UA_pairs, use_graph=use_graph)
+            BO = get_BO(
+                AC, UA, DU_from_AC, valences, UA_pairs,
+                use_graph=use_graph, budget=budget, cache=UA_pairs_cache
+            )
             status = BO_is_OK(
                 BO,
                 AC,
@@ -229,21 +391,51 @@ def AC2BO(AC, atoms, charge, allow_charged_fragments=True, use_graph=True):
             )
 
             if status:
-                return BO, atomic_valence_electrons
+                return BO
             elif (
                 BO.sum() >= best_BO.sum()
                 and valences_not_too_large(BO, valences)
                 and charge_OK
             ):
                 best_BO = BO.copy()
+        return None
+
+    try:
+        for valences in _iter_valence_states(
+            AC, AC_valence, valences_list_of_lists, atoms, charge,
+            allow_charged_fragments, budget
+        ):
+            searched.add(valences)
+            BO = search(valences)
+            if BO is not None:
+                return BO, atomic_valence_electrons
+
+        # convert [[4],[2,1]] to [[4,2],[4,1]]
+        for valences in itertools.product(*valences_list_of_lists):
+            budget.step()
+            if valences in searched:
+                continue
+            BO = search(valences)
+            if BO is not None:
+                return BO, atomic_valence_electrons
+    except SearchBudgetExceeded as e:
+        _log.warning(
+            f"Bond order search stopped after {budget.steps} steps ({e}), "
+            "using the best bond orders found so far"
+        )
 
     if not charge_OK:
         _log.debug("Warning: SMILES charge doesn't match input charge")
     return best_BO, atomic_valence_electrons
 
 
-def AC2mol(mol, AC, atoms, charge, allow_charged_fragments=True, use_graph=True):
-    """ """
+def AC2mol(mol, AC, atoms, charge, allow_charged_fragments=True, use_graph=True,
+           max_steps=MAX_BO_SEARCH_STEPS, timeout=BO_SEARCH_TIMEOUT):
+    """
+    optional:
+        max_steps - maximum number of steps of the bond order search, or None
+        timeout - maximum time of the bond order search in seconds, or None
+    """
 
     # convert AC matrix to bond order (BO) matrix
     BO, atomic_valence_electrons = AC2BO(
@@ -252,6 +444,8 @@ def AC2mol(mol, AC, atoms, charge, allow_charged_fragments=True, use_graph=True)
         charge,
         allow_charged_fragments=allow_charged_fragments,
         use_graph=use_graph,
+        max_steps=max_steps,
+        timeout=timeout,
     )
 
     # add BO connectivity and charge info to mol object
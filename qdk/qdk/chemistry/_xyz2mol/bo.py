@@ -34,13 +34,18 @@ from rdkit.Chem import AllChem, rdmolops
 from qdk.chemistry._xyz2mol.util import *
 
 
-def get_BO(AC, UA, DU, valences, UA_pairs, use_graph=True):
+def get_BO(AC, UA, DU, valences, UA_pairs, use_graph=True, budget=None, cache=None):
     """
+    optional:
+        budget - SearchBudget of the bond order search
+        cache - dictionary memoizing get_UA_pairs for the same AC
     """
     BO = AC.copy()
     DU_save = []
 
     while DU_save != DU:
+        if budget is not None:
+            budget.step()
         for i, j in UA_pairs:
             BO[i, j] += 1
             BO[j, i] += 1
@@ -48,7 +53,7 @@ def get_BO(AC, UA, DU, valences, UA_pairs, use_graph=True):
         BO_valence = list(BO.sum(axis=1))
         DU_save = copy.copy(DU)
         UA, DU = get_UA(valences, BO_valence)
-        UA_pairs = get_UA_pairs(UA, AC, use_graph=use_graph)[0]
+        UA_pairs = get_UA_pairs(UA, AC, use_graph=use_graph, budget=budget, cache=cache)[0]
 
     return BO
 
@@ -0,0 +1,112 @@
+import itertools
+import os
+import time
+
+import pytest
+from rdkit import Chem
+
+from qdk.chemistry._xyz2mol.ac import AC2BO
+from qdk.chemistry._xyz2mol.util import (
+    SearchBudget,
+    SearchBudgetExceeded,
+    get_UA_pairs,
+    read_xyz_file
+)
+from qdk.chemistry._xyz2mol.xyz2mol import xyz2mol
+
+# Benchmark set of XYZ inputs with many unsaturated atoms or ambiguous
+# valences, for which the exhaustive bond order search blows up
+__HARD_FILES__ = [
+    ("hard_hmx.xyz", "O=[N+]([O-])N1CN([N+](=O)[O-])CN([N+](=O)[O-])CN([N+](=O)[O-])C1"),
+    ("hard_hexanitrobenzene.xyz", "O=[N+]([O-])c1c([N+](=O)[O-])c([N+](=O)[O-])c([N+](=O)[O-])c([N+](=O)[O-])c1[N+](=O)[O-]"),
+    ("hard_tnt.xyz", "Cc1c([N+](=O)[O-])cc([N+](=O)[O-])cc1[N+](=O)[O-]"),
+    ("hard_coronene.xyz", "c1cc2ccc3ccc4ccc5ccc6ccc1c1c2c3c4c5c61"),
+    ("hard_porphyrin.xyz", "C1=Cc2cc3ccc(cc4nc(cc5ccc(cc1n2)[nH]5)C=C4)[nH]3"),
+    ("hard_polyene.xyz", "C=CC=CC=CC=CC=CC=CC=CC=CC=CC=CC=C"),
+]
+
+
+def _read(filename):
+    return read_xyz_file(os.path.join(os.path.split(__file__)[0], filename))
+
+
+def _canonical_smiles(mol):
+    mol = Chem.RemoveHs(mol)
+    Chem.RemoveStereochemistry(mol)
+    return Chem.MolToSmiles(Chem.MolFromSmiles(Chem.MolToSmiles(mol)))
+
+
+@pytest.mark.parametrize("filename, answer", __HARD_FILES__)
+def test_hard_xyz_files(filename, answer, caplog):
+    atoms, charge, coordinates = _read(filename)
+    # The pruned bond order search completes hard files in at most a few
+    # tens of thousands of steps
+    mols = xyz2mol(
+        atoms, coordinates, charge=charge, max_steps=50000, timeout=None
+    )
+    assert "Bond order search stopped" not in caplog.text
+    assert Chem.MolToSmiles(Chem.MolFromSmiles(answer)) in \
+        [_canonical_smiles(mol) for mol in mols]
+
+
+@pytest.mark.parametrize("filename, answer", __HARD_FILES__)
+def test_hard_xyz_files_without_graph(filename, answer):
+    atoms, charge, coordinates = _read(filename)
+    # The search without graph matching is exponential, but stays in budget
+    mols = xyz2mol(atoms, coordinates, charge=charge, use_graph=False, max_steps=20000)
+    assert len(mols) > 0
+
+
+def test_search_budget():
+    budget = SearchBudget(max_steps=2)
+    budget.step()
+    budget.step()
+    with pytest.raises(SearchBudgetExceeded):
+        budget.step()
+
+    budget = SearchBudget(timeout=0)
+    time.sleep(0.01)
+    with pytest.raises(SearchBudgetExceeded):
+        budget.step()
+
+
+def test_AC2BO_budget_exceeded():
+    atoms, charge, coordinates = _read("hard_hexanitrobenzene.xyz")
+    mol = xyz2mol(atoms, coordinates, charge=charge)[0]
+    AC = Chem.GetAdjacencyMatrix(mol)
+    # Returns the best bond orders found so far instead of searching on
+    BO, _ = AC2BO(AC, atoms, charge, max_steps=1)
+    assert BO.shape == AC.shape
+    assert (BO >= AC).all()
+
+
+def _get_UA_pairs_exhaustive(UA, AC):
+    """
+    Original enumeration of all combinations of bonds
+    """
+    bonds = [(i, j) for k, i in enumerate(UA) for j in UA[k + 1:] if AC[i, j] == 1]
+    if len(bonds) == 0:
+        return [()]
+    max_atoms_in_combo = 0
+    UA_pairs = [()]
+    for combo in itertools.combinations(bonds, int(len(UA) / 2)):
+        atoms_in_combo = len(set(itertools.chain(*combo)))
+        if atoms_in_combo > max_atoms_in_combo:
+            max_atoms_in_combo = atoms_in_combo
+            UA_pairs = [combo]
+        elif atoms_in_combo == max_atoms_in_combo:
+            UA_pairs.append(combo)
+    return UA_pairs
+
+
+@pytest.mark.parametrize("smiles", ["C=CC=CC=C", "c1ccccc1", "C=C(C=C)C=C", "C#CC(=C)C=O"])
+def test_get_UA_pairs_combinations(smiles):
+    mol = Chem.MolFromSmiles(smiles)
+    Chem.Kekulize(mol, clearAromaticFlags=True)
+    AC = Chem.GetAdjacencyMatrix(mol)
+    num_atoms = mol.GetNumAtoms()
+    for size in range(2, num_atoms + 1):
+        for UA in itertools.combinations(range(num_atoms), size):
+            UA = list(UA)
+            assert get_UA_pairs(UA, AC, use_graph=False) == \
+                _get_UA_pairs_exhaustive(UA, AC), UA
@@ -13,7 +13,8 @@ from qdk.chemistry._xyz2mol.util import (
 )
 
 from qdk.chemistry._xyz2mol.xyz2mol import xyz2mol
-from qdk.chemistry._xyz2mol.ac import AC2mol
+from qdk.chemistry._xyz2mol import ac
+from qdk.chemistry._xyz2mol.ac import AC2mol, get_AC
 
 __TEST_SMILES__ = [
     'C[C-](c1ccccc1)C',
@@ -177,3 +178,26 @@ def test_smiles_from_xyz_files(filename, charge, answer):
     assert answer in smiles_list
 
     return
+
+
+@pytest.mark.parametrize("num_atoms", [1, 2, 200])
+def test_get_AC_cell_list(monkeypatch, num_atoms):
+    rng = np.random.default_rng(num_atoms)
+    atoms = [int(atom) for atom in rng.choice([1, 6, 7, 8], num_atoms)]
+    coordinates = rng.uniform(0, (10 * num_atoms) ** (1 / 3), (num_atoms, 3))
+    mol = get_proto_mol(atoms)
+    conf = Chem.Conformer(num_atoms)
+    for i, position in enumerate(coordinates):
+        conf.SetAtomPosition(i, tuple(position))
+    mol.AddConformer(conf)
+
+    dense = get_AC(mol)
+    monkeypatch.setattr(ac, "DENSE_AC_MAX_ATOMS", 0)
+    cell_list = get_AC(mol)
+
+    assert (dense == cell_list).all()
+    assert (dense == dense.T).all()
+    assert not dense.diagonal().any()
+    if num_atoms == 200:
+        assert dense.sum() > 0
+
@@ -14,6 +14,7 @@ Implementation by Jan H. Jensen, based on the paper
 
 import itertools
 import tempfile
+import time
 import os
 import uuid
 
@@ -182,36 +183,123 @@ def get_bonds(UA, AC):
     return bonds
 
 
-def get_UA_pairs(UA, AC, use_graph=True):
+class SearchBudgetExceeded(Exception):
     """
+    Raised when the bond order search runs out of steps or time
     """
 
-    bonds = get_bonds(UA, AC)
 
-    if len(bonds) == 0:
-        return [()]
+class SearchBudget:
+    """
+    Hard limit on the number of steps and the time of the bond order search
+    args:
+        max_steps - maximum number of steps, or None for no limit
+        timeout - maximum time in seconds, or None for no limit
+    """
+
+    def __init__(self, max_steps=None, timeout=None):
+        self.max_steps = max_steps
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+        self.steps = 0
+
+    def step(self):
+        """
+        Count a step, raises SearchBudgetExceeded if the budget is exhausted
+        """
+        self.steps += 1
+        if self.max_steps is not None and self.steps > self.max_steps:
+            raise SearchBudgetExceeded(f"Exceeded {self.max_steps} steps")
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise SearchBudgetExceeded("Exceeded time limit")
 
-    if use_graph:
+
+def get_UA_pairs(UA, AC, use_graph=True, budget=None, cache=None):
+    """
+    Get the lists of pairs of unsaturated atoms to add bonds between.
+    With use_graph, this is a single maximum matching of the bonds between
+    unsaturated atoms. Otherwise, these are all the combinations of
+    len(UA) / 2 bonds that cover the most unsaturated atoms.
+    optional:
+        budget - SearchBudget counting a step for every combination
+        cache - dictionary memoizing the pairs of every set of unsaturated
+            atoms, for the same AC
+    """
+    key = (tuple(UA), use_graph)
+    if cache is not None and key in cache:
+        return cache[key]
+
+    bonds = get_bonds(UA, AC)
+    if len(bonds) == 0:
+        UA_pairs = [()]
+    elif use_graph:
         G = nx.Graph()
         G.add_edges_from(bonds)
         UA_pairs = [list(nx.max_weight_matching(G))]
-        return UA_pairs
+    else:
+        UA_pairs = _get_UA_pairs_combinations(UA, bonds, budget)
+
+    if cache is not None:
+        cache[key] = UA_pairs
+    return UA_pairs
+
+
+def _get_UA_pairs_combinations(UA, bonds, budget=None):
+    """
+    Combinations of len(UA) / 2 bonds that cover the most unsaturated atoms
+    """
+    num_pairs = int(len(UA) / 2)
+
+    G = nx.Graph()
+    G.add_edges_from(bonds)
+    if len(nx.max_weight_matching(G, maxcardinality=True)) >= num_pairs:
+        # The best combinations cover 2 * num_pairs atoms, so they are exactly
+        # the matchings of num_pairs bonds: enumerate these only, in the order
+        # of itertools.combinations, pruning bonds that share atoms
+        return list(_iter_matchings(bonds, num_pairs, budget))
 
     max_atoms_in_combo = 0
     UA_pairs = [()]
-    for combo in list(itertools.combinations(bonds, int(len(UA) / 2))):
+    for combo in itertools.combinations(bonds, num_pairs):
+        if budget is not None:
+            budget.step()
         flat_list = [item for sublist in combo for item in sublist]
         atoms_in_combo = len(set(flat_list))
         if atoms_in_combo > max_atoms_in_combo:
             max_atoms_in_combo = atoms_in_combo
             UA_pairs = [combo]
-
         elif atoms_in_combo == max_atoms_in_combo:
             UA_pairs.append(combo)
 
     return UA_pairs
 
 
+def _iter_matchings(bonds, num_pairs, budget=None):
+    """
+    Generate the combinations of num_pairs bonds without shared atoms
+    """
+    combo = []
+    used = set()
+
+    def search(start):
+        if len(combo) == num_pairs:
+            yield tuple(combo)
+            return
+        # Not enough bonds left to complete the combination
+        for k in range(start, len(bonds) - (num_pairs - len(combo)) + 1):
+            if budget is not None:
+                budget.step()
+            i, j = bonds[k]
+            if i in used or j in used:
+                continue
+            combo.append(bonds[k])
+            used.update((i, j))
+            yield from search(k + 1)
+            combo.pop()
+            used.difference_update((i, j))
+
+    yield from search(0)
+
+
 def get_proto_mol(atoms):
     """
     """
@@ -11,7 +11,12 @@ Implementation by Jan H. Jensen, based on the paper
     Bull. Korean Chem. Soc. 2015, Vol. 36, 1769-1777
     DOI: 10.1002/bkcs.10334
 """
-from qdk.chemistry._xyz2mol.ac import xyz2AC, AC2mol
+from qdk.chemistry._xyz2mol.ac import (
+    xyz2AC,
+    AC2mol,
+    MAX_BO_SEARCH_STEPS,
+    BO_SEARCH_TIMEOUT
+)
 from qdk.chemistry._xyz2mol.util import chiral_stereo_check
 
 
@@ -22,7 +27,9 @@ def xyz2mol(
     allow_charged_fragments=True,
     use_graph=True,
     use_huckel=False,
-    embed_chiral=True
+    embed_chiral=True,
+    max_steps=MAX_BO_SEARCH_STEPS,
+    timeout=BO_SEARCH_TIMEOUT
 ):
     """
     Generate a rdkit molobj from atoms, coordinates and a total_charge.
@@ -35,6 +42,8 @@ def xyz2mol(
         use_graph - use graph (networkx)
         use_huckel - Use Huckel method for atom connectivity prediction
         embed_chiral - embed chiral information to the molecule
+        max_steps - maximum number of steps of the bond order search, or None
+        timeout - maximum time of the bond order search in seconds, or None
     returns:
         mols - list of rdkit molobjects
     """
@@ -47,7 +56,9 @@ def xyz2mol(
     # mol object
     new_mols = AC2mol(mol, AC, atoms, charge,
         allow_charged_fragments=allow_charged_fragments,
-        use_graph=use_graph)
+        use_graph=use_graph,
+        max_steps=max_steps,
+        timeout=timeout)
 
     # Check for stereocenters and chiral centers
     if embed_chiral:
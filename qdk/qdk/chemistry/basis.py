@@ -0,0 +1,156 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+##
+# Module for looking up the shell structure of basis sets
+##
+import json
+import logging
+import os
+import re
+import tempfile
+
+from typing import Dict, Iterable, Optional, Tuple
+
+import basis_set_exchange as bse
+
+_log = logging.getLogger(__name__)
+
+BASIS_CACHE_ENV_VAR = "QDKCHEM_BASIS_CACHE"
+
+# Contracted shells of an element in NWChem format, for example
+# "#BASIS SET: (6s,3p) -> [2s,1p]" followed by the element symbol
+CONTRACTION_PATTERN = re.compile("-> \\[([^\\]]*)\\]\n(\\w+)")
+SHELL_PATTERN = re.compile("(\\d+)([spdfghik])")
+ANGULAR_MOMENTA = "spdfghik"
+
+# Shells and symbols of the elements, by basis name and atomic number
+_shells: Dict[str, Dict[int, Tuple[str, str]]] = {}
+
+
+def _cache_path(basis: str) -> Optional[str]:
+    path = os.environ.get(BASIS_CACHE_ENV_VAR)
+    if not path:
+        return None
+    file_name = re.sub("[^\\w.+-]", "_", basis)
+    return os.path.join(path, f"{file_name}.json")
+
+
+def _load(basis: str) -> Dict[int, Tuple[str, str]]:
+    file_path = _cache_path(basis)
+    if file_path is None:
+        return {}
+    try:
+        with open(file_path) as f:
+            data = json.load(f)
+        return {
+            int(atom): (shells, symbol)
+            for atom, (shells, symbol) in data.items()
+        }
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError, TypeError) as e:
+        _log.warning(f"Ignoring invalid cached basis {file_path}: {e}")
+        return {}
+
+
+def _save(basis: str, shells: Dict[int, Tuple[str, str]]):
+    file_path = _cache_path(basis)
+    if file_path is None:
+        return
+    path = os.path.dirname(file_path)
+    os.makedirs(path, exist_ok=True)
+    # Write to a temporary file first, so that concurrent readers never see
+    # a partially written basis
+    fd, tmp_path = tempfile.mkstemp(dir=path, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump({str(atom): list(value) for atom, value in shells.items()}, f)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _fetch(basis: str, elements: Iterable[int]) -> Dict[int, Tuple[str, str]]:
+    """Fetch the basis set definition of the elements from the Basis Set
+    Exchange and parse their contracted shells"""
+    elements = sorted(elements)
+    text = bse.get_basis(basis, elements=elements, fmt="nwchem")
+    result = {
+        bse.lut.element_Z_from_sym(symbol): (shells, symbol)
+        for shells, symbol in CONTRACTION_PATTERN.findall(text)
+    }
+    assert set(result) == set(elements), \
+        f"Cannot parse basis: number of atoms does not match result: {text}"
+    return result
+
+
+def get_shells(
+    basis: str,
+    elements: Iterable[int]
+) -> Dict[int, Tuple[str, str]]:
+    """Get the contracted shells of the elements in a basis set, for
+    example {1: ("1s", "H"), 6: ("2s,1p", "C")} for STO-3G.
+    Parsed basis sets are cached in memory and, if the QDKCHEM_BASIS_CACHE
+    environment variable is set, in that directory, so that the Basis Set
+    Exchange is only queried once per basis set and element.
+
+    :param basis: Basis set name
+    :type basis: str
+    :param elements: Atomic numbers of the elements
+    :type elements: Iterable[int]
+    :return: Dictionary of atomic numbers to tuples of contracted shells and
+        element symbol
+    :rtype: Dict[int, Tuple[str, str]]
+    """
+    elements = sorted(set(elements))
+    key = basis.lower()
+    shells = _shells.get(key)
+    if shells is None:
+        shells = _shells[key] = _load(key)
+
+    missing = [atom for atom in elements if atom not in shells]
+    if missing:
+        shells.update(_fetch(basis, missing))
+        _save(key, shells)
+
+    return {atom: shells[atom] for atom in elements}
+
+
+def clear_cache():
+    """Clear the in-memory cache of basis sets"""
+    _shells.clear()
+
+
+def num_basis_functions(shells: str) -> int:
+    """Get the number of spherical basis functions (spatial orbitals) of
+    contracted shells, for example 5 for "2s,1p"
+
+    :param shells: Contracted shells, for example "3s,2p,1d"
+    :type shells: str
+    :return: Number of basis functions
+    :rtype: int
+    """
+    return sum(
+        int(num) * (2 * ANGULAR_MOMENTA.index(shell) + 1)
+        for num, shell in SHELL_PATTERN.findall(shells)
+    )
+
+
+def num_orbitals(atom_numbers: Dict[int, int], basis: str) -> int:
+    """Get the total number of spatial orbitals of a molecule
+
+    :param atom_numbers: Dictionary of atomic numbers to the number of atoms
+        of each element in the molecule
+    :type atom_numbers: Dict[int, int]
+    :param basis: Basis set name
+    :type basis: str
+    :return: Number of spatial orbitals
+    :rtype: int
+    """
+    shells = get_shells(basis, atom_numbers)
+    return sum(
+        count * num_basis_functions(shells[atom][0])
+        for atom, count in atom_numbers.items()
+    )
@@ -0,0 +1,217 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+##
+# Module for generating the input decks of many molecules in parallel
+##
+import logging
+import os
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+from rdkit.Chem import AllChem as Chem
+
+from qdk.chemistry._results import StageResult, format_error
+from qdk.chemistry.geometry import Geometry, GeometryCache
+from qdk.chemistry.molecule import DEFAULT_BASE_PATH, get_solver_spec
+
+_log = logging.getLogger(__name__)
+
+SolversType = Union[str, Iterable[str], Dict[str, Dict[str, Any]]]
+
+
+@dataclass
+class InputDeckResult(StageResult):
+    """Class for keeping track of the input decks generated for a molecule
+    and of the errors that occurred, by stage ("smiles", "geometry" or the
+    solver name)
+    """
+    index: int
+    smiles: str
+    name: str
+    file_paths: Dict[str, str] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+
+
+def _create_molecule_inputs(
+    index: int,
+    smiles: str,
+    name: str,
+    solvers: Dict[str, Dict[str, Any]],
+    base_path: str,
+    add_hs: bool,
+    num_confs: int,
+    seed: Optional[int],
+    geometry_cache: Optional[GeometryCache]
+) -> InputDeckResult:
+    """Create the input decks of one molecule. Runs in a worker process, so
+    errors are recorded in the result instead of being raised."""
+    result = InputDeckResult(index=index, smiles=smiles, name=name)
+
+    mol = Chem.MolFromSmiles(smiles)
+    if mol is None:
+        result.errors["smiles"] = f"Invalid SMILES string: {smiles}"
+        return result
+    if add_hs:
+        mol = Chem.AddHs(mol)
+
+    try:
+        if geometry_cache is not None:
+            geometry = geometry_cache.get_or_compute(
+                mol,
+                num_confs=num_confs,
+                seed=seed
+            )
+        else:
+            geometry = Geometry.from_mol(mol, num_confs=num_confs, seed=seed)
+    except Exception as e:
+        result.errors["geometry"] = format_error(e)
+        return result
+
+    for solver, parameters in solvers.items():
+        solver_spec = get_solver_spec(solver)
+        file_path = os.path.join(base_path, f"{name}{solver_spec.extension}")
+        try:
+            input_deck = solver_spec.module.create_input_deck(
+                mol=mol,
+                mol_name=name,
+                geometry=geometry,
+                **parameters
+            )
+            with open(file_path, "w") as f:
+                f.write(input_deck)
+        except Exception as e:
+            result.errors[solver] = format_error(e)
+        else:
+            result.file_paths[solver] = file_path
+
+    return result
+
+
+def _normalize_solvers(
+    solvers: SolversType,
+    parameters: Dict[str, Any]
+) -> Dict[str, Dict[str, Any]]:
+    if isinstance(solvers, str):
+        solvers = [solvers]
+    if not isinstance(solvers, dict):
+        solvers = {solver: {} for solver in solvers}
+
+    result = {}
+    for solver, solver_parameters in solvers.items():
+        # Fail early on unknown solvers
+        get_solver_spec(solver)
+        result[solver] = {**parameters, **(solver_parameters or {})}
+    return result
+
+
+def create_inputs(
+    smiles_list: Sequence[str],
+    solvers: SolversType,
+    base_path: str = None,
+    names: Optional[Sequence[str]] = None,
+    add_hs: bool = True,
+    num_confs: int = 10,
+    seed: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    geometry_cache: Optional[GeometryCache] = None,
+    **parameters
+) -> List[InputDeckResult]:
+    """Create the input decks of a batch of molecules and save them to
+    files, named after the molecule and the solver extension (for example
+    molecule_0.nw). SMILES parsing, conformer generation and input deck
+    rendering run in a process pool, and every input deck is written to disk
+    as soon as it is rendered. Failures are recorded in the result of the
+    molecule and do not abort the batch.
+
+    :param smiles_list: SMILES strings of the molecules
+    :type smiles_list: Sequence[str]
+    :param solvers: Solver name, list of solver names, or dictionary of
+        solver names to solver-specific parameters for the input decks
+    :type solvers: Union[str, Iterable[str], Dict[str, Dict[str, Any]]]
+    :param base_path: Path to save output files to, defaults to the
+        QDKCHEM_OUTPUT_PATH environment variable or the current directory
+    :type base_path: str, optional
+    :param names: Molecule names, used for the input decks and file names,
+        defaults to molecule_<index>
+    :type names: Sequence[str], optional
+    :param add_hs: Add Hydrogen atoms, defaults to True
+    :type add_hs: bool, optional
+    :param num_confs: Number of molecular conformers to generate, defaults
+        to 10
+    :type num_confs: int, optional
+    :param seed: Random seed for the conformer embedding, defaults to None
+    :type seed: int, optional
+    :param max_workers: Number of worker processes, defaults to the number
+        of CPUs. With a single worker, molecules are processed in the
+        current process.
+    :type max_workers: int, optional
+    :param geometry_cache: Persistent cache of the optimized geometries,
+        defaults to the directory set by the QDKCHEM_GEOMETRY_CACHE
+        environment variable, if any
+    :type geometry_cache: GeometryCache, optional
+    :param parameters: Parameters for the input decks of all solvers
+    :type parameters: dict
+    :raises ValueError: If a solver is not supported or the number of names
+        does not match the number of molecules
+    :return: Results of the molecules, in the order of smiles_list
+    :rtype: List[InputDeckResult]
+    """
+    smiles_list = list(smiles_list)
+    if names is None:
+        names = [f"molecule_{index}" for index in range(len(smiles_list))]
+    elif len(names) != len(smiles_list):
+        raise ValueError(
+            f"Number of names {len(names)} does not match number of \
+molecules {len(smiles_list)}"
+        )
+    solvers = _normalize_solvers(solvers, parameters)
+    if base_path is None:
+        base_path = DEFAULT_BASE_PATH
+    if geometry_cache is None:
+        geometry_cache = GeometryCache.from_env()
+    os.makedirs(base_path, exist_ok=True)
+
+    tasks = [
+        (index, smiles, name, solvers, base_path, add_hs, num_confs, seed,
+         geometry_cache)
+        for index, (smiles, name) in enumerate(zip(smiles_list, names))
+    ]
+    results = [None] * len(tasks)
+
+    def _record(result: InputDeckResult):
+        results[result.index] = result
+        if result.succeeded:
+            _log.info(
+                f"Created input decks for {result.name}: \
+{list(result.file_paths.values())}"
+            )
+        else:
+            _log.warning(
+                f"Failed to create input decks for {result.name} \
+({result.smiles}): {result.errors}"
+            )
+
+    if max_workers == 1:
+        for task in tasks:
+            _record(_create_molecule_inputs(*task))
+        return results
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_create_molecule_inputs, *task): task
+            for task in tasks
+        }
+        for future in as_completed(futures):
+            index, smiles, name = futures[future][:3]
+            try:
+                result = future.result()
+            except Exception as e:
+                # The worker process died, for example if it ran out of memory
+                result = InputDeckResult(index=index, smiles=smiles, name=name)
+                result.errors["worker"] = format_error(e)
+            _record(result)
+
+    return results
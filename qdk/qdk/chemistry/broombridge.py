@@ -4,9 +4,15 @@
 ##
 # Module for loading and encoding Broombridge data
 ##
+import hashlib
 import logging
+import os
+import tempfile
+from collections import OrderedDict
 from qsharp.chemistry import load_broombridge, load_input_state, encode
-from typing import List, Tuple
+from typing import List, NamedTuple, Optional, Tuple
+
+import numpy as np
 
 NumQubits = int
 HamiltonianTermList = Tuple[List[Tuple[List[int], List[float]]]]
@@ -21,6 +27,280 @@ JWEncodedData = Tuple[
 
 _log = logging.getLogger(__name__)
 
+BROOMBRIDGE_CACHE_ENV_VAR = "QDKCHEM_BROOMBRIDGE_CACHE"
+BROOMBRIDGE_CACHE_SIZE_ENV_VAR = "QDKCHEM_BROOMBRIDGE_CACHE_SIZE"
+
+# Default number of encodings kept in memory
+DEFAULT_CACHE_SIZE = 16
+
+# Size of the chunks in which Broombridge files are hashed
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+class JWEncodedArrays(NamedTuple):
+    """Jordan-Wigner encoded Broombridge data stored in numpy arrays.
+    Every Hamiltonian term type (PP, PQ, PQQR and PQRS) is a tuple of an
+    (n, k) array of orbital indices and an (n, m) array of coefficients, one
+    row per term, so the coefficients of all the terms of a type must have
+    the same length, as in the output of qsharp.chemistry.encode. The input
+    state terms are an (n, 2) array of the real and imaginary parts of the
+    amplitudes and the orbital indices of each term.
+    Arrays are read-only, as they are shared by all callers.
+    """
+    num_qubits: NumQubits
+    hamiltonian_terms: Tuple[Tuple[np.ndarray, np.ndarray], ...]
+    input_state_type: int
+    input_state_amplitudes: np.ndarray
+    input_state_indices: Tuple[np.ndarray, ...]
+    energy_offset: EnergyOffset
+
+    @classmethod
+    def from_jw_encoded_data(cls, data: JWEncodedData) -> "JWEncodedArrays":
+        """Convert the output of qsharp.chemistry.encode to numpy arrays
+
+        :param data: JWEncodedData-compatible tuple
+        :type data: JWEncodedData
+        :raises ValueError: If the terms of a type have indices or
+            coefficients of different lengths
+        :return: Encoded data in numpy arrays
+        :rtype: JWEncodedArrays
+        """
+        num_qubits, hamiltonian_term_list, input_state_terms, energy_offset = \
+            data
+        state_type, state_terms = input_state_terms
+        hamiltonian_terms = tuple(
+            (
+                _to_array([indices for indices, _ in terms], np.int64),
+                _to_array([coeffs for _, coeffs in terms], np.float64)
+            )
+            for terms in hamiltonian_term_list
+        )
+        amplitudes = _to_array(
+            [amplitude for amplitude, _ in state_terms], np.float64
+        ).reshape(-1, 2)
+        indices = tuple(
+            _to_array(term_indices, np.int64) for _, term_indices in state_terms
+        )
+        return cls(
+            num_qubits=int(num_qubits),
+            hamiltonian_terms=hamiltonian_terms,
+            input_state_type=int(state_type),
+            input_state_amplitudes=amplitudes,
+            input_state_indices=indices,
+            energy_offset=float(energy_offset)
+        )
+
+    def to_jw_encoded_data(self) -> JWEncodedData:
+        """Convert to the nested lists of the JWEncodedData format used by
+        the Q# chemistry library
+
+        :return: JWEncodedData-compatible tuple
+        :rtype: JWEncodedData
+        """
+        hamiltonian_term_list = [
+            list(zip(indices.tolist(), coeffs.tolist()))
+            for indices, coeffs in self.hamiltonian_terms
+        ]
+        state_terms = [
+            (tuple(amplitude), indices.tolist())
+            for amplitude, indices in zip(
+                self.input_state_amplitudes.tolist(),
+                self.input_state_indices
+            )
+        ]
+        return (
+            self.num_qubits,
+            hamiltonian_term_list,
+            (self.input_state_type, state_terms),
+            self.energy_offset
+        )
+
+    def save(self, file_path: str):
+        """Save to an npz file. The file is written to a temporary file first
+        and then moved, so that concurrent readers never see a partially
+        written file.
+
+        :param file_path: Path of the npz file
+        :type file_path: str
+        """
+        arrays = {
+            "num_qubits": np.array(self.num_qubits),
+            "input_state_type": np.array(self.input_state_type),
+            "energy_offset": np.array(self.energy_offset),
+            "input_state_amplitudes": self.input_state_amplitudes,
+            "input_state_indices": np.concatenate(
+                self.input_state_indices + (np.zeros(0, dtype=np.int64),)
+            ),
+            "input_state_lengths": np.array(
+                [len(indices) for indices in self.input_state_indices],
+                dtype=np.int64
+            ),
+            "num_term_types": np.array(len(self.hamiltonian_terms))
+        }
+        for i, (indices, coeffs) in enumerate(self.hamiltonian_terms):
+            arrays[f"term_indices_{i}"] = indices
+            arrays[f"term_coefficients_{i}"] = coeffs
+
+        path = os.path.dirname(file_path) or "."
+        os.makedirs(path, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, **arrays)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, file_path: str) -> "JWEncodedArrays":
+        """Load from an npz file written by save
+
+        :param file_path: Path of the npz file
+        :type file_path: str
+        :return: Encoded data in numpy arrays
+        :rtype: JWEncodedArrays
+        """
+        with np.load(file_path, allow_pickle=False) as data:
+            lengths = data["input_state_lengths"]
+            indices = np.split(
+                data["input_state_indices"], np.cumsum(lengths)[:-1]
+            ) if len(lengths) else []
+            return cls(
+                num_qubits=int(data["num_qubits"]),
+                hamiltonian_terms=tuple(
+                    (data[f"term_indices_{i}"], data[f"term_coefficients_{i}"])
+                    for i in range(int(data["num_term_types"]))
+                ),
+                input_state_type=int(data["input_state_type"]),
+                input_state_amplitudes=data["input_state_amplitudes"],
+                input_state_indices=tuple(indices),
+                energy_offset=float(data["energy_offset"])
+            )
+
+    def _freeze(self) -> "JWEncodedArrays":
+        arrays = [self.input_state_amplitudes, *self.input_state_indices]
+        for indices, coeffs in self.hamiltonian_terms:
+            arrays.extend([indices, coeffs])
+        for array in arrays:
+            array.setflags(write=False)
+        return self
+
+
+def _to_array(rows: list, dtype: type) -> np.ndarray:
+    if not len(rows):
+        return np.zeros((0, 0), dtype=dtype)
+    return np.array(rows, dtype=dtype)
+
+
+# Encoded data by cache key, least recently used first
+_encoded: "OrderedDict[str, JWEncodedArrays]" = OrderedDict()
+
+
+def _cache_size() -> int:
+    size = os.environ.get(BROOMBRIDGE_CACHE_SIZE_ENV_VAR)
+    try:
+        return DEFAULT_CACHE_SIZE if not size else max(int(size), 0)
+    except ValueError:
+        _log.warning(
+            f"Ignoring invalid {BROOMBRIDGE_CACHE_SIZE_ENV_VAR}={size}"
+        )
+        return DEFAULT_CACHE_SIZE
+
+
+def _cache_key(
+    file_name: str,
+    problem_description_index: int,
+    initial_state_label: Optional[str]
+) -> str:
+    """Hash of the content of the Broombridge file, the problem description
+    index and the initial state label"""
+    digest = hashlib.sha256()
+    with open(file_name, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    digest.update(f"\n{problem_description_index}\n{initial_state_label}".encode())
+    return digest.hexdigest()
+
+
+def _cache_path(key: str) -> Optional[str]:
+    path = os.environ.get(BROOMBRIDGE_CACHE_ENV_VAR)
+    if not path:
+        return None
+    return os.path.join(path, f"{key}.npz")
+
+
+def _encode(
+    file_name: str,
+    problem_description_index: int,
+    initial_state_label: Optional[str]
+) -> JWEncodedData:
+    broombridge_data = load_broombridge(file_name)
+    problem = broombridge_data.problem_description[problem_description_index]
+
+    if initial_state_label is None:
+        # Pick first in list
+        initial_state_label = problem.initial_state_suggestions[0].get("Label")
+        _log.info(f"Using initial state label: {initial_state_label}")
+
+    input_state = load_input_state(file_name, initial_state_label)
+    ferm_hamiltonian = problem.load_fermion_hamiltonian()
+    return encode(ferm_hamiltonian, input_state)
+
+
+def load_and_encode_arrays(
+    file_name: str,
+    problem_description_index: int = 0,
+    initial_state_label: str = None
+) -> JWEncodedArrays:
+    """Load and encode Broombridge file into numpy arrays.
+    Encoded data is cached in memory and, if the QDKCHEM_BROOMBRIDGE_CACHE
+    environment variable is set, as npz files in that directory, keyed by
+    the content of the file, the problem description index and the initial
+    state label. Repeated loads of the same problem, for example in VQE
+    loops, therefore do not parse and encode the file again. Only the last
+    QDKCHEM_BROOMBRIDGE_CACHE_SIZE encodings used (16 by default) are kept
+    in memory.
+
+    :param file_name: Broombridge file name
+    :type file_name: str
+    :param problem_description_index: Index of problem description to use,
+        defaults to 0
+    :type problem_description_index: int, optional
+    :param initial_state_label: Label of initial state to use, defaults to
+        first available label
+    :type initial_state_label: str, optional
+    :return: Encoded data in numpy arrays
+    :rtype: JWEncodedArrays
+    """
+    key = _cache_key(file_name, problem_description_index, initial_state_label)
+    result = _encoded.get(key)
+    if result is not None:
+        _encoded.move_to_end(key)
+        return result
+
+    file_path = _cache_path(key)
+    if file_path is not None:
+        try:
+            result = JWEncodedArrays.load(file_path)
+            _log.debug(f"Loaded encoded {file_name} from cache.")
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError) as e:
+            _log.warning(f"Ignoring invalid cached encoding {file_path}: {e}")
+
+    if result is None:
+        result = JWEncodedArrays.from_jw_encoded_data(
+            _encode(file_name, problem_description_index, initial_state_label)
+        )
+        if file_path is not None:
+            result.save(file_path)
+
+    _encoded[key] = result._freeze()
+    while len(_encoded) > _cache_size():
+        _encoded.popitem(last=False)
+    return result
+
 
 def load_and_encode(
     file_name: str,
@@ -28,7 +308,8 @@ def load_and_encode(
     initial_state_label: str = None
 ) -> JWEncodedData:
     """Wrapper function for loading and encoding Broombridge file into
-    JWEncodedData-compatible format.
+    JWEncodedData-compatible format. Encoded data is cached, see
+    load_and_encode_arrays.
 
     :param file_name: Broombridge file name
     :type file_name: str
@@ -39,26 +320,13 @@ def load_and_encode(
         first available label
     :type initial_state_label: str, optional
     """
-    broombridge_data = load_broombridge(file_name)
-    problem = broombridge_data.problem_description[problem_description_index]
+    return load_and_encode_arrays(
+        file_name,
+        problem_description_index=problem_description_index,
+        initial_state_label=initial_state_label
+    ).to_jw_encoded_data()
 
-    if initial_state_label is None:
-        # Pick first in list
-        initial_state_label = problem.initial_state_suggestions[0].get("Label")
-        _log.info(f"Using initial state label: {initial_state_label}")
 
-    input_state = load_input_state(file_name, initial_state_label)
-    ferm_hamiltonian = problem.load_fermion_hamiltonian()
-    (
-        num_qubits,
-        hamiltonian_term_list,
-        input_state_terms,
-        energy_offset
-    ) = encode(ferm_hamiltonian, input_state)
-
-    return (
-        num_qubits,
-        hamiltonian_term_list,
-        input_state_terms,
-        energy_offset
-    )
+def clear_cache():
+    """Clear the in-memory cache of encoded Broombridge data"""
+    _encoded.clear()
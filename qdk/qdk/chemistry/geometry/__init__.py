@@ -9,6 +9,14 @@ from .geometry import (
     format_geometry_from_xyz
 )
 
+from .array_geometry import ArrayGeometry
+from .cache import GeometryCache
+from .trajectory import (
+    XYZTrajectory,
+    iter_xyz_frames,
+    read_xyz_frames,
+    write_xyz_frames
+)
 from .xyz import coordinates_to_xyz
 from .rdkit_convert import (
     get_conformer,
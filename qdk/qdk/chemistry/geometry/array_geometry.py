@@ -0,0 +1,194 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+"""Module that defines the ArrayGeometry class, a molecular geometry backed
+by numpy arrays for fast XYZ parsing and formatting of large geometries
+"""
+
+from typing import Iterable, Iterator, List, Optional, Union, TYPE_CHECKING
+
+import numpy as np
+
+from qdk.chemistry.geometry.geometry import Element, Geometry
+from qdk.chemistry.geometry.rdkit_convert import get_conformer
+
+from rdkit.Chem import AllChem as Chem
+
+if TYPE_CHECKING:
+    from rdkit.Chem import Mol
+
+
+class ArrayGeometry(object):
+    """Molecular geometry consisting of an array of element symbols and an
+    (n, 3) float64 array of XYZ coordinates
+    """
+    def __init__(
+        self,
+        symbols: Iterable[str],
+        positions: Union[np.ndarray, Iterable[Iterable[float]]],
+        charge: Union[int, None] = None
+    ):
+        self.symbols = np.asarray(symbols, dtype=str)
+        self.positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        self.charge = charge
+        if len(self.symbols) != len(self.positions):
+            raise ValueError(
+                f"Number of symbols {len(self.symbols)} does not match \
+number of positions {len(self.positions)}"
+            )
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __iter__(self) -> Iterator[Element]:
+        for name, (x, y, z) in zip(self.symbols.tolist(), self.positions.tolist()):
+            yield Element(name=name, x=x, y=y, z=z)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ArrayGeometry):
+            return NotImplemented
+        return self.charge == other.charge \
+            and np.array_equal(self.symbols, other.symbols) \
+            and np.array_equal(self.positions, other.positions)
+
+    def __repr__(self) -> str:
+        return f"ArrayGeometry(num_atoms={len(self)}, charge={self.charge})"
+
+    @property
+    def coordinates(self) -> Iterator:
+        """Get coordinates list of tuples (name, x, y, z)
+
+        :return: Iterator of coordinate tuples
+        :rtype: Iterator[Tuple[str, float, float, float]]
+        """
+        for name, (x, y, z) in zip(self.symbols.tolist(), self.positions.tolist()):
+            yield (name, x, y, z)
+
+    @classmethod
+    def from_geometry(cls, geometry: Geometry):
+        """Classmethod for constructing an array geometry from a Geometry
+
+        :param geometry: Geometry instance
+        :type geometry: Geometry
+        :return: ArrayGeometry instance
+        :rtype: ArrayGeometry
+        """
+        return cls(
+            [element.name for element in geometry],
+            [(element.x, element.y, element.z) for element in geometry],
+            charge=geometry.charge
+        )
+
+    def to_geometry(self) -> Geometry:
+        """Convert to a Geometry, a list of Element instances
+
+        :return: Geometry instance
+        :rtype: Geometry
+        """
+        return Geometry(self, charge=self.charge)
+
+    @classmethod
+    def from_mol(
+        cls,
+        mol: "Mol",
+        num_confs: int = 10,
+        seed: Optional[int] = None
+    ):
+        """Classmethod for constructing an array geometry from the
+        lowest-energy conformer of an RDKit molecule object
+
+        :param mol: RDKit molecule object
+        :type mol: Mol
+        :param num_confs: Number of molecular conformers to generate, defaults
+            to 10
+        :type num_confs: int, optional
+        :param seed: Random seed for the conformer embedding, defaults to
+            None
+        :type seed: int, optional
+        """
+        conformer = get_conformer(mol=mol, num_confs=num_confs, seed=seed)
+        return cls(
+            [atom.GetSymbol() for atom in mol.GetAtoms()],
+            conformer.GetPositions(),
+            charge=Chem.GetFormalCharge(mol)
+        )
+
+    @classmethod
+    def from_xyz_lines(
+        cls,
+        lines: List[str],
+        charge: Union[int, None] = None
+    ):
+        """Classmethod for constructing an array geometry from the atom lines
+        of an XYZ file, each formatted as <element> <X> <Y> <Z>
+
+        :param lines: Atom lines
+        :type lines: List[str]
+        :param charge: Charge, defaults to None
+        :type charge: int, optional
+        """
+        tokens = " ".join(lines).split()
+        if len(tokens) != 4 * len(lines):
+            # Some lines have extra columns, only keep the first four
+            tokens = [token for line in lines for token in line.split()[:4]]
+        atoms = np.array(tokens, dtype=object).reshape(-1, 4)
+        return cls(
+            atoms[:, 0].astype(str),
+            atoms[:, 1:].astype(np.float64),
+            charge=charge
+        )
+
+    @classmethod
+    def from_xyz(cls, xyz: str):
+        """Generate array geometry from XYZ data.
+        The formatting of the .xyz file format is as follows:
+
+            <number of atoms>
+            comment line
+            <element> <X> <Y> <Z>
+            ...
+
+        Source: https://en.wikipedia.org/wiki/XYZ_file_format.
+
+        :param xyz: XYZ file format
+        :type xyz: str
+        """
+        from qdk.chemistry.geometry.trajectory import iter_xyz_frames
+
+        frames = list(iter_xyz_frames(xyz.splitlines()))
+        if not frames:
+            return cls([], [])
+        assert len(frames) == 1, \
+            f"Invalid XYZ file: found {len(frames)} frames, expected 1"
+        return frames[0]
+
+    def format(self, line_sep: str = "\n") -> str:
+        """Format geometry into text format, each atom formatted as
+        <Element> <x> <y> <z>
+
+        :param line_sep: Line separator, defaults to "\n"
+        :type line_sep: str
+        :return: Geometry in text format
+        :rtype: str
+        """
+        columns = (map(repr, column) for column in self.positions.T.tolist())
+        return line_sep.join(map(" ".join, zip(self.symbols.tolist(), *columns)))
+
+    def to_xyz(self, title: str = "unnamed") -> str:
+        """Convert geometry to XYZ-formatted string
+
+        :param title: XYZ file title
+        :type title: str
+        :returns: XYZ-formatted string
+        :rtype: str
+        """
+        result = [f"{len(self)}", title]
+        if len(self):
+            result.append(self.format())
+        if self.charge:
+            result.extend([
+                "$set",
+                f"chrg {self.charge}",
+                "$end"
+            ])
+        return "\n".join(result)
@@ -0,0 +1,163 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+"""Module for the persistent cache of optimized molecular geometries, so
+that batch pipelines do not embed and optimize the conformers of known
+molecules again
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from typing import Optional, TYPE_CHECKING
+
+from qdk.chemistry.geometry.geometry import Element, Geometry
+
+from rdkit.Chem import AllChem as Chem
+
+if TYPE_CHECKING:
+    from rdkit.Chem import Mol
+
+_log = logging.getLogger(__name__)
+
+GEOMETRY_CACHE_ENV_VAR = "QDKCHEM_GEOMETRY_CACHE"
+
+
+class GeometryCache(object):
+    """On-disk cache of molecular geometries, keyed by the canonical SMILES
+    of the molecule (including explicit hydrogens), the number of
+    conformers and the random seed used to generate them. Every geometry is
+    stored as a JSON file in the cache directory.
+    """
+    def __init__(self, path: str):
+        self.path = path
+
+    @classmethod
+    def from_env(cls) -> Optional["GeometryCache"]:
+        """Get the cache in the directory set by the QDKCHEM_GEOMETRY_CACHE
+        environment variable, if any
+
+        :return: Geometry cache, or None if the variable is not set
+        :rtype: GeometryCache, optional
+        """
+        path = os.environ.get(GEOMETRY_CACHE_ENV_VAR)
+        return cls(path) if path else None
+
+    @staticmethod
+    def key(mol: "Mol", num_confs: int, seed: Optional[int]) -> str:
+        """Get the cache key of a molecule geometry
+
+        :param mol: RDKit molecule object
+        :type mol: Mol
+        :param num_confs: Number of molecular conformers generated
+        :type num_confs: int
+        :param seed: Random seed of the conformer embedding
+        :type seed: int, optional
+        :return: Cache key
+        :rtype: str
+        """
+        smiles = Chem.MolToSmiles(mol)
+        return hashlib.sha256(
+            f"{smiles}\n{num_confs}\n{seed}".encode()
+        ).hexdigest()
+
+    def _file_path(self, key: str) -> str:
+        return os.path.join(self.path, f"{key}.json")
+
+    def get(
+        self,
+        mol: "Mol",
+        num_confs: int,
+        seed: Optional[int] = None
+    ) -> Optional[Geometry]:
+        """Get the cached geometry of a molecule
+
+        :param mol: RDKit molecule object
+        :type mol: Mol
+        :param num_confs: Number of molecular conformers generated
+        :type num_confs: int
+        :param seed: Random seed of the conformer embedding, defaults to None
+        :type seed: int, optional
+        :return: Cached geometry, or None if it is not in the cache
+        :rtype: Geometry, optional
+        """
+        file_path = self._file_path(self.key(mol, num_confs, seed))
+        try:
+            with open(file_path) as f:
+                data = json.load(f)
+            return Geometry(
+                [Element.from_tuple(item) for item in data["coordinates"]],
+                charge=data["charge"]
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            _log.warning(f"Ignoring invalid cached geometry {file_path}: {e}")
+            return None
+
+    def put(
+        self,
+        mol: "Mol",
+        num_confs: int,
+        seed: Optional[int],
+        geometry: Geometry
+    ):
+        """Save the geometry of a molecule to the cache
+
+        :param mol: RDKit molecule object
+        :type mol: Mol
+        :param num_confs: Number of molecular conformers generated
+        :type num_confs: int
+        :param seed: Random seed of the conformer embedding
+        :type seed: int, optional
+        :param geometry: Geometry to save
+        :type geometry: Geometry
+        """
+        data = {
+            "smiles": Chem.MolToSmiles(mol),
+            "num_confs": num_confs,
+            "seed": seed,
+            "charge": geometry.charge,
+            "coordinates": list(geometry.coordinates)
+        }
+        os.makedirs(self.path, exist_ok=True)
+        file_path = self._file_path(self.key(mol, num_confs, seed))
+        # Write to a temporary file first, so that concurrent readers never
+        # see a partially written geometry
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    def get_or_compute(
+        self,
+        mol: "Mol",
+        num_confs: int,
+        seed: Optional[int] = None
+    ) -> Geometry:
+        """Get the cached geometry of a molecule, or compute the geometry of
+        its lowest-energy conformer and save it to the cache
+
+        :param mol: RDKit molecule object
+        :type mol: Mol
+        :param num_confs: Number of molecular conformers to generate
+        :type num_confs: int
+        :param seed: Random seed for the conformer embedding, defaults to None
+        :type seed: int, optional
+        :return: Molecule geometry
+        :rtype: Geometry
+        """
+        geometry = self.get(mol, num_confs, seed)
+        if geometry is not None:
+            _log.debug(f"Loaded geometry of {Chem.MolToSmiles(mol)} from cache.")
+            return geometry
+
+        geometry = Geometry.from_mol(mol, num_confs=num_confs, seed=seed)
+        self.put(mol, num_confs, seed, geometry)
+        return geometry
@@ -7,7 +7,7 @@ XYZ data for molecules
 
 import re
 from dataclasses import dataclass
-from typing import List, Tuple, Union, TYPE_CHECKING
+from typing import List, Optional, Tuple, Union, TYPE_CHECKING
 
 from qdk.chemistry.geometry.rdkit_convert import _mol_to_coordinates
 from qdk.chemistry.geometry.xyz import (
@@ -76,7 +76,12 @@ class Geometry(List[Element]):
             yield (element.name, element.x, element.y, element.z)
 
     @classmethod
-    def from_mol(cls, mol: "Mol", num_confs: int = 10):
+    def from_mol(
+        cls,
+        mol: "Mol",
+        num_confs: int = 10,
+        seed: Optional[int] = None
+    ):
         """Classmethod for constructing a geometry instance from an RDKit
         molecule object
 
@@ -85,11 +90,15 @@ class Geometry(List[Element]):
         :param num_confs: Number of molecular conformers to generate, defaults
             to 10
         :type num_confs: int, optional
+        :param seed: Random seed for the conformer embedding, defaults to
+            None
+        :type seed: int, optional
         """
         # This returns a plain list of tuples (element name, x, y, z)
         coordinates = _mol_to_coordinates(
             mol=mol,
-            num_confs=num_confs
+            num_confs=num_confs,
+            seed=seed
         )
         charge = Chem.GetFormalCharge(mol)
 
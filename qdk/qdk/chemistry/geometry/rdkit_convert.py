@@ -5,7 +5,7 @@
 """
 
 import logging
-from typing import List, Tuple, Iterable, TYPE_CHECKING
+from typing import List, Optional, Tuple, Iterable, TYPE_CHECKING
 
 from .xyz import coordinates_to_xyz
 
@@ -17,7 +17,11 @@ if TYPE_CHECKING:
 _log = logging.getLogger(__name__)
 
 
-def get_conformer(mol: "Mol", num_confs: int = 10) -> "Conformer":
+def get_conformer(
+    mol: "Mol",
+    num_confs: int = 10,
+    seed: Optional[int] = None
+) -> "Conformer":
     """Get lowest-energy Conformer for molecular fragment.
     If conformers don't converge, get lowest energy conformer.
 
@@ -25,14 +29,26 @@ def get_conformer(mol: "Mol", num_confs: int = 10) -> "Conformer":
     :type mol: Mol
     :param num_confs: Number of configurations to generate, defaults to 10.
     :type num_confs: int
+    :param seed: Random seed for the conformer embedding, defaults to None
+        (not reproducible). If specified, the existing conformers of mol are
+        replaced.
+    :type seed: int, optional
 
     :return: Lowest-energy conformer for molecule
     :rtype: Conformer
     """
+    if seed is not None:
+        # Conformers embedded earlier, e.g. with another seed, would make the
+        # result depend on previous calls
+        mol.RemoveAllConformers()
     conformers = mol.GetConformers()
     if len(conformers) < num_confs:
         # Embed num_confs conformers into molecule object
-        Chem.EmbedMultipleConfs(mol, numConfs=num_confs)
+        Chem.EmbedMultipleConfs(
+            mol,
+            numConfs=num_confs,
+            randomSeed=-1 if seed is None else seed
+        )
         conformers = mol.GetConformers()
 
     res = Chem.MMFFOptimizeMoleculeConfs(mol, numThreads=0)
@@ -72,7 +88,8 @@ def _conformer_to_coordinates(
 
 def _mol_to_coordinates(
     mol: "Mol",
-    num_confs: int = 10
+    num_confs: int = 10,
+    seed: Optional[int] = None
 ) -> List[Tuple[str, float, float, float]]:
     """Convert molecule object to list of coordinates
 
@@ -81,16 +98,22 @@ def _mol_to_coordinates(
     :param num_confs: Number of molecular conformers to generate,
         defaults to 10
     :type num_confs: int, optional
+    :param seed: Random seed for the conformer embedding, defaults to None
+    :type seed: int, optional
     :return: List of tuples of element name and x, y, z coordinates
     :rtype: List[Tuple[str, float, float, float]]
     """
     symbols = [a.GetSymbol() for a in mol.GetAtoms()]
-    conformer = get_conformer(mol=mol, num_confs=num_confs)
+    conformer = get_conformer(mol=mol, num_confs=num_confs, seed=seed)
 
     return _conformer_to_coordinates(symbols=symbols, conformer=conformer)
 
 
-def mol_to_xyz(mol: "Mol", num_confs: int = 10) -> str:
+def mol_to_xyz(
+    mol: "Mol",
+    num_confs: int = 10,
+    seed: Optional[int] = None
+) -> str:
     """Convert molecule object to XYZ file formatted string.
 
     :param mol: RDKit molecule object
@@ -98,10 +121,16 @@ def mol_to_xyz(mol: "Mol", num_confs: int = 10) -> str:
     :param num_confs: Number of molecular conformers to generate,
         defaults to 10
     :type num_confs: int, optional
+    :param seed: Random seed for the conformer embedding, defaults to None
+    :type seed: int, optional
     :return: XYZ file formatted string
     :rtype: str
     """
-    coordinates = _mol_to_coordinates(mol=mol, num_confs=num_confs)
+    coordinates = _mol_to_coordinates(
+        mol=mol,
+        num_confs=num_confs,
+        seed=seed
+    )
     number_of_atoms = mol.GetNumAtoms()
     charge = Chem.GetFormalCharge(mol)
     return coordinates_to_xyz(
@@ -0,0 +1,188 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+"""Module for reading and writing multi-frame XYZ files, such as molecular
+dynamics trajectories and geometry optimization snapshots, frame by frame
+
+Every frame is formatted as follows, optionally followed by a
+"$set", "chrg <charge>", "$end" block:
+
+    <number of atoms>
+    comment line
+    <element> <X> <Y> <Z>
+    ...
+"""
+
+import itertools
+import mmap
+import os
+from collections.abc import Sequence
+from typing import IO, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from qdk.chemistry.geometry.array_geometry import ArrayGeometry
+
+# Size of the chunks in which memory-mapped files are indexed
+CHUNK_SIZE = 1 << 26
+
+
+def iter_xyz_frames(lines: Iterable[str]) -> Iterator[ArrayGeometry]:
+    """Parse the frames of multi-frame XYZ data one at a time
+
+    :param lines: Lines of the XYZ data, for example an open file
+    :type lines: Iterable[str]
+    :raises ValueError: If a frame is truncated
+    :return: Iterator of the frame geometries
+    :rtype: Iterator[ArrayGeometry]
+    """
+    lines = iter(lines)
+    line = next(lines, None)
+    while line is not None:
+        if not line.strip():
+            line = next(lines, None)
+            continue
+
+        num_atoms = int(line.split()[0])
+        next(lines, None)  # comment line
+        atom_lines = list(itertools.islice(lines, num_atoms))
+        if len(atom_lines) != num_atoms:
+            raise ValueError(
+                f"Invalid XYZ file: number of atoms '{num_atoms}' does not \
+match number of elements found {len(atom_lines)}"
+            )
+
+        charge = 0
+        line = next(lines, None)
+        if line is not None and line.strip() == "$set":
+            for line in lines:
+                fields = line.split()
+                if fields == ["$end"]:
+                    break
+                if fields[:1] == ["chrg"]:
+                    charge = int(fields[1])
+            line = next(lines, None)
+
+        yield ArrayGeometry.from_xyz_lines(atom_lines, charge=charge)
+
+
+def read_xyz_frames(file_path: str) -> Iterator[ArrayGeometry]:
+    """Stream the frames of a multi-frame XYZ file, one at a time
+
+    :param file_path: Path of the XYZ file
+    :type file_path: str
+    :return: Iterator of the frame geometries
+    :rtype: Iterator[ArrayGeometry]
+    """
+    with open(file_path) as f:
+        yield from iter_xyz_frames(f)
+
+
+def write_xyz_frames(
+    file: Union[str, IO[str]],
+    frames: Iterable[ArrayGeometry],
+    titles: Optional[Iterable[str]] = None
+):
+    """Write geometries to a multi-frame XYZ file, one frame at a time
+
+    :param file: Path of the XYZ file, or open text file
+    :type file: Union[str, IO[str]]
+    :param frames: Frame geometries
+    :type frames: Iterable[ArrayGeometry]
+    :param titles: Frame titles, defaults to "frame <index>"
+    :type titles: Iterable[str], optional
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "w") as f:
+            return write_xyz_frames(f, frames, titles)
+
+    if titles is None:
+        titles = (f"frame {index}" for index in itertools.count())
+    for frame, title in zip(frames, titles):
+        file.write(frame.to_xyz(title=title))
+        file.write("\n")
+
+
+class XYZTrajectory(Sequence):
+    """Random access to the frames of a multi-frame XYZ file. The file is
+    memory-mapped and indexed once, and frames are only parsed when they are
+    accessed.
+    """
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._file = open(file_path, "rb")
+        self._mmap = b""
+        try:
+            size = os.fstat(self._file.fileno()).st_size
+            if size:
+                self._mmap = mmap.mmap(
+                    self._file.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            self._frames = self._index(size)
+        except BaseException:
+            self.close()
+            raise
+
+    def _index(self, size: int) -> List[Tuple[int, int]]:
+        """Find the byte ranges of the frames"""
+        newlines = [
+            np.flatnonzero(
+                np.frombuffer(
+                    self._mmap,
+                    dtype=np.uint8,
+                    count=min(CHUNK_SIZE, size - start),
+                    offset=start
+                ) == ord("\n")
+            ) + start
+            for start in range(0, size, CHUNK_SIZE)
+        ]
+        ends = np.concatenate(newlines + [np.zeros(0, dtype=np.int64)])
+        if not len(ends) or ends[-1] != size - 1:
+            # Last line without a newline
+            ends = np.append(ends, size)
+        starts = np.concatenate(([0], ends[:-1] + 1))
+        num_lines = len(ends)
+
+        def line(index: int) -> bytes:
+            return self._mmap[starts[index]:ends[index]].strip()
+
+        frames = []
+        index = 0
+        while index < num_lines:
+            count = line(index)
+            if not count:
+                index += 1
+                continue
+            end = index + 2 + int(count.split()[0])
+            if end > num_lines:
+                raise ValueError(
+                    f"Invalid XYZ file: frame {len(frames)} is truncated"
+                )
+            if end < num_lines and line(end) == b"$set":
+                while end < num_lines and line(end) != b"$end":
+                    end += 1
+                end += 1
+            frames.append((int(starts[index]), int(starts[end]) if end < num_lines else size))
+            index = end
+        return frames
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        start, end = self._frames[index]
+        text = self._mmap[start:end].decode()
+        return next(iter_xyz_frames(text.splitlines()))
+
+    def close(self):
+        if isinstance(self._mmap, mmap.mmap):
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
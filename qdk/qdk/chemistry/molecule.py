@@ -7,11 +7,10 @@
 import enum
 import logging
 import os
-import re
 
-from collections import namedtuple
+from collections import Counter, namedtuple
 from IPython.display import display
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 
 try:
     from rdkit.Chem import AllChem as Chem
@@ -21,12 +20,11 @@ Install with Conda: \n\n\tconda install -c conda-forge rdkit")
 
 from qdk.chemistry.widgets.jsmol_widget import JsmolWidget
 from qdk.chemistry.widgets.jsme_widget import JsmeWidget
-from qdk.chemistry.geometry import Geometry
+from qdk.chemistry.geometry import Geometry, GeometryCache
 from qdk.chemistry.solvers import nwchem, openmolcas, psi4
 from qdk.chemistry._xyz2mol import xyz2mol, read_xyz_file
 from qdk.chemistry.solvers.util import num_electrons
-
-import basis_set_exchange as bse
+from qdk.chemistry.basis import get_shells, num_orbitals as _num_orbitals
 
 _log = logging.getLogger(__name__)
 
@@ -52,19 +50,67 @@ class Solver(enum.Enum):
     )
 
 
+def get_solver_spec(solver: str) -> SolverSpec:
+    """Get the specification of a solver by name (case-insensitive)
+
+    :param solver: Solver name
+    :type solver: str
+    :raises ValueError: If the solver is not supported
+    :return: Solver specification
+    :rtype: SolverSpec
+    """
+    try:
+        return Solver[solver.lower()].value
+
+    except Exception:
+        names = [_s.name for _s in Solver]
+        raise ValueError(
+            f"Solver {solver} not found. Valid values: {names}"
+        )
+
+
 class Molecule(object):
     """
     Molecule object for visualization and geometry generation
     """
-    def __init__(self, mol: Chem.Mol, num_confs: int = 10, xyz: str = None):
+    def __init__(
+        self,
+        mol: Chem.Mol,
+        num_confs: int = 10,
+        xyz: str = None,
+        seed: Optional[int] = None,
+        geometry_cache: Optional[GeometryCache] = None
+    ):
+        """Create a molecule
+
+        :param mol: RDKit molecule object
+        :type mol: Chem.Mol
+        :param num_confs: Number of molecular conformers to generate for the
+            geometry, defaults to 10
+        :type num_confs: int, optional
+        :param xyz: XYZ data of the molecule geometry, defaults to None
+        :type xyz: str, optional
+        :param seed: Random seed for the conformer embedding, defaults to
+            None
+        :type seed: int, optional
+        :param geometry_cache: Persistent cache of the optimized geometries,
+            defaults to the directory set by the QDKCHEM_GEOMETRY_CACHE
+            environment variable, if any
+        :type geometry_cache: GeometryCache, optional
+        """
         self.mol = mol
+        self.num_confs = num_confs
+        self.seed = seed
+        self.geometry_cache = geometry_cache or GeometryCache.from_env()
         self.design_widget = None
         self._xyz = xyz
+        # Optimized geometries by (num_confs, seed)
+        self._geometries = {}
 
         if xyz:
             self.widget = JsmolWidget.from_str(data=xyz)
         elif mol:
-            self.widget = JsmolWidget.from_mol(mol=mol, num_confs=num_confs)
+            self.widget = JsmolWidget.from_str(self.xyz())
         else:
             self.widget = None
 
@@ -73,15 +119,20 @@ class Molecule(object):
         cls,
         smiles: str,
         add_hs: bool = True,
-        num_confs: int = 10
+        num_confs: int = 10,
+        seed: Optional[int] = None,
+        geometry_cache: Optional[GeometryCache] = None
     ):
         mol = Chem.MolFromSmiles(smiles)
         if add_hs:
             mol = Chem.AddHs(mol)
-            # Calculate conformers after adding hydrogens
-            Chem.EmbedMultipleConfs(mol, numConfs=num_confs)
 
-        return cls(mol=mol)
+        return cls(
+            mol=mol,
+            num_confs=num_confs,
+            seed=seed,
+            geometry_cache=geometry_cache
+        )
 
     @classmethod
     def from_xyz(cls, xyz_file: str, add_hs: bool = True):
@@ -101,10 +152,53 @@ class Molecule(object):
 molecules generated by xyz2mol.")
 
     @property
-    def geometry(self):
-        if self._xyz:
-            return Geometry.from_xyz(self._xyz)
-        return Geometry.from_mol(self.mol)
+    def geometry(self) -> Geometry:
+        """Get the molecule geometry, computed once from the XYZ data or
+        the lowest-energy conformer"""
+        return self.get_geometry()
+
+    def get_geometry(
+        self,
+        num_confs: Optional[int] = None,
+        seed: Optional[int] = None
+    ) -> Geometry:
+        """Get the molecule geometry. The geometry of the lowest-energy
+        conformer is computed once per number of conformers and seed, and
+        looked up in the persistent geometry cache, if any, before running
+        the conformer search.
+
+        :param num_confs: Number of molecular conformers to generate,
+            defaults to the number of conformers of the molecule
+        :type num_confs: int, optional
+        :param seed: Random seed for the conformer embedding, defaults to
+            the seed of the molecule
+        :type seed: int, optional
+        :return: Molecule geometry
+        :rtype: Geometry
+        """
+        if num_confs is None:
+            num_confs = self.num_confs
+        if seed is None:
+            seed = self.seed
+
+        key = (num_confs, seed)
+        geometry = self._geometries.get(key)
+        if geometry is None:
+            if self._xyz:
+                geometry = Geometry.from_xyz(self._xyz)
+            else:
+                geometry = self._compute_geometry(num_confs, seed)
+            self._geometries[key] = geometry
+        return geometry
+
+    def _compute_geometry(self, num_confs: int, seed: Optional[int]):
+        if self.geometry_cache is not None:
+            return self.geometry_cache.get_or_compute(
+                self.mol,
+                num_confs=num_confs,
+                seed=seed
+            )
+        return Geometry.from_mol(self.mol, num_confs=num_confs, seed=seed)
 
     def xyz(self, name: str = "unnamed"):
         if self._xyz:
@@ -133,47 +227,17 @@ molecules generated by xyz2mol.")
     def atom_numbers(self) -> Dict[int, int]:
         """Get a dictionary of the atomic numbers of atoms in the molecule
         mapped to the amount of each in the molecule"""
-        atoms = self.all_atoms()
-        return {
-            atomic_number:
-                atoms.count(atomic_number) for atomic_number in set(atoms)
-        }
-
-    def basis(self, basis: str = "STO-3G"):
-        # Obtain the basis set in nwchem format (as a string)
-        atoms = self.atoms
-        basis = bse.get_basis(basis, elements=atoms, fmt='nwchem')
-        ob = "d*[spdf]"
-        parsed_basis = re.findall(
-            f"-> \\[(\\{ob},*\\{ob}*,*\\{ob}*)\\]\n(\\w+)",
-            basis
-        )
-        assert len(atoms) == len(parsed_basis), \
-            f"Cannot parse basis: number of atoms does not match result: \
-{basis}"
-        return dict(zip(atoms, parsed_basis))
+        return dict(Counter(self.all_atoms()))
+
+    def basis(self, basis: str = "STO-3G") -> Dict[int, Tuple[str, str]]:
+        """Get the contracted shells and symbol of each element of the
+        molecule in a basis set, for example {1: ("1s", "H")}"""
+        return get_shells(basis, self.atoms)
 
     def num_orbitals(self, basis: str = "STO-3G") -> int:
         """Get total number of spatial orbitals for the molecule by
         using the basis states"""
-        pattern = "(\\d)*s*,*(\\d)*p*,*(\\d)*d*,*(\\d)*f*"
-        orbital_fillings = [1, 3, 5, 7]
-
-        spin_orbitals = 0
-        for atom, (basis, name) in self.basis(basis).items():
-            num_atoms = self.atom_numbers[atom]
-            s, p, d, f = re.findall(pattern, basis)[0]
-
-            num_electrons_per_orbital = [
-                filling * int(num) for num, filling in zip(
-                    [s, p, d, f],
-                    orbital_fillings
-                ) if num
-            ]
-            num_electrons_per_atom = sum(num_electrons_per_orbital)
-            spin_orbitals += num_atoms * num_electrons_per_atom
-
-        return int(spin_orbitals)
+        return _num_orbitals(self.atom_numbers, basis)
 
     @classmethod
     def design(cls):
@@ -192,7 +256,9 @@ molecules generated by xyz2mol.")
     def update_design(self, add_hs: bool = True, num_confs: int = 10):
         mol = self.design_widget.to_mol(add_hs=add_hs)
         self.mol = mol
-        self.widget = JsmolWidget.from_mol(mol=mol, num_confs=num_confs)
+        self.num_confs = num_confs
+        self._geometries.clear()
+        self.widget = JsmolWidget.from_str(self.xyz())
 
     def create_input(
         self,
@@ -215,35 +281,26 @@ molecules generated by xyz2mol.")
         :param parameters: Parameters for input deck
         :type parameters: dict
         """
-        try:
-            solver_spec = Solver[solver.lower()].value
+        solver_spec = get_solver_spec(solver)
+        if base_path is None:
+            base_path = DEFAULT_BASE_PATH
 
-        except Exception:
-            names = [_s.name for _s in Solver]
-            raise ValueError(
-                f"Solver {solver} not found. Valid values: {names}"
-            )
+        file_path = os.path.join(base_path, file_name)
 
-        else:
-            if base_path is None:
-                base_path = DEFAULT_BASE_PATH
-
-            file_path = os.path.join(base_path, file_name)
-
-            input_deck = solver_spec.module.create_input_deck(
-                mol=self.mol,
-                mol_name=molecule_name,
-                geometry=self.geometry,
-                **parameters
-            )
+        input_deck = solver_spec.module.create_input_deck(
+            mol=self.mol,
+            mol_name=molecule_name,
+            geometry=self.geometry,
+            **parameters
+        )
 
-            _log.info(
-                f"Saving {solver_spec.name} input deck to file {file_path}"
-            )
-            with open(file_path, "w") as f:
-                f.write(input_deck)
+        _log.info(
+            f"Saving {solver_spec.name} input deck to file {file_path}"
+        )
+        with open(file_path, "w") as f:
+            f.write(input_deck)
 
-            return file_path
+        return file_path
 
     def _ipython_display_(self):
         if self.design_widget and self.design_widget.was_updated:
@@ -6,9 +6,13 @@
 
 import logging
 import re
-from typing import Dict, Union, TYPE_CHECKING
+import time
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, Optional, Union, TYPE_CHECKING
 
-from qdk.chemistry.geometry import Geometry
+import numpy as np
+
+from qdk.chemistry.geometry import ArrayGeometry, Geometry
 from qdk.chemistry.solvers.util import formatted_geometry_str
 
 if TYPE_CHECKING:
@@ -18,6 +22,8 @@ _log = logging.getLogger(__name__)
 
 __all__ = [
     "parse_nwchem_output",
+    "follow_nwchem_output",
+    "NWChemOutputParser",
     "create_input_deck"
 ]
 
@@ -174,64 +180,229 @@ def create_input_deck(
     return nw_chem
 
 
+# Markers of the NWChem output lines of interest
+_ATOMS_MARKER = "atoms           ="
+_ORBITALS_MARKER = "Number of AO functions :"
+_SCF_MARKER = "Total SCF energy ="
+_CCSD_MARKER = "correlation energy / hartree ="
+# Last line written by NWChem when a job terminates
+_END_MARKER = "Total times  cpu:"
+
+_FLOAT = "[+-]?[0-9]*[.][0-9]+"
+_VALUE_PATTERN = re.compile(f"=\\s*({_FLOAT})")
+_COUNT_PATTERN = re.compile("[=:]\\s*([0-9]+)")
+# Row of the table of coordinates and gradients printed at every step of a
+# geometry optimization: <No.> <Tag> <X> <Y> <Z> <dE/dX> <dE/dY> <dE/dZ>
+_SNAPSHOT_ROW_PATTERN = re.compile(
+    f"\\s*[0-9]+\\s+([A-Za-z]+)\\s+({_FLOAT})\\s+({_FLOAT})\\s+({_FLOAT})\
+\\s+{_FLOAT}\\s+{_FLOAT}\\s+{_FLOAT}\\s*$"
+)
+
+
+class NWChemOutputParser(object):
+    """Single-pass parser of NWChem output logs. Lines are fed one at a
+    time, so that large logs are never loaded into memory and the log of a
+    running job can be parsed as it is written.
+    Geometry snapshots are only collected if collect_snapshots is True, and
+    only the last max_snapshots of them are kept.
+    """
+    def __init__(
+        self,
+        collect_snapshots: bool = False,
+        max_snapshots: Optional[int] = None
+    ):
+        self.collect_snapshots = collect_snapshots
+        self.n_atom = None
+        self.n_orbital = None
+        self.scf_energy = None
+        self.ccsd_corr_energy = None
+        self.snapshots = deque(maxlen=max_snapshots)
+        self.num_snapshots = 0
+        self.finished = False
+        self._rows = []
+
+    def feed(self, line: str):
+        """Parse the next line of the log
+
+        :param line: Line of the log
+        :type line: str
+        """
+        if self._rows or self.collect_snapshots and line[:1] == " ":
+            match = _SNAPSHOT_ROW_PATTERN.match(line)
+            if match is not None:
+                self._rows.append(match.groups())
+                return
+            if self._rows:
+                self._end_snapshot()
+
+        if _SCF_MARKER in line:
+            self.scf_energy = self._value(line, self.scf_energy)
+        elif _CCSD_MARKER in line:
+            self.ccsd_corr_energy = self._value(line, self.ccsd_corr_energy)
+        elif self.n_atom is None and _ATOMS_MARKER in line:
+            self.n_atom = self._count(line)
+        elif self.n_orbital is None and _ORBITALS_MARKER in line:
+            self.n_orbital = self._count(line)
+        elif _END_MARKER in line:
+            self.finished = True
+            self.close()
+
+    def feed_lines(self, lines: Iterable[str]):
+        """Parse the next lines of the log
+
+        :param lines: Lines of the log, for example an open file
+        :type lines: Iterable[str]
+        """
+        for line in lines:
+            self.feed(line)
+
+    def close(self):
+        """Signal the end of the log, ending a geometry table that runs until
+        the last line
+        """
+        if self._rows:
+            self._end_snapshot()
+
+    @staticmethod
+    def _value(line: str, default: Optional[float]) -> Optional[float]:
+        match = _VALUE_PATTERN.search(line)
+        return float(match.group(1)) if match else default
+
+    @staticmethod
+    def _count(line: str) -> Optional[int]:
+        match = _COUNT_PATTERN.search(line)
+        return int(match.group(1)) if match else None
+
+    def _end_snapshot(self):
+        rows, self._rows = self._rows, []
+        if self.n_atom is not None and len(rows) != self.n_atom:
+            _log.debug(
+                f"Skipping table of {len(rows)} rows, expected {self.n_atom}"
+            )
+            return
+        rows = np.array(rows)
+        self.snapshots.append(
+            ArrayGeometry(rows[:, 0], rows[:, 1:].astype(np.float64))
+        )
+        _log.info(f"Geometry snapshot {self.num_snapshots}")
+        self.num_snapshots += 1
+
+    def result(self) -> Dict[str, Any]:
+        """Get the values parsed so far. A geometry table that may still be
+        continued by the next lines is not reported until it ends.
+
+        :return: n_atom, n_orbital, scf_energy, ccsd_corr_energy and geometry
+            snapshots
+        :rtype: Dict[str, Any]
+        """
+        return {
+            "number of atoms": self.n_atom,
+            "number of orbitals": self.n_orbital,
+            "SCF energy": self.scf_energy,
+            "CCSD correlation energy": self.ccsd_corr_energy,
+            "geometry snapshot": list(self.snapshots)
+        }
+
+
+def _is_optimization(nw_input_file_path: str) -> bool:
+    with open(nw_input_file_path) as f:
+        return any("optimize" in line for line in f)
+
+
 def parse_nwchem_output(
     nw_input_file_path: str,
-    nw_output_file_path: str
-) -> Dict[str, Union[int, float]]:
-    """Parse NWChem output
+    nw_output_file_path: str,
+    max_snapshots: Optional[int] = None
+) -> Dict[str, Any]:
+    """Parse NWChem output. The log is streamed line by line, so memory use
+    does not grow with the size of the log. For geometry optimizations, the
+    geometry snapshots exclude the initial geometry but include the final
+    one, with coordinates as printed in the gradients table (in a.u.).
 
     :param nw_input_file_path: NW input filepath
     :type nw_input_file_path: str
     :param nw_output_file_path: NW output filepath
     :type nw_output_file_path: str
-    :return: n_atom, n_orbital, scf_energy, ccsd_corr_energy
+    :param max_snapshots: Maximum number of geometry snapshots to keep, the
+        last ones are kept. Defaults to None (keep all of them)
+    :type max_snapshots: int, optional
+    :return: n_atom, n_orbital, scf_energy, ccsd_corr_energy and geometry
+        snapshots
+    :rtype: Dict[str, Any]
     """
+    parser = NWChemOutputParser(
+        collect_snapshots=_is_optimization(nw_input_file_path),
+        max_snapshots=max_snapshots
+    )
     with open(nw_output_file_path) as f:
-        logfile = f.read()
+        parser.feed_lines(f)
+    parser.close()
 
-    with open(nw_input_file_path) as f:
-        nwfile = f.read()
-
-    pattern_atom = "atoms           =\\s*([0-9]*)"
-    pattern_orbital = "Number of AO functions :\\s*([0-9]*)"
-    pattern_scf = "Total SCF energy =\\s*([+-]?[0-9]*[.][0-9]+)"
-
-    n_atom = int(re.findall(pattern_atom, logfile)[0])
-    n_orbital = int(re.findall(pattern_orbital, logfile)[0])
-    scf_energy = re.findall(pattern_scf, logfile)
-
-    pattern_ccsd = "correlation energy / hartree =\\s*([+-]?[0-9]*[.][0-9]+)"
-    ccsd_corr_energy = re.findall(pattern_ccsd, logfile)
-
-    geometry_snapshot = []
-
-    if "optimize" in nwfile:
-        # The following geometry snapshots doesn't
-        # include the initial one, but does include final one.
-        cd = "[+-]?[0-9]*[.][0-9]+"
-        pattern_geom = f"([0-9]+)\\s*([A-Z]+)\\s*({cd})\\s*({cd})\\s*({cd})\
-        \\s*({cd})\\s*({cd})\\s*({cd})"
-        geomsnapshot = re.findall(pattern_geom, logfile)
-
-        for i in range(0, len(geomsnapshot)):
-            if (i % n_atom == 0):
-                geometry_snapshot.append(geomsnapshot[i][0:5])
-                _log.info("Geometry snapshot %d" % (i/n_atom))
-            _log.info(geomsnapshot[i][0:5])
-
-    _log.info("Number of Atoms: ", n_atom)
-    _log.info("Number of Orbitals: ", n_orbital)
-
-    scf_energy = float(scf_energy[-1]) if scf_energy else None
-    _log.info("SCF Energy: ", scf_energy)
-    ccsd_corr_energy = float(ccsd_corr_energy[-1]) if ccsd_corr_energy else \
-        None
-    _log.info("Correlation Energy: ", ccsd_corr_energy)
-
-    return {
-        "number of atoms": n_atom,
-        "number of orbitals": n_orbital,
-        "SCF energy": scf_energy,
-        "CCSD correlation energy": ccsd_corr_energy,
-        "geometry snapshot": geometry_snapshot
-    }
+    result = parser.result()
+    _log.info(f"Number of Atoms: {parser.n_atom}")
+    _log.info(f"Number of Orbitals: {parser.n_orbital}")
+    _log.info(f"SCF Energy: {parser.scf_energy}")
+    _log.info(f"Correlation Energy: {parser.ccsd_corr_energy}")
+    return result
+
+
+def follow_nwchem_output(
+    nw_input_file_path: str,
+    nw_output_file_path: str,
+    poll_interval: float = 1.0,
+    timeout: Optional[float] = None,
+    max_snapshots: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """Follow the output log of a running NWChem job, parsing new lines as
+    they are written. Yields the values parsed so far every time new lines
+    are parsed, until the job terminates or the timeout expires. When the
+    timeout expires, the values parsed from the whole log, including its
+    last line and geometry table, are yielded one last time.
+
+    :param nw_input_file_path: NW input filepath
+    :type nw_input_file_path: str
+    :param nw_output_file_path: NW output filepath
+    :type nw_output_file_path: str
+    :param poll_interval: Seconds to wait for new lines, defaults to 1.0
+    :type poll_interval: float, optional
+    :param timeout: Seconds to wait without new lines before giving up,
+        defaults to None (wait until the job terminates)
+    :type timeout: float, optional
+    :param max_snapshots: Maximum number of geometry snapshots to keep, the
+        last ones are kept. Defaults to None (keep all of them)
+    :type max_snapshots: int, optional
+    :return: Iterator of n_atom, n_orbital, scf_energy, ccsd_corr_energy and
+        geometry snapshots
+    :rtype: Iterator[Dict[str, Any]]
+    """
+    parser = NWChemOutputParser(
+        collect_snapshots=_is_optimization(nw_input_file_path),
+        max_snapshots=max_snapshots
+    )
+    last_update = time.monotonic()
+    partial = ""
+    with open(nw_output_file_path) as f:
+        while not parser.finished:
+            lines = f.readlines()
+            if lines:
+                lines[0] = partial + lines[0]
+                # The last line may still be being written
+                partial = "" if lines[-1].endswith("\n") else lines.pop()
+            if lines:
+                parser.feed_lines(lines)
+                last_update = time.monotonic()
+                yield parser.result()
+                continue
+            if timeout is not None \
+                    and time.monotonic() - last_update > timeout:
+                _log.warning(
+                    f"No new output in {nw_output_file_path} for {timeout}s."
+                )
+                # Report what the log ends with, even if the job did not
+                # finish writing it
+                if partial:
+                    parser.feed(partial)
+                parser.close()
+                yield parser.result()
+                return
+            time.sleep(poll_interval)
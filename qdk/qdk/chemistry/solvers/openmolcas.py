@@ -6,7 +6,7 @@
 
 from typing import Union, TYPE_CHECKING
 
-from qdk.chemistry.geometry import Geometry
+from qdk.chemistry.geometry import ArrayGeometry, Geometry
 from qdk.chemistry.solvers.util import (
     formatted_geometry_str,
     num_atoms_from_mol
@@ -117,7 +117,8 @@ def create_input_deck(
         geometry=geometry, 
         line_sep=GEOMETRY_LINE_SEP
     )
-    num_atoms = len(geometry) if isinstance(geometry, Geometry) \
+    num_atoms = len(geometry) \
+        if isinstance(geometry, (Geometry, ArrayGeometry)) \
         else num_atoms_from_mol(mol)
     charge = charge if charge is not None else GetFormalCharge(mol)
     num_active_el = num_active_el or num_active_orbitals // 2
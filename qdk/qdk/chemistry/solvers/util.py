@@ -6,6 +6,7 @@ import warnings
 from typing import Union, TYPE_CHECKING
 
 from qdk.chemistry.geometry import (
+    ArrayGeometry,
     Geometry,
     format_geometry,
     format_geometry_from_mol
@@ -39,7 +40,7 @@ def num_electrons(mol: "Mol") -> int:
 
 def formatted_geometry_str(
     mol: "Mol",
-    geometry: Union[str, Geometry] = None,
+    geometry: Union[str, Geometry, ArrayGeometry] = None,
     line_sep: str = "\n"
 ) -> str:
     """Format geometry for input deck
@@ -47,7 +48,7 @@ def formatted_geometry_str(
     :param mol: Molecule object
     :type mol: Mol, optional
     :param geometry: Geometry object or string, defaults to None
-    :type geometry: Union[str, Geometry], optional
+    :type geometry: Union[str, Geometry, ArrayGeometry], optional
     :param line_sep: Line separator, defaults to "\n"
     :type line_sep: str
     :return: Formatted geometry string
@@ -59,7 +60,9 @@ def formatted_geometry_str(
         warnings.warn(
             "Ignoring mol and using specified geometry string instead.")
 
-        if isinstance(geometry, Geometry):
+        if isinstance(geometry, ArrayGeometry):
+            geometry = geometry.format(line_sep=line_sep)
+        elif isinstance(geometry, Geometry):
             geometry = format_geometry(geometry=geometry, line_sep=line_sep)
 
     return geometry
@@ -0,0 +1,194 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+##
+# Module for submitting Azure Quantum jobs of many Broombridge problems
+##
+import asyncio
+import gzip
+import json
+import logging
+import os
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, TYPE_CHECKING
+
+from qdk.chemistry._results import StageResult, format_error
+from qdk.chemistry.broombridge import JWEncodedData, load_and_encode
+
+if TYPE_CHECKING:
+    from azure.quantum.aio import Workspace
+    from azure.quantum.aio.job import Job
+
+_log = logging.getLogger(__name__)
+
+# Default number of jobs uploaded and submitted at the same time
+DEFAULT_MAX_CONCURRENT_UPLOADS = 8
+
+
+@dataclass
+class ChemistryJobResult(StageResult):
+    """Class for keeping track of the job submitted for a Broombridge file
+    and of the errors that occurred, by stage ("encode" or "submit")
+    """
+    index: int
+    file_name: str
+    name: str
+    job: Optional["Job"] = None
+    errors: Dict[str, str] = field(default_factory=dict)
+
+
+def encode_input_data(data: JWEncodedData) -> bytes:
+    """Serialize JWEncodedData to gzip-compressed JSON, the input data of
+    the submitted jobs
+
+    :param data: JWEncodedData-compatible tuple
+    :type data: JWEncodedData
+    :return: Compressed input data
+    :rtype: bytes
+    """
+    return gzip.compress(json.dumps(data, separators=(",", ":")).encode())
+
+
+def _encode_file(
+    file_name: str,
+    problem_description_index: int,
+    initial_state_label: Optional[str]
+) -> bytes:
+    """Load, encode and serialize a Broombridge file. Runs in a worker
+    process."""
+    return encode_input_data(load_and_encode(
+        file_name,
+        problem_description_index=problem_description_index,
+        initial_state_label=initial_state_label
+    ))
+
+
+async def submit_broombridge_jobs(
+    workspace: "Workspace",
+    file_names: Sequence[str],
+    target: str,
+    provider_id: str,
+    input_data_format: str,
+    output_data_format: str,
+    names: Optional[Sequence[str]] = None,
+    problem_description_index: int = 0,
+    initial_state_label: str = None,
+    input_params: Dict[str, Any] = None,
+    max_workers: Optional[int] = None,
+    max_concurrent_uploads: int = DEFAULT_MAX_CONCURRENT_UPLOADS,
+    executor: Optional[Executor] = None
+) -> List[ChemistryJobResult]:
+    """Encode a batch of Broombridge files and submit one job per file
+    through an async Azure Quantum workspace. Files are encoded in a process
+    pool, and every job is uploaded and submitted as soon as its file is
+    encoded, so that encoding of the next files overlaps with the uploads.
+    Failures are recorded in the result of the file and do not abort the
+    batch.
+
+    :param workspace: Async Azure Quantum workspace
+    :type workspace: azure.quantum.aio.Workspace
+    :param file_names: Broombridge file names
+    :type file_names: Sequence[str]
+    :param target: Azure Quantum target
+    :type target: str
+    :param provider_id: Provider ID
+    :type provider_id: str
+    :param input_data_format: Input data format
+    :type input_data_format: str
+    :param output_data_format: Output data format
+    :type output_data_format: str
+    :param names: Job names, defaults to the file names without extension
+    :type names: Sequence[str], optional
+    :param problem_description_index: Index of problem description to use,
+        defaults to 0
+    :type problem_description_index: int, optional
+    :param initial_state_label: Label of initial state to use, defaults to
+        first available label
+    :type initial_state_label: str, optional
+    :param input_params: Input parameters of the jobs, defaults to None
+    :type input_params: Dict[str, Any], optional
+    :param max_workers: Number of worker processes, defaults to the number
+        of CPUs. Ignored if executor is specified.
+    :type max_workers: int, optional
+    :param max_concurrent_uploads: Maximum number of jobs uploaded and
+        submitted at the same time, defaults to 8
+    :type max_concurrent_uploads: int, optional
+    :param executor: Executor to encode the files on instead of a new
+        process pool, defaults to None
+    :type executor: concurrent.futures.Executor, optional
+    :raises ValueError: If the number of names does not match the number of
+        files
+    :return: Results of the files, in the order of file_names
+    :rtype: List[ChemistryJobResult]
+    """
+    from azure.quantum.aio.job import Job
+
+    file_names = list(file_names)
+    if names is None:
+        names = [
+            os.path.splitext(os.path.basename(file_name))[0]
+            for file_name in file_names
+        ]
+    elif len(names) != len(file_names):
+        raise ValueError(
+            f"Number of names {len(names)} does not match number of \
+files {len(file_names)}"
+        )
+
+    loop = asyncio.get_running_loop()
+    uploads = asyncio.Semaphore(max_concurrent_uploads)
+
+    async def _submit(
+        pool: Executor,
+        index: int,
+        file_name: str,
+        name: str
+    ) -> ChemistryJobResult:
+        result = ChemistryJobResult(index=index, file_name=file_name, name=name)
+        try:
+            input_data = await loop.run_in_executor(
+                pool,
+                _encode_file,
+                file_name,
+                problem_description_index,
+                initial_state_label
+            )
+        except Exception as e:
+            result.errors["encode"] = format_error(e)
+            _log.warning(f"Failed to encode {file_name}: {e}")
+            return result
+
+        async with uploads:
+            try:
+                result.job = await Job.from_input_data(
+                    workspace=workspace,
+                    name=name,
+                    target=target,
+                    input_data=input_data,
+                    content_type="application/json",
+                    encoding="gzip",
+                    provider_id=provider_id,
+                    input_data_format=input_data_format,
+                    output_data_format=output_data_format,
+                    input_params=input_params
+                )
+            except Exception as e:
+                result.errors["submit"] = format_error(e)
+                _log.warning(f"Failed to submit job for {file_name}: {e}")
+                return result
+
+        _log.info(f"Submitted job {result.job.id} for {file_name}.")
+        return result
+
+    pool = executor if executor is not None \
+        else ProcessPoolExecutor(max_workers=max_workers)
+    try:
+        return list(await asyncio.gather(*(
+            _submit(pool, index, file_name, name)
+            for index, (file_name, name) in enumerate(zip(file_names, names))
+        )))
+    finally:
+        if executor is None:
+            pool.shutdown(wait=False, cancel_futures=True)
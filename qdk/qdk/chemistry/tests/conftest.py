@@ -1,10 +1,23 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
+import importlib.util
 import pytest
 import os
+import sys
+import types
 
 from rdkit.Chem import AllChem as Chem
 
+if importlib.util.find_spec("qsharp") is None:
+    # qsharp requires the IQ# kernel, stub the module so that the modules
+    # importing qsharp.chemistry can be tested
+    _chemistry = types.ModuleType("qsharp.chemistry")
+    for _name in ["load_broombridge", "load_input_state", "encode"]:
+        setattr(_chemistry, _name, None)
+    sys.modules["qsharp"] = types.ModuleType("qsharp")
+    sys.modules["qsharp"].chemistry = _chemistry
+    sys.modules["qsharp.chemistry"] = _chemistry
+
 from qdk.chemistry.geometry import Geometry, Element
 from qdk.chemistry.molecule import Molecule
 
@@ -0,0 +1,47 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+import os
+import pytest
+
+from qdk.chemistry import basis
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    basis.clear_cache()
+    yield
+    basis.clear_cache()
+
+
+def test_num_basis_functions():
+    assert basis.num_basis_functions("1s") == 1
+    assert basis.num_basis_functions("2s,1p") == 5
+    assert basis.num_basis_functions("6s,5p,3d,1f") == 43
+    assert basis.num_basis_functions("14s,11p,6d") == 77
+
+
+def test_get_shells():
+    shells = basis.get_shells("cc-pVDZ", [26, 1, 6, 1])
+    assert shells == {
+        1: ("2s,1p", "H"),
+        6: ("3s,2p,1d", "C"),
+        26: ("6s,5p,3d,1f", "Fe")
+    }
+    assert basis.num_orbitals({1: 4, 6: 1}, "cc-pVDZ") == 34
+
+
+def test_get_shells_cached(tmp_path, monkeypatch):
+    monkeypatch.setenv("QDKCHEM_BASIS_CACHE", str(tmp_path))
+    expected = basis.get_shells("STO-3G", [1, 8])
+    assert os.listdir(tmp_path) == ["sto-3g.json"]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Basis set fetched again")
+
+    monkeypatch.setattr(basis.bse, "get_basis", fail)
+    assert basis.get_shells("sto-3g", [8]) == {8: expected[8]}
+    # Loaded from disk
+    basis.clear_cache()
+    assert basis.get_shells("STO-3G", [1, 8]) == expected
+    with pytest.raises(AssertionError):
+        basis.get_shells("STO-3G", [6])
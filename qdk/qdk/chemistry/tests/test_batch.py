@@ -0,0 +1,75 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+import os
+import pytest
+
+from qdk.chemistry import create_inputs
+from qdk.chemistry.geometry import GeometryCache
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_create_inputs(tmp_path, max_workers):
+    results = create_inputs(
+        ["O", "C#C", "not a molecule"],
+        solvers={"NWChem": {"num_active_orbitals": 2}, "psi4": {}},
+        base_path=str(tmp_path),
+        names=["h2o", "acetylene", "invalid"],
+        seed=42,
+        max_workers=max_workers
+    )
+    assert [result.name for result in results] == \
+        ["h2o", "acetylene", "invalid"]
+
+    h2o, acetylene, invalid = results
+    for result in (h2o, acetylene):
+        assert result.succeeded
+        assert set(result.file_paths) == {"NWChem", "psi4"}
+        for path in result.file_paths.values():
+            assert os.path.isfile(path)
+    assert h2o.file_paths["NWChem"] == str(tmp_path / "h2o.nw")
+
+    assert not invalid.succeeded
+    assert list(invalid.errors) == ["smiles"]
+    assert sorted(os.listdir(tmp_path)) == [
+        "acetylene.in", "acetylene.nw", "h2o.in", "h2o.nw"
+    ]
+
+
+def test_create_inputs_solver_failure(tmp_path):
+    # NWChem requires num_active_orbitals
+    [result] = create_inputs(
+        ["O"],
+        solvers=["nwchem", "psi4"],
+        base_path=str(tmp_path),
+        max_workers=1
+    )
+    assert list(result.errors) == ["nwchem"]
+    assert "num_active_orbitals" in result.errors["nwchem"]
+    assert list(result.file_paths) == ["psi4"]
+
+
+def test_create_inputs_geometry_cache(tmp_path):
+    cache = GeometryCache(str(tmp_path / "cache"))
+    for _ in range(2):
+        [result] = create_inputs(
+            ["CCO"],
+            solvers="psi4",
+            base_path=str(tmp_path / "decks"),
+            seed=1,
+            max_workers=1,
+            geometry_cache=cache
+        )
+        assert result.succeeded
+    assert len(os.listdir(tmp_path / "cache")) == 1
+
+
+def test_create_inputs_invalid_arguments(tmp_path):
+    with pytest.raises(ValueError):
+        create_inputs(["O"], solvers="gaussian", base_path=str(tmp_path))
+    with pytest.raises(ValueError):
+        create_inputs(
+            ["O", "C"],
+            solvers="psi4",
+            names=["water"],
+            base_path=str(tmp_path)
+        )
@@ -0,0 +1,178 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+import pytest
+
+from types import SimpleNamespace
+
+from qdk.chemistry import broombridge
+from qdk.chemistry.broombridge import (
+    BROOMBRIDGE_CACHE_ENV_VAR,
+    BROOMBRIDGE_CACHE_SIZE_ENV_VAR,
+    JWEncodedArrays,
+    clear_cache,
+    load_and_encode,
+    load_and_encode_arrays,
+)
+
+# JWEncodedData with an empty term type (PQ) and input state terms of
+# different lengths
+JW_ENCODED_DATA = (
+    4,
+    [
+        [([0], [0.17]), ([1], [0.17]), ([2], [-0.22])],
+        [],
+        [([0, 1, 1, 2], [0.12]), ([0, 2, 2, 3], [0.16])],
+        [([0, 1, 2, 3], [0.0, -0.04, 0.04, 0.0])],
+    ],
+    (3, [((1.0, 0.0), [0, 1]), ((0.5, -0.1), [2])]),
+    -0.1
+)
+
+# JWEncodedData without terms
+EMPTY_JW_ENCODED_DATA = (0, [[], [], [], []], (0, []), 0.0)
+
+
+@pytest.fixture()
+def encode_calls(monkeypatch):
+    """Replaces the qsharp.chemistry functions used by broombridge, and
+    returns the list of the arguments of the calls to encode"""
+    calls = []
+
+    def load_fermion_hamiltonian():
+        return "hamiltonian"
+
+    problem = SimpleNamespace(
+        initial_state_suggestions=[{"Label": "|G>"}, {"Label": "|E1>"}],
+        load_fermion_hamiltonian=load_fermion_hamiltonian
+    )
+
+    def encode(hamiltonian, input_state):
+        calls.append((hamiltonian, input_state))
+        return JW_ENCODED_DATA
+
+    monkeypatch.setattr(
+        broombridge,
+        "load_broombridge",
+        lambda file_name: SimpleNamespace(problem_description=[problem])
+    )
+    monkeypatch.setattr(
+        broombridge,
+        "load_input_state",
+        lambda file_name, label: ("input state", label)
+    )
+    monkeypatch.setattr(broombridge, "encode", encode)
+    monkeypatch.delenv(BROOMBRIDGE_CACHE_ENV_VAR, raising=False)
+    monkeypatch.delenv(BROOMBRIDGE_CACHE_SIZE_ENV_VAR, raising=False)
+    clear_cache()
+    yield calls
+    clear_cache()
+
+
+@pytest.fixture()
+def broombridge_file(tmp_path):
+    path = tmp_path / "h2.yaml"
+    path.write_text("format:\n  version: '0.3'\n")
+    return str(path)
+
+
+@pytest.mark.parametrize("data", [JW_ENCODED_DATA, EMPTY_JW_ENCODED_DATA])
+def test_jw_encoded_arrays(data, tmp_path):
+    arrays = JWEncodedArrays.from_jw_encoded_data(data)
+    assert arrays.to_jw_encoded_data() == data
+
+    file_path = str(tmp_path / "cache" / "data.npz")
+    arrays.save(file_path)
+    loaded = JWEncodedArrays.load(file_path)
+    assert loaded.to_jw_encoded_data() == data
+    assert len(loaded.input_state_indices) == len(data[2][1])
+    # No temporary file is left behind
+    assert [path.name for path in (tmp_path / "cache").iterdir()] == \
+        ["data.npz"]
+
+
+def test_jw_encoded_arrays_ragged_coefficients():
+    # The coefficients of all the terms of a type have the same length
+    pq_terms = [([0, 1], [0.1]), ([1, 2], [0.1, 0.2])]
+    data = (3, [[], pq_terms, [], []], (0, []), 0.0)
+    with pytest.raises(ValueError):
+        JWEncodedArrays.from_jw_encoded_data(data)
+
+
+def test_load_and_encode(encode_calls, broombridge_file):
+    assert load_and_encode(broombridge_file) == JW_ENCODED_DATA
+    # The first initial state is used by default
+    assert encode_calls == [("hamiltonian", ("input state", "|G>"))]
+
+    assert load_and_encode(broombridge_file) == JW_ENCODED_DATA
+    assert len(encode_calls) == 1
+
+    load_and_encode(broombridge_file, initial_state_label="|E1>")
+    assert encode_calls[-1] == ("hamiltonian", ("input state", "|E1>"))
+    assert len(encode_calls) == 2
+
+
+def test_load_and_encode_file_cache(
+    encode_calls,
+    broombridge_file,
+    tmp_path,
+    monkeypatch
+):
+    cache_path = tmp_path / "cache"
+    monkeypatch.setenv(BROOMBRIDGE_CACHE_ENV_VAR, str(cache_path))
+    arrays = load_and_encode_arrays(broombridge_file)
+    assert len(list(cache_path.glob("*.npz"))) == 1
+
+    clear_cache()
+    cached = load_and_encode_arrays(broombridge_file)
+    assert cached is not arrays
+    assert cached.to_jw_encoded_data() == JW_ENCODED_DATA
+    assert len(encode_calls) == 1
+
+
+def test_load_and_encode_file_changed(
+    encode_calls,
+    broombridge_file,
+    tmp_path,
+    monkeypatch
+):
+    monkeypatch.setenv(BROOMBRIDGE_CACHE_ENV_VAR, str(tmp_path / "cache"))
+    load_and_encode(broombridge_file)
+    with open(broombridge_file, "a") as f:
+        f.write("bibliography: []\n")
+    load_and_encode(broombridge_file)
+    assert len(encode_calls) == 2
+
+
+def test_load_and_encode_cache_size(encode_calls, tmp_path, monkeypatch):
+    monkeypatch.setenv(BROOMBRIDGE_CACHE_SIZE_ENV_VAR, "2")
+    file_names = []
+    for i in range(3):
+        path = tmp_path / f"h2_{i}.yaml"
+        path.write_text(f"# {i}\n")
+        file_names.append(str(path))
+
+    for file_name in file_names[:2]:
+        load_and_encode(file_name)
+    # The least recently used encoding is dropped
+    load_and_encode(file_names[0])
+    load_and_encode(file_names[2])
+    assert len(broombridge._encoded) == 2
+    load_and_encode(file_names[0])
+    assert len(encode_calls) == 3
+    load_and_encode(file_names[1])
+    assert len(encode_calls) == 4
+
+def test_load_and_encode_arrays_read_only(encode_calls, broombridge_file):
+    arrays = load_and_encode_arrays(broombridge_file)
+    assert load_and_encode_arrays(broombridge_file) is arrays
+
+    indices, coeffs = arrays.hamiltonian_terms[0]
+    for array in [
+        indices,
+        coeffs,
+        arrays.input_state_amplitudes,
+        arrays.input_state_indices[0]
+    ]:
+        with pytest.raises(ValueError):
+            array[0] = 0
@@ -1,7 +1,19 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
+import numpy as np
 import pytest
-from qdk.chemistry.geometry import Element, Geometry
+from rdkit.Chem import AllChem as Chem
+from qdk.chemistry.geometry import (
+    ArrayGeometry,
+    Element,
+    Geometry,
+    XYZTrajectory,
+    format_geometry,
+    iter_xyz_frames,
+    read_xyz_frames,
+    write_xyz_frames
+)
+from qdk.chemistry.solvers.util import formatted_geometry_str
 
 
 def test_Element():
@@ -44,3 +56,98 @@ def test_geometry_to_from_xyz(geometry, xyz):
     assert geometry.to_xyz("water") == xyz
     gprime = Geometry.from_xyz(xyz)
     assert geometry == gprime
+
+
+def test_array_geometry(geometry, xyz):
+    array = ArrayGeometry.from_geometry(geometry)
+    assert array.positions.shape == (3, 3)
+    assert array.positions.dtype == np.float64
+    assert list(array.symbols) == ["O", "H", "H"]
+    assert array.to_xyz("water") == geometry.to_xyz("water") == xyz
+    assert array.format(" ; ") == format_geometry(geometry, " ; ")
+    assert array.to_geometry() == geometry
+    assert ArrayGeometry.from_xyz(xyz) == array
+
+
+def test_array_geometry_from_mol(h2o):
+    array = ArrayGeometry.from_mol(Chem.Mol(h2o), seed=42)
+    assert list(array.symbols) == ["O", "H", "H"]
+    assert array.charge == 0
+    assert array.to_geometry() == Geometry.from_mol(Chem.Mol(h2o), seed=42)
+
+
+def test_array_geometry_from_xyz():
+    xyz = "2\nhydrogen chloride\nH 0 0 0\nCl 0 0 1.27\n$set\nchrg -1\n$end"
+    array = ArrayGeometry.from_xyz(xyz)
+    assert list(array.symbols) == ["H", "Cl"]
+    assert array.positions[1, 2] == 1.27
+    assert array.charge == -1
+    assert ArrayGeometry.from_xyz(array.to_xyz()) == array
+
+    with pytest.raises(ValueError):
+        ArrayGeometry.from_xyz("3\ntruncated\nH 0 0 0\nH 0 0 1\n")
+    with pytest.raises(ValueError):
+        ArrayGeometry(["H", "H"], [[0, 0, 0]])
+
+
+def _frames(num_frames=5):
+    rng = np.random.default_rng(0)
+    return [
+        ArrayGeometry(["C", "O", "Cl"], rng.normal(size=(3, 3)), charge=i % 2)
+        for i in range(num_frames)
+    ]
+
+
+def test_xyz_trajectory(tmp_path):
+    frames = _frames()
+    file_path = str(tmp_path / "trajectory.xyz")
+    write_xyz_frames(file_path, iter(frames))
+
+    assert list(read_xyz_frames(file_path)) == frames
+    with open(file_path) as f:
+        assert list(iter_xyz_frames(f)) == frames
+
+    with XYZTrajectory(file_path) as trajectory:
+        assert len(trajectory) == len(frames)
+        assert trajectory[3] == frames[3]
+        assert trajectory[-1] == frames[-1]
+        assert trajectory[1:4] == frames[1:4]
+        assert list(trajectory) == frames
+
+
+def test_xyz_trajectory_empty_and_truncated(tmp_path):
+    file_path = tmp_path / "empty.xyz"
+    file_path.write_text("")
+    with XYZTrajectory(str(file_path)) as trajectory:
+        assert len(trajectory) == 0
+
+    file_path = tmp_path / "truncated.xyz"
+    file_path.write_text("2\nframe 0\nH 0.0 0.0 0.0\nH 0.0 0.0 0.74\n2\nframe 1\nH 0.0 0.0 0.0")
+    with pytest.raises(ValueError):
+        XYZTrajectory(str(file_path))
+    with pytest.raises(ValueError):
+        list(read_xyz_frames(str(file_path)))
+
+
+def test_xyz_trajectory_truncated_is_closed(tmp_path, monkeypatch):
+    closed = []
+    close = XYZTrajectory.close
+
+    def _close(trajectory):
+        close(trajectory)
+        closed.append(trajectory)
+
+    monkeypatch.setattr(XYZTrajectory, "close", _close)
+    file_path = tmp_path / "truncated.xyz"
+    file_path.write_text("3\nframe 0\nO 0.0 0.0 0.0\n")
+    with pytest.raises(ValueError, match="frame 0 is truncated"):
+        XYZTrajectory(str(file_path))
+    assert len(closed) == 1
+    assert closed[0]._file.closed
+    assert closed[0]._mmap.closed
+
+def test_formatted_geometry_str(geometry):
+    array = ArrayGeometry.from_geometry(geometry)
+    with pytest.warns(UserWarning):
+        assert formatted_geometry_str(None, array, "\n") == \
+            format_geometry(geometry)
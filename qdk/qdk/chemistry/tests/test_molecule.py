@@ -2,8 +2,10 @@
 # Licensed under the MIT License.
 
 import os
+import pytest
 import rdkit
 
+from qdk.chemistry.geometry import GeometryCache
 from qdk.chemistry.geometry.geometry import Geometry
 from qdk.chemistry.molecule import Molecule
 
@@ -40,3 +42,51 @@ def test_create_input(caffeine, tmp_path, h2o_molecule, h2o_nw):
     with open(h2o_nw, "r") as f:
         data_nw = f.read()
     assert data_gen == data_nw
+
+
+def test_geometry_is_memoized(monkeypatch):
+    h2o = Molecule.from_smiles("O", seed=42)
+    geometry = h2o.geometry
+    assert len(geometry) == 3
+    assert h2o.xyz() == geometry.to_xyz()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Conformer search ran again")
+
+    monkeypatch.setattr(Geometry, "from_mol", fail)
+    assert h2o.geometry is geometry
+    assert h2o.get_geometry(num_confs=10, seed=42) is geometry
+    with pytest.raises(AssertionError):
+        h2o.get_geometry(num_confs=5)
+
+
+def test_geometry_seed():
+    geometries = [
+        Molecule.from_smiles("CCO", num_confs=5, seed=7).geometry
+        for _ in range(2)
+    ]
+    assert geometries[0] == geometries[1]
+
+
+def test_geometry_seed_does_not_depend_on_previous_seeds():
+    ethanol = Molecule.from_smiles("CCO")
+    ethanol.get_geometry(num_confs=5, seed=42)
+    geometry = ethanol.get_geometry(num_confs=5, seed=7)
+    assert geometry == Molecule.from_smiles("CCO").get_geometry(
+        num_confs=5, seed=7
+    )
+
+def test_geometry_cache(tmp_path, monkeypatch):
+    cache = GeometryCache(str(tmp_path))
+    ethanol = Molecule.from_smiles("CCO", seed=1, geometry_cache=cache)
+    assert len(list(tmp_path.iterdir())) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Conformer search ran again")
+
+    monkeypatch.setattr(Geometry, "from_mol", fail)
+    monkeypatch.setenv("QDKCHEM_GEOMETRY_CACHE", str(tmp_path))
+    # Same molecule from a different SMILES string
+    cached = Molecule.from_smiles("OCC", seed=1)
+    assert cached.geometry == ethanol.geometry
+    assert cached.geometry.charge == ethanol.geometry.charge
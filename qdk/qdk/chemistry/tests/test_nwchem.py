@@ -1,11 +1,19 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
+import time
 from unittest import mock
 
 import pytest
 import ruamel.yaml as yaml
 
-from qdk.chemistry.solvers.nwchem import create_input_deck, parse_nwchem_output
+import numpy as np
+
+from qdk.chemistry.solvers.nwchem import (
+    NWChemOutputParser,
+    create_input_deck,
+    follow_nwchem_output,
+    parse_nwchem_output
+)
 
 
 @pytest.fixture()
@@ -90,3 +98,147 @@ def test_parse_nwchem_output(caffeine_nw, caffeine_output):
         'CCSD correlation energy': -0.002197738334726,
         'geometry snapshot': []
     }
+
+
+OPTIMIZATION_LOG = """
+          Geometry "geometry" -> ""
+          -------------------------
+  No.       Tag          Charge          X              Y              Z
+ ---- ---------------- ---------- -------------- -------------- --------------
+    1 O                    8.0000     0.00000000     0.00000000     0.22143053
+    2 H                    1.0000     0.00000000     1.43042809    -0.88572213
+    3 H                    1.0000     0.00000000    -1.43042809    -0.88572213
+
+      atoms           =     3
+  Number of AO functions :     7
+         Total SCF energy =    -74.962985614357
+
+                         SCF ENERGY GRADIENTS
+
+    atom               coordinates                        gradient
+                 x          y          z           x          y          z
+   1 O       0.000000   0.000000   0.221431    0.000000   0.000000  -0.011264
+   2 H       0.000000   1.430428  -0.885722    0.000000  -0.010528   0.005632
+   3 H       0.000000  -1.430428  -0.885722    0.000000   0.010528   0.005632
+
+         Total SCF energy =    -74.965900851175
+
+                         SCF ENERGY GRADIENTS
+
+    atom               coordinates                        gradient
+                 x          y          z           x          y          z
+   1 O       0.000000   0.000000   0.241300    0.000000   0.000000  -0.000512
+   2 H       0.000000   1.421700  -0.895657    0.000000  -0.000421   0.000256
+   3 H       0.000000  -1.421700  -0.895657    0.000000   0.000421   0.000256
+
+ Total times  cpu:        1.2s     wall:        1.5s
+"""
+
+
+@pytest.fixture()
+def optimization_files(tmp_path):
+    nw_path = tmp_path / "h2o.nw"
+    nw_path.write_text("start h2o\ntask scf optimize\n")
+    output_path = tmp_path / "h2o.output"
+    output_path.write_text(OPTIMIZATION_LOG)
+    return str(nw_path), str(output_path)
+
+
+def test_parse_nwchem_output_snapshots(optimization_files):
+    result = parse_nwchem_output(*optimization_files)
+    assert result["number of atoms"] == 3
+    assert result["number of orbitals"] == 7
+    assert result["SCF energy"] == -74.965900851175
+    assert result["CCSD correlation energy"] is None
+
+    snapshots = result["geometry snapshot"]
+    assert len(snapshots) == 2
+    assert snapshots[0].symbols.tolist() == ["O", "H", "H"]
+    assert np.allclose(snapshots[0].positions[0], [0.0, 0.0, 0.221431])
+    assert np.allclose(snapshots[1].positions[1], [0.0, 1.4217, -0.895657])
+
+    result = parse_nwchem_output(*optimization_files, max_snapshots=1)
+    assert len(result["geometry snapshot"]) == 1
+    assert np.allclose(
+        result["geometry snapshot"][0].positions, snapshots[1].positions
+    )
+
+
+def test_nwchem_output_parser_incremental():
+    parser = NWChemOutputParser(collect_snapshots=True)
+    lines = OPTIMIZATION_LOG.splitlines(keepends=True)
+    parser.feed_lines(lines[:20])
+    assert parser.scf_energy == -74.962985614357
+    assert not parser.finished
+    parser.feed_lines(lines[20:])
+    assert parser.scf_energy == -74.965900851175
+    assert parser.num_snapshots == 2
+    assert parser.finished
+
+
+def test_nwchem_output_parser_result_inside_table():
+    parser = NWChemOutputParser(collect_snapshots=True)
+    lines = OPTIMIZATION_LOG.splitlines(keepends=True)
+    # Stop in the middle of the first gradients table
+    parser.feed_lines(lines[:18])
+    assert parser.result()["geometry snapshot"] == []
+    parser.feed_lines(lines[18:])
+    snapshots = parser.result()["geometry snapshot"]
+    assert len(snapshots) == 2
+    assert np.allclose(snapshots[0].positions[2], [0.0, -1.430428, -0.885722])
+
+    # A table that ends the log is ended by close
+    parser = NWChemOutputParser(collect_snapshots=True)
+    parser.feed_lines(lines[:20])
+    assert parser.result()["geometry snapshot"] == []
+    parser.close()
+    assert len(parser.result()["geometry snapshot"]) == 1
+
+def test_follow_nwchem_output(optimization_files):
+    nw_path, output_path = optimization_files
+    lines = OPTIMIZATION_LOG.splitlines(keepends=True)
+    with open(output_path, "w") as f:
+        f.writelines(lines[:20])
+        # Partially written line
+        f.write(lines[20][:10])
+
+    results = follow_nwchem_output(nw_path, output_path, poll_interval=0.01)
+    result = next(results)
+    assert result["SCF energy"] == -74.962985614357
+    assert len(result["geometry snapshot"]) == 1
+
+    with open(output_path, "a") as f:
+        f.write(lines[20][10:])
+        f.writelines(lines[21:])
+    *_, result = results
+    assert result["SCF energy"] == -74.965900851175
+    assert len(result["geometry snapshot"]) == 2
+
+
+def test_follow_nwchem_output_timeout(caffeine_nw, tmp_path):
+    output_path = tmp_path / "running.output"
+    output_path.write_text("      atoms           =    24\n")
+    start = time.monotonic()
+    results = list(follow_nwchem_output(
+        caffeine_nw, str(output_path), poll_interval=0.01, timeout=0.1
+    ))
+    assert time.monotonic() - start < 5
+    # The last result is yielded again when the timeout expires
+    assert [result["number of atoms"] for result in results] == [24, 24]
+
+
+def test_follow_nwchem_output_timeout_inside_table(optimization_files):
+    nw_path, output_path = optimization_files
+    lines = OPTIMIZATION_LOG.splitlines(keepends=True)
+    with open(output_path, "w") as f:
+        # The log stops in the second gradients table, in the middle of a
+        # line
+        f.writelines(lines[:29])
+        f.write(lines[29].rstrip("\n"))
+
+    *_, result = follow_nwchem_output(
+        nw_path, output_path, poll_interval=0.01, timeout=0.1
+    )
+    snapshots = result["geometry snapshot"]
+    assert len(snapshots) == 2
+    assert np.allclose(snapshots[1].positions[2], [0.0, -1.4217, -0.895657])
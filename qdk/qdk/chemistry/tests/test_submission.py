@@ -0,0 +1,118 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+import asyncio
+import gzip
+import json
+import pytest
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from qdk.chemistry import submission
+from qdk.chemistry.submission import encode_input_data, submit_broombridge_jobs
+
+# azure-quantum is only required to submit jobs
+Job = pytest.importorskip("azure.quantum.aio.job").Job
+
+
+@pytest.fixture()
+def executor():
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        yield pool
+
+
+@pytest.fixture()
+def submitted(monkeypatch):
+    """Replaces encoding and Job.from_input_data, and returns the keyword
+    arguments of the submitted jobs along with the highest number of jobs
+    submitted at the same time"""
+    jobs = []
+    uploads = SimpleNamespace(active=0, max_active=0)
+
+    def encode_file(file_name, problem_description_index, initial_state_label):
+        if file_name.startswith("invalid"):
+            raise ValueError(f"Invalid file {file_name}")
+        # Encode the first files last
+        time.sleep(0.01 / (1 + int(file_name.split(".")[0][-1])))
+        return encode_input_data((file_name, problem_description_index))
+
+    async def from_input_data(**kwargs):
+        uploads.active += 1
+        uploads.max_active = max(uploads.max_active, uploads.active)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            uploads.active -= 1
+        if kwargs["name"].startswith("rejected"):
+            raise RuntimeError("Job rejected")
+        jobs.append(kwargs)
+        return SimpleNamespace(id=f"id-{kwargs['name']}", **kwargs)
+
+    monkeypatch.setattr(submission, "_encode_file", encode_file)
+    monkeypatch.setattr(Job, "from_input_data", from_input_data)
+    return SimpleNamespace(jobs=jobs, uploads=uploads)
+
+
+def _submit(file_names, executor, **kwargs):
+    return asyncio.run(submit_broombridge_jobs(
+        workspace="workspace",
+        file_names=file_names,
+        target="microsoft.estimator",
+        provider_id="microsoft",
+        input_data_format="broombridge",
+        output_data_format="results",
+        executor=executor,
+        **kwargs
+    ))
+
+
+def test_submit_broombridge_jobs(submitted, executor):
+    file_names = [f"h2_{i}.yaml" for i in range(5)]
+    results = _submit(file_names, executor, problem_description_index=1)
+    assert [result.index for result in results] == list(range(5))
+    assert [result.file_name for result in results] == file_names
+    assert [result.name for result in results] == [
+        f"h2_{i}" for i in range(5)
+    ]
+    assert all(result.succeeded for result in results)
+    assert [result.job.id for result in results] == [
+        f"id-h2_{i}" for i in range(5)
+    ]
+
+    job = results[0].job
+    assert json.loads(gzip.decompress(job.input_data)) == ["h2_0.yaml", 1]
+    assert job.workspace == "workspace"
+    assert job.encoding == "gzip"
+    # The executor is not shut down
+    assert executor.submit(int, "1").result() == 1
+
+
+def test_submit_broombridge_jobs_failures(submitted, executor):
+    file_names = ["h2_0.yaml", "invalid_1.yaml", "rejected_2.yaml"]
+    results = _submit(file_names, executor)
+    assert results[0].succeeded
+    assert list(results[1].errors) == ["encode"]
+    assert "Invalid file invalid_1.yaml" in results[1].errors["encode"]
+    assert results[1].job is None
+    assert list(results[2].errors) == ["submit"]
+    assert "Job rejected" in results[2].errors["submit"]
+    assert results[2].job is None
+    assert [job["name"] for job in submitted.jobs] == ["h2_0"]
+
+
+def test_submit_broombridge_jobs_max_concurrent_uploads(submitted, executor):
+    file_names = [f"h2_{i}.yaml" for i in range(8)]
+    results = _submit(file_names, executor, max_concurrent_uploads=2)
+    assert all(result.succeeded for result in results)
+    assert submitted.uploads.max_active == 2
+
+
+def test_submit_broombridge_jobs_names(submitted, executor):
+    results = _submit(["h2_0.yaml"], executor, names=["h2"])
+    assert results[0].job.name == "h2"
+
+    with pytest.raises(ValueError):
+        _submit(["h2_0.yaml", "h2_1.yaml"], executor, names=["h2"])
+    assert len(submitted.jobs) == 1